@@ -23,6 +23,7 @@ import src.datamodel.database.domain.Purchase
 # import src.datamodel.database.UserLog
 from src.core.database.dbs.postgresql.connect import engine
 from src.core.database.dbs.mongodb.connect import init_db, check_db_connection
+from src.services.events.domain_events import domain_events
 import asyncio
 import asyncpg
 
@@ -65,6 +66,11 @@ async def lifespan(app: FastAPI):
         await check_db_connection()
         await init_db()
         yield
+        # Let queued map change subscribers finish before the process exits
+        try:
+            await asyncio.wait_for(domain_events.drain(), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning(f"Shutdown before map change subscribers caught up; {domain_events.pending()} queued event(s) dropped")
     except Exception as err:
         logger.error(f"Lifespan setup error: {err}")
         raise
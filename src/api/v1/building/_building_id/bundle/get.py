@@ -0,0 +1,80 @@
+from fastapi import HTTPException, Header, Path, Query, Request, Response, status
+from typing import Optional
+import gzip
+import logging
+from src.datamodel.database.domain.DigitalSignage import Building
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.bundle.bundle_cache import map_bundle_cache, bundle_etag, etag_matches
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Building"],
+        "summary": "Get Building Map Bundle",
+        "response_model": dict,
+        "description": "The complete map of a building in one response: every floor with its locations, vertical connectors and single-floor paths, plus the paths that cross floors. The bundle is versioned and served with an ETag; send it back in If-None-Match to get 304 Not Modified until the building changes.",
+        "response_description": "Building map tree grouped by floor",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main(
+    request: Request,
+    building_id: str = Path(..., description="Building ID to load the map bundle for"),
+    published_only: bool = Query(False, description="Only include published locations, connectors and paths"),
+    if_none_match: Optional[str] = Header(None, description="ETag of the bundle the client already has")
+):
+    try:
+        # Checked before the ETag so a deleted or unknown building never gets 304
+        building = await Building.get_motor_collection().find_one(
+            {"building_id": building_id, "status": "active"}, {"_id": 1}
+        )
+        if not building:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Building with ID '{building_id}' not found"
+            )
+
+        version = await map_bundle_cache.current_version(building_id)
+        etag = bundle_etag(building_id, version, published_only)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+            "X-Map-Version": str(version),
+        }
+
+        # Unchanged since the client's copy: no bundle load, no body
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        bundle = await map_bundle_cache.get_bundle(building_id, published_only, version)
+
+        if bundle is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Building with ID '{building_id}' not found"
+            )
+
+        if "gzip" in request.headers.get("accept-encoding", "").lower():
+            return Response(
+                content=bundle.body,
+                media_type="application/json",
+                headers={**headers, "Content-Encoding": "gzip"}
+            )
+        return Response(content=gzip.decompress(bundle.body), media_type="application/json", headers=headers)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error retrieving map bundle for building {building_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve building map bundle: {str(e)}"
+        )
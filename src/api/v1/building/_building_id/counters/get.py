@@ -0,0 +1,94 @@
+from fastapi import HTTPException, Path, status
+from pydantic import BaseModel, Field
+from typing import Dict, List
+import logging
+from src.datamodel.database.domain.DigitalSignage import Building, Floor, MapCounters
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.statistics.counters import map_counters
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Building"],
+        "summary": "Get Building Counters",
+        "response_model": dict,
+        "description": "Location, connector, path, category and status counts for a building and each of its floors, read from the maintained counters.",
+        "response_description": "Building and per-floor counters",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+class CountersResponse(BaseModel):
+    scope_id: str
+    locations: int
+    vertical_connectors: int
+    paths: int
+    categories: Dict[str, int] = Field(default_factory=dict)
+    statuses: Dict[str, int] = Field(default_factory=dict)
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class BuildingCountersResponse(BaseModel):
+    building: CountersResponse
+    floors: List[CountersResponse]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+def _to_response(counters: MapCounters) -> CountersResponse:
+    return CountersResponse(
+        scope_id=counters.scope_id,
+        locations=counters.locations,
+        vertical_connectors=counters.vertical_connectors,
+        paths=counters.paths,
+        categories=counters.categories,
+        statuses=counters.statuses
+    )
+
+
+async def main(
+    building_id: str = Path(..., description="Building ID to get counters for")
+):
+    try:
+        building = await Building.find_one({
+            "building_id": building_id
+        })
+
+        if not building:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Building with ID '{building_id}' not found"
+            )
+
+        floors = await Floor.find({"building_id": building_id, "status": "active"}).sort("floor_number").to_list()
+        building_counters = await map_counters.get_building_counters(building_id)
+        floor_counters = await map_counters.get_floor_counters([floor.floor_id for floor in floors])
+
+        response = BuildingCountersResponse(
+            building=_to_response(building_counters),
+            floors=[_to_response(floor_counters[floor.floor_id]) for floor in floors if floor.floor_id in floor_counters]
+        )
+
+        return {
+            "status": "success",
+            "message": f"Counters retrieved for building '{building.name}'",
+            "data": response
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error retrieving counters for building {building_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve building counters: {str(e)}"
+        )
@@ -1,10 +1,9 @@
 from fastapi import HTTPException, Path, Query, status
 from pydantic import BaseModel
 from typing import Optional
-import time
 import logging
-from src.datamodel.database.domain.DigitalSignage import Building, Floor, Location
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.cascade.cascade_delete import cascade_delete
 
 
 logger = logging.getLogger(__name__)
@@ -29,79 +28,34 @@ class DeleteResponse(BaseModel):
     delete_type: str
     affected_floors: int
     affected_locations: int
+    affected_connectors: int = 0
+    affected_paths: int = 0
     message: str
 
 
 async def main(
     building_id: str = Path(..., description="Building ID to delete"),
     hard_delete: Optional[bool] = Query(False, description="Perform hard delete (true) or soft delete (false)"),
-    cascade: Optional[bool] = Query(True, description="Also delete associated floors and locations")
+    cascade: Optional[bool] = Query(True, description="Also delete associated floors, locations, connectors and paths"),
+    transactional: Optional[bool] = Query(False, description="Apply the whole cascade in one transaction (requires a replica set)")
 ):
     try:
-        # Find building by ID
-        building = await Building.find_one({
-            "building_id": building_id
-        })
-        
-        if not building:
+        plan = await cascade_delete.delete(
+            building_ids=[building_id],
+            cascade=cascade,
+            hard_delete=hard_delete,
+            use_transaction=transactional,
+        )
+
+        if building_id not in plan.buildings:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Building with ID '{building_id}' not found"
             )
 
-        affected_floors = 0
-        affected_locations = 0
-
-        # Handle cascade deletion of floors and locations
-        if cascade and building.floors:
-            # Get all floors in this building
-            floors = await Floor.find({
-                "building_id": building_id,
-                "status": "active"
-            }).to_list()
-            
-            affected_floors = len(floors)
-            
-            for floor in floors:
-                # Handle locations in each floor
-                if floor.locations:
-                    locations = await Location.find({
-                        "location_id": {"$in": floor.locations},
-                        "status": "active"
-                    }).to_list()
-                    
-                    affected_locations += len(locations)
-                    
-                    # Delete or soft delete locations
-                    for location in locations:
-                        if hard_delete:
-                            await location.delete()
-                        else:
-                            location.status = "deleted"
-                            location.updated_by = None  # Set to current user if available
-                            location.update_on = time.time()
-                            await location.save()
-                
-                # Delete or soft delete floor
-                if hard_delete:
-                    await floor.delete()
-                else:
-                    floor.status = "deleted"
-                    floor.updated_by = None  # Set to current user if available
-                    floor.update_on = time.time()
-                    await floor.save()
-
-        # Delete or soft delete building
-        if hard_delete:
-            await building.delete()
-            delete_type = "hard"
-        else:
-            building.status = "deleted"
-            building.updated_by = None  # Set to current user if available
-            building.update_on = time.time()
-            await building.save()
-            delete_type = "soft"
-
+        delete_type = plan.delete_type
+        affected_floors = len(plan.floors)
+        affected_locations = len(plan.locations)
         logger.info(f"Building {delete_type} deleted: {building_id}, affected floors: {affected_floors}, affected locations: {affected_locations}")
 
         response = DeleteResponse(
@@ -109,6 +63,8 @@ async def main(
             delete_type=delete_type,
             affected_floors=affected_floors,
             affected_locations=affected_locations,
+            affected_connectors=len(plan.connectors),
+            affected_paths=len(plan.paths),
             message=f"Building {delete_type} deleted successfully"
         )
 
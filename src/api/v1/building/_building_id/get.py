@@ -4,6 +4,7 @@ from typing import Optional, List
 import logging
 from src.datamodel.database.domain.DigitalSignage import Building, Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.statistics.counters import map_counters
 
 
 logger = logging.getLogger(__name__)
@@ -78,6 +79,7 @@ async def main(
             
             # Sort floors by floor_number
             floors.sort(key=lambda x: x.floor_number)
+            counters = await map_counters.get_floor_counters([floor.floor_id for floor in floors])
             
             for floor in floors:
                 floor_detail = FloorDetailResponse(
@@ -85,7 +87,7 @@ async def main(
                     name=floor.name,
                     floor_number=floor.floor_number,
                     floor_plan_url=floor.floor_plan_url,
-                    locations_count=len(floor.locations) if floor.locations else 0,
+                    locations_count=counters[floor.floor_id].locations if floor.floor_id in counters else 0,
                     description=floor.description,
                     datetime=floor.datetime,
                     status=floor.status
@@ -6,6 +6,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.datamodel.database.domain.DigitalSignage import Building
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
 from src.core.middleware.token_validate_middleware import validate_token
 from src.core.database.dbs.getdb import postresql as db
 
@@ -57,16 +58,13 @@ async def main(
     request: Request,
     building_id: str,
     building_data: BuildingUpdateRequest,
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db)
 ):
     """Main handler for building updates"""
     # Validate token and get user info
-    validate_token_start = time.time()
-    validate_token(request)
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     try:
         # Find the existing building
@@ -124,6 +122,7 @@ async def main(
         # Refresh the building data
         updated_building = await Building.find_one({"building_id": building_id})
         
+        await mapStateModify("building", building_id, building_id=building_id)
         logger.info(f"Building updated successfully: {building_id}")
 
         # Prepare response
@@ -1,10 +1,9 @@
 from fastapi import HTTPException, Query, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
-import time
 import logging
-from src.datamodel.database.domain.DigitalSignage import Building, Floor, Location
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.cascade.cascade_delete import cascade_delete
 
 
 logger = logging.getLogger(__name__)
@@ -34,13 +33,16 @@ class BulkDeleteResponse(BaseModel):
     delete_type: str
     total_affected_floors: int
     total_affected_locations: int
+    total_affected_connectors: int = 0
+    total_affected_paths: int = 0
     message: str
 
 
 async def main(
     delete_data: BulkDeleteRequest,
     hard_delete: Optional[bool] = Query(False, description="Perform hard delete (true) or soft delete (false)"),
-    cascade: Optional[bool] = Query(True, description="Also delete associated floors and locations")
+    cascade: Optional[bool] = Query(True, description="Also delete associated floors, locations, connectors and paths"),
+    transactional: Optional[bool] = Query(False, description="Apply the whole cascade in one transaction (requires a replica set)")
 ):
     try:
         if not delete_data.building_ids:
@@ -49,81 +51,20 @@ async def main(
                 detail="No building IDs provided for deletion"
             )
 
-        deleted_buildings = []
-        failed_deletions = []
-        total_affected_floors = 0
-        total_affected_locations = 0
-
-        for building_id in delete_data.building_ids:
-            try:
-                # Find building by ID
-                building = await Building.find_one({
-                    "building_id": building_id
-                })
-                
-                if not building:
-                    failed_deletions.append(building_id)
-                    logger.warning(f"Building not found: {building_id}")
-                    continue
-
-                affected_floors = 0
-                affected_locations = 0
-
-                # Handle cascade deletion
-                if cascade and building.floors:
-                    floors = await Floor.find({
-                        "building_id": building_id,
-                        "status": "active"
-                    }).to_list()
-                    
-                    affected_floors = len(floors)
-                    
-                    for floor in floors:
-                        if floor.locations:
-                            locations = await Location.find({
-                                "location_id": {"$in": floor.locations},
-                                "status": "active"
-                            }).to_list()
-                            
-                            affected_locations += len(locations)
-                            
-                            # Delete locations
-                            for location in locations:
-                                if hard_delete:
-                                    await location.delete()
-                                else:
-                                    location.status = "deleted"
-                                    location.updated_by = None  # Set to current user if available
-                                    location.update_on = time.time()
-                                    await location.save()
-                        
-                        # Delete floor
-                        if hard_delete:
-                            await floor.delete()
-                        else:
-                            floor.status = "deleted"
-                            floor.updated_by = None  # Set to current user if available
-                            floor.update_on = time.time()
-                            await floor.save()
-
-                # Delete building
-                if hard_delete:
-                    await building.delete()
-                else:
-                    building.status = "deleted"
-                    building.updated_by = None  # Set to current user if available
-                    building.update_on = time.time()
-                    await building.save()
-
-                deleted_buildings.append(building_id)
-                total_affected_floors += affected_floors
-                total_affected_locations += affected_locations
-
-                logger.info(f"Successfully deleted building: {building_id}")
-
-            except Exception as e:
-                logger.error(f"Failed to delete building {building_id}: {str(e)}")
-                failed_deletions.append(building_id)
+        # All buildings and everything under them are resolved and written as sets
+        plan = await cascade_delete.delete(
+            building_ids=delete_data.building_ids,
+            cascade=cascade,
+            hard_delete=hard_delete,
+            use_transaction=transactional,
+        )
+
+        deleted_buildings = [building_id for building_id in delete_data.building_ids if building_id in plan.buildings]
+        failed_deletions = plan.missing
+        for building_id in failed_deletions:
+            logger.warning(f"Building not found: {building_id}")
+        total_affected_floors = len(plan.floors)
+        total_affected_locations = len(plan.locations)
 
         delete_type = "hard" if hard_delete else "soft"
         
@@ -135,6 +76,8 @@ async def main(
             delete_type=delete_type,
             total_affected_floors=total_affected_floors,
             total_affected_locations=total_affected_locations,
+            total_affected_connectors=len(plan.connectors),
+            total_affected_paths=len(plan.paths),
             message=f"Bulk {delete_type} delete completed. Deleted: {len(deleted_buildings)}, Failed: {len(failed_deletions)}"
         )
 
@@ -2,12 +2,12 @@ from fastapi import HTTPException, Query, status, Depends, Request
 from pydantic import BaseModel, Field
 from typing import Optional, List
 import logging
+import re
 from src.datamodel.database.domain.DigitalSignage import Building
 from src.datamodel.datavalidation.apiconfig import ApiConfig
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.middleware.token_validate_middleware import validate_token
 from src.core.database.dbs.getdb import postresql as db
-import time
 
 
 logger = logging.getLogger(__name__)
@@ -49,17 +49,14 @@ async def main(
     name: Optional[str] = Query(None, description="Filter by building name (partial match)"),
     limit: Optional[int] = Query(None, description="Limit number of results"),
     skip: Optional[int] = Query(0, description="Skip number of results for pagination"),
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db)
 ):
     
     """Main handler for content uploads"""
     # Validate token and get user info
-    validate_token_start = time.time()
-    validate_token(request)
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     try:
         # Build query filter
@@ -69,7 +66,7 @@ async def main(
             query_filter["status"] = status_filter
         
         if name:
-            query_filter["name"] = {"$regex": name, "$options": "i"}  # Case-insensitive partial match
+            query_filter["name"] = {"$regex": re.escape(name), "$options": "i"}  # Case-insensitive partial match
 
         # Execute query
         query = Building.find(query_filter)
@@ -225,17 +225,14 @@ class BuildingResponse(BaseModel):
 async def main(
     request: Request,    
     building_data: BuildingCreateRequest,
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db)
 ):
     
     """Main handler for content uploads"""
     # Validate token and get user info
-    validate_token_start = time.time()
-    validate_token(request)
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     try:
         # Check if building with same name exists
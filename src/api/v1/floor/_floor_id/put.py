@@ -5,6 +5,7 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import Floor, Building, Location
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
 from src.core.middleware.token_validate_middleware import validate_token
 from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -82,6 +83,7 @@ async def main(
     request: Request,
     floor_data: FloorUpdateRequest,
     floor_id: str = Path(..., description="Floor ID to update"),
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db)
 ):
     
@@ -89,13 +91,9 @@ async def main(
     Update an existing floor with new data. All fields are required.
     """
     # Get entity_uuid from request
-    validate_token_start = time.time()
-    validate_token(request)
     # await verify_permissions(request, "content", "write")
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid 
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     try:
         # Find existing floor
@@ -211,6 +209,9 @@ async def main(
         # Save to database
         await existing_floor.save()
         
+        await mapStateModify("floor", floor_id, floor_ids=[floor_id], building_id=new_building_id)
+        if old_building_id and old_building_id != new_building_id:
+            await mapStateModify("floor", floor_id, floor_ids=[floor_id], building_id=old_building_id)
         logger.info(f"Floor updated successfully: {floor_id}")
 
         # Prepare response
@@ -4,9 +4,9 @@ from typing import Optional, List
 import logging
 from src.datamodel.database.domain.DigitalSignage import Building, Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.statistics.counters import map_counters
 from src.core.middleware.token_validate_middleware import validate_token
 from src.core.database.dbs.getdb import postresql as db
-import time
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -62,19 +62,15 @@ async def main(
     include_locations_count: Optional[bool] = Query(True, description="Include count of locations on each floor"),
     limit: Optional[int] = Query(None, description="Limit number of results"),
     skip: Optional[int] = Query(0, description="Skip number of results for pagination"),
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db)
 ):
     
         # Get entity_uuid from request
-    validate_token_start = time.time()
-    
-    validate_token(request)
     # await verify_permissions(request, "content", "read")
 
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
 
 
@@ -107,12 +103,15 @@ async def main(
             
         floors = await query.to_list()
         
+        # Location counts come from the maintained floor counters
+        counters = {}
+        if include_locations_count:
+            counters = await map_counters.get_floor_counters([floor.floor_id for floor in floors])
+
         # Prepare response
         floor_list = []
         for floor in floors:
-            locations_count = 0
-            if include_locations_count and floor.locations:
-                locations_count = len(floor.locations)
+            locations_count = counters[floor.floor_id].locations if floor.floor_id in counters else 0
             
             floor_response = FloorResponse(
                 floor_id=floor.floor_id,
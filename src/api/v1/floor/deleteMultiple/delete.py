@@ -1,10 +1,9 @@
 from fastapi import HTTPException, Query, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
-import time
 import logging
-from src.datamodel.database.domain.DigitalSignage import Floor, Location, Building
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.cascade.cascade_delete import cascade_delete
 
 
 logger = logging.getLogger(__name__)
@@ -33,6 +32,8 @@ class BulkDeleteResponse(BaseModel):
     failed_deletions: List[str]
     delete_type: str
     total_affected_locations: int
+    total_affected_connectors: int = 0
+    total_affected_paths: int = 0
     buildings_updated: List[str]
     message: str
 
@@ -40,7 +41,8 @@ class BulkDeleteResponse(BaseModel):
 async def main(
     delete_data: BulkDeleteRequest,
     hard_delete: Optional[bool] = Query(False, description="Perform hard delete (true) or soft delete (false)"),
-    cascade: Optional[bool] = Query(True, description="Also delete associated locations")
+    cascade: Optional[bool] = Query(True, description="Also delete associated locations, connectors and paths"),
+    transactional: Optional[bool] = Query(False, description="Apply the whole cascade in one transaction (requires a replica set)")
 ):
     try:
         if not delete_data.floor_ids:
@@ -49,76 +51,20 @@ async def main(
                 detail="No floor IDs provided for deletion"
             )
 
-        deleted_floors = []
-        failed_deletions = []
-        total_affected_locations = 0
-        buildings_updated = []
-
-        for floor_id in delete_data.floor_ids:
-            try:
-                # Find floor by ID
-                floor = await Floor.find_one({
-                    "floor_id": floor_id
-                })
-                
-                if not floor:
-                    failed_deletions.append(floor_id)
-                    logger.warning(f"Floor not found: {floor_id}")
-                    continue
-
-                affected_locations = 0
-
-                # Handle cascade deletion of locations
-                if cascade and floor.locations:
-                    locations = await Location.find({
-                        "location_id": {"$in": floor.locations},
-                        "status": "active"
-                    }).to_list()
-                    
-                    affected_locations = len(locations)
-                    
-                    # Delete locations
-                    for location in locations:
-                        if hard_delete:
-                            await location.delete()
-                        else:
-                            location.status = "deleted"
-                            location.updated_by = None  # Set to current user if available
-                            location.update_on = time.time()
-                            await location.save()
-
-                # Update building's floors list if floor is being hard deleted
-                if hard_delete and floor.building_id:
-                    building = await Building.find_one({
-                        "building_id": floor.building_id
-                    })
-                    
-                    if building and floor.floor_id in building.floors:
-                        building.floors.remove(floor.floor_id)
-                        building.updated_by = None  # Set to current user if available
-                        building.update_on = time.time()
-                        await building.save()
-                        
-                        if floor.building_id not in buildings_updated:
-                            buildings_updated.append(floor.building_id)
-
-                # Delete floor
-                if hard_delete:
-                    await floor.delete()
-                else:
-                    floor.status = "deleted"
-                    floor.updated_by = None  # Set to current user if available
-                    floor.update_on = time.time()
-                    await floor.save()
-
-                deleted_floors.append(floor_id)
-                total_affected_locations += affected_locations
-
-                logger.info(f"Successfully deleted floor: {floor_id}")
-
-            except Exception as e:
-                logger.error(f"Failed to delete floor {floor_id}: {str(e)}")
-                failed_deletions.append(floor_id)
+        # All floors and everything on them are resolved and written as sets
+        plan = await cascade_delete.delete(
+            floor_ids=delete_data.floor_ids,
+            cascade=cascade,
+            hard_delete=hard_delete,
+            use_transaction=transactional,
+        )
+
+        deleted_floors = [floor_id for floor_id in delete_data.floor_ids if floor_id in plan.floors]
+        failed_deletions = plan.missing
+        for floor_id in failed_deletions:
+            logger.warning(f"Floor not found: {floor_id}")
+        total_affected_locations = len(plan.locations)
+        buildings_updated = sorted(plan.buildings_updated)
 
         delete_type = "hard" if hard_delete else "soft"
         
@@ -129,6 +75,8 @@ async def main(
             failed_deletions=failed_deletions,
             delete_type=delete_type,
             total_affected_locations=total_affected_locations,
+            total_affected_connectors=len(plan.connectors),
+            total_affected_paths=len(plan.paths),
             buildings_updated=buildings_updated,
             message=f"Bulk {delete_type} delete completed. Deleted: {len(deleted_floors)}, Failed: {len(failed_deletions)}"
         )
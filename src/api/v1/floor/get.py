@@ -2,11 +2,11 @@ from fastapi import HTTPException, Query, status, Depends, Request
 from pydantic import BaseModel, Field
 from typing import Optional, List
 import logging
+import re
 from src.datamodel.database.domain.DigitalSignage import Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
 from src.core.middleware.token_validate_middleware import validate_token
 from src.core.database.dbs.getdb import postresql as db
-import time
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -50,20 +50,16 @@ async def main(
     name: Optional[str] = Query(None, description="Filter by floor name (partial match)"),
     limit: Optional[int] = Query(None, description="Limit number of results"),
     skip: Optional[int] = Query(0, description="Skip number of results for pagination"),
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db)
 ):
     
 
     # Get entity_uuid from request
-    validate_token_start = time.time()
-    
-    validate_token(request)
     # await verify_permissions(request, "content", "read")
 
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
 
     try:
@@ -77,7 +73,7 @@ async def main(
             query_filter["status"] = status_filter
         
         if name:
-            query_filter["name"] = {"$regex": name, "$options": "i"}  # Case-insensitive partial match
+            query_filter["name"] = {"$regex": re.escape(name), "$options": "i"}  # Case-insensitive partial match
 
         # Execute query
         query = Floor.find(query_filter).sort("floor_number")  # Sort by floor number
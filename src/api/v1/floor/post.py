@@ -5,6 +5,7 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import Floor, Building
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
 # from src.services.files.minio_service import minio_service
 from src.services.files.backblaze import b2_service
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -66,17 +67,13 @@ async def main(
     description: Optional[str] = Form(None, description="Description of the floor"),
     is_published: bool = Form(True, description="Whether floor is published"),
     floor_plan: Optional[UploadFile] = File(None, description="Floor plan image file (PNG, JPG, JPEG, GIF)"),
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db),
 ):
     # Get entity_uuid from request
-    validate_token_start = time.time()
-    
-    validate_token(request)
     
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     """
     Create a new floor with optional floor plan image upload
@@ -198,6 +195,7 @@ async def main(
             building.update_on = time.time()
             await building.save()
         
+        await mapStateModify("floor", new_floor.floor_id, floor_ids=[new_floor.floor_id], building_id=new_floor.building_id)
         logger.info(f"Floor created successfully: {new_floor.floor_id}")
 
         # Prepare response
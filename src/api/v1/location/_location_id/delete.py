@@ -1,10 +1,9 @@
 from fastapi import HTTPException, Path, Query, status
 from pydantic import BaseModel
 from typing import Optional
-import time
 import logging
-from src.datamodel.database.domain.DigitalSignage import Location, Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.cascade.cascade_delete import cascade_delete
 
 
 logger = logging.getLogger(__name__)
@@ -17,7 +16,7 @@ def api_config():
         "tags": ["Location"],
         "summary": "Delete Location",
         "response_model": dict,
-        "description": "Delete a location by ID. Can perform soft delete (default) or hard delete. Updates associated floor when hard deleting.",
+        "description": "Delete a location by ID. Can perform soft delete (default) or hard delete. Updates associated floor when hard deleting and deactivates paths that start or end at the location.",
         "response_description": "Deletion confirmation",
         "deprecated": False,
     }
@@ -29,6 +28,7 @@ class DeleteResponse(BaseModel):
     delete_type: str
     floor_updated: bool
     floor_id: Optional[str] = None
+    affected_paths: int = 0
     message: str
 
 
@@ -37,57 +37,25 @@ async def main(
     hard_delete: Optional[bool] = Query(False, description="Perform hard delete (true) or soft delete (false)")
 ):
     try:
-        # Find location by ID
-        location = await Location.find_one({
-            "location_id": location_id
-        })
-        
+        plan = await cascade_delete.delete(location_ids=[location_id], hard_delete=hard_delete)
+
+        location = plan.locations.get(location_id)
         if not location:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Location with ID '{location_id}' not found"
             )
 
-        floor_updated = False
-        floor_id = location.floor_id
-
-        # Update floor's locations list if location is being hard deleted
-        if hard_delete and floor_id:
-            # Find floor that contains this location
-            floor = await Floor.find_one({
-                "floor_id": floor_id,
-                "locations": location_id,
-                "status": "active"
-            })
-            
-            if floor:
-                # Remove location from floor's locations list
-                if location_id in floor.locations:
-                    floor.locations.remove(location_id)
-                    floor.updated_by = None  # Set to current user if available
-                    floor.update_on = time.time()
-                    await floor.save()
-                    floor_updated = True
-                    logger.info(f"Removed location {location_id} from floor {floor_id}")
-
-        # Delete or soft delete location
-        if hard_delete:
-            await location.delete()
-            delete_type = "hard"
-            logger.info(f"Location hard deleted: {location_id} from floor: {floor_id}")
-        else:
-            location.status = "deleted"
-            location.updated_by = None  # Set to current user if available
-            location.update_on = time.time()
-            await location.save()
-            delete_type = "soft"
-            logger.info(f"Location soft deleted: {location_id} from floor: {floor_id}")
+        delete_type = plan.delete_type
+        floor_id = location.get("floor_id")
+        logger.info(f"Location {delete_type} deleted: {location_id} from floor: {floor_id}, affected paths: {len(plan.paths)}")
 
         response = DeleteResponse(
             deleted_id=location_id,
             delete_type=delete_type,
-            floor_updated=floor_updated,
+            floor_updated=floor_id in plan.floors_updated,
             floor_id=floor_id,
+            affected_paths=len(plan.paths),
             message=f"Location {delete_type} deleted successfully"
         )
 
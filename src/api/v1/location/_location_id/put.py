@@ -5,6 +5,8 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import Location, Floor, ShapeType
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify, publishMapChange, LocationMoved
+from src.services.statistics.counters import map_counters, location_key
 
 
 logger = logging.getLogger(__name__)
@@ -105,6 +107,7 @@ async def main(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Location with ID '{location_id}' not found"
             )
+        counted_before = location_key(existing_location)
 
         # Store original floor_id for potential floor updates
         original_floor_id = existing_location.floor_id
@@ -196,6 +199,16 @@ async def main(
         # Save to database
         await existing_location.save()
         
+        await map_counters.location_changed(counted_before, location_key(existing_location))
+        if floor_changed:
+            await publishMapChange(LocationMoved(
+                entity_id=location_id,
+                floor_ids=[original_floor_id, existing_location.floor_id],
+                from_floor_id=original_floor_id,
+                to_floor_id=existing_location.floor_id,
+            ))
+        else:
+            await mapStateModify("location", location_id, floor_ids=[existing_location.floor_id])
         logger.info(f"Location updated successfully: {location_id}, floor_changed: {floor_changed}")
 
         # Prepare response
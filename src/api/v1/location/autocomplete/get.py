@@ -0,0 +1,51 @@
+from fastapi import HTTPException, Query, status
+from typing import Optional
+import logging
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.search.location_search import location_search
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Location"],
+        "summary": "Autocomplete Locations",
+        "response_model": dict,
+        "description": "Prefix suggestions over location names and category labels for on-screen keyboards, ranked by popularity.",
+        "response_description": "Top suggestions for the typed prefix",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main(
+    q: str = Query(..., description="Typed prefix, matched against the start of any word"),
+    building_id: Optional[str] = Query(None, description="Restrict suggestions to a building"),
+    floor_id: Optional[str] = Query(None, description="Restrict location suggestions to a floor"),
+    k: int = Query(10, ge=1, le=50, description="Maximum number of suggestions")
+):
+    try:
+        suggestions = await location_search.autocomplete(q, building_id=building_id, floor_id=floor_id, k=k)
+
+        # Plain dicts keep per-keystroke responses cheap
+        return {
+            "status": "success",
+            "message": f"Found {len(suggestions)} suggestions",
+            "data": {
+                "query": q,
+                "suggestions": [s._asdict() for s in suggestions]
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error building autocomplete for '{q}': {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to autocomplete locations: {str(e)}"
+        )
@@ -1,6 +1,7 @@
 from fastapi import HTTPException, Query, Path, status
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from collections import defaultdict
 import logging
 from src.datamodel.database.domain.DigitalSignage import Location, Floor, Building, LocationType, ShapeType
 from src.datamodel.datavalidation.apiconfig import ApiConfig
@@ -124,17 +125,19 @@ async def main(
         floors_with_locations = []
         total_locations = 0
 
-        # Get locations for each floor
+        # Locations for every floor in one query, grouped by floor in memory
+        locations = await Location.find({
+            **location_filter,
+            "floor_id": {"$in": [floor.floor_id for floor in floors]}
+        }).to_list()
+        locations_by_floor = defaultdict(list)
+        for location in locations:
+            locations_by_floor[location.floor_id].append(location)
+
         for floor in floors:
-            # Add floor_id to location filter
-            floor_location_filter = {**location_filter, "floor_id": floor.floor_id}
-            
-            # Get locations for this floor
-            locations = await Location.find(floor_location_filter).to_list()
-            
             # Convert locations to response format
             location_items = []
-            for location in locations:
+            for location in locations_by_floor.get(floor.floor_id, []):
                 location_item = LocationItem(
                     location_id=location.location_id,
                     name=location.name,
@@ -1,10 +1,9 @@
 from fastapi import HTTPException, Query, status
 from pydantic import BaseModel, Field
 from typing import List, Optional
-import time
 import logging
-from src.datamodel.database.domain.DigitalSignage import Location
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.cascade.cascade_delete import cascade_delete
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +39,7 @@ class BulkDeleteResponse(BaseModel):
     failed_deletions: List[str]
     delete_type: str
     floors_affected: List[str]
+    affected_paths: int = 0
     message: str
 
 
@@ -54,49 +54,21 @@ async def main(
                 detail="No location IDs provided for deletion"
             )
 
-        deleted_locations = []
-        failed_deletions = []
-        floors_affected = set()
-
-        for location_id in delete_data.location_ids:
-            try:
-                # Find location by ID
-                location = await Location.find_one({
-                    "location_id": location_id
-                })
-                
-                if not location:
-                    failed_deletions.append(location_id)
-                    logger.warning(f"Location not found: {location_id}")
-                    continue
-
-                # Track affected floors
-                if location.floor_id:
-                    floors_affected.add(location.floor_id)
-
-                # Delete location
-                if hard_delete:
-                    await location.delete()
-                else:
-                    location.status = "deleted"
-                    location.updated_by = None  # Set to current user if available
-                    location.update_on = time.time()
-                    await location.save()
-
-                # Add to successful deletions with detailed info
-                deleted_location_info = LocationDeleteInfo(
-                    location_id=location.location_id,
-                    name=location.name,
-                    floor_id=location.floor_id,
-                    category=location.category
-                )
-                deleted_locations.append(deleted_location_info)
-                
-                logger.info(f"Successfully {'hard' if hard_delete else 'soft'} deleted location: {location_id} on floor: {location.floor_id}")
-
-            except Exception as e:
-                logger.error(f"Failed to delete location {location_id}: {str(e)}")
-                failed_deletions.append(location_id)
+        plan = await cascade_delete.delete(location_ids=delete_data.location_ids, hard_delete=hard_delete)
+
+        deleted_locations = [
+            LocationDeleteInfo(
+                location_id=location["location_id"],
+                name=location.get("name"),
+                floor_id=location.get("floor_id"),
+                category=location.get("category")
+            )
+            for location in plan.locations.values()
+        ]
+        failed_deletions = plan.missing
+        for location_id in failed_deletions:
+            logger.warning(f"Location not found: {location_id}")
+        floors_affected = {location.floor_id for location in deleted_locations if location.floor_id}
 
         delete_type = "hard" if hard_delete else "soft"
         
@@ -107,6 +79,7 @@ async def main(
             failed_deletions=failed_deletions,
             delete_type=delete_type,
             floors_affected=list(floors_affected),
+            affected_paths=len(plan.paths),
             message=f"Bulk {delete_type} delete completed. Deleted: {len(deleted_locations)}, Failed: {len(failed_deletions)}, Floors affected: {len(floors_affected)}"
         )
 
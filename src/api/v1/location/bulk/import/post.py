@@ -0,0 +1,377 @@
+from fastapi import HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, validator
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from collections import defaultdict
+from tempfile import SpooledTemporaryFile
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import asyncio
+import codecs
+import csv
+import json
+import time
+import logging
+from src.datamodel.database.domain.DigitalSignage import Location, Floor, ShapeType, LocationType
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, location_key
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Location"],
+        "summary": "Bulk Import Locations",
+        "description": "Import locations from a CSV (header row required) or NDJSON request body. Rows are validated and inserted in batches; the response is an NDJSON report with one line per failed row and a final summary line.",
+        "response_description": "NDJSON import report",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+# Rows are validated and inserted this many at a time; memory use does not grow with the file
+IMPORT_BATCH_SIZE = 500
+
+# Report lines are kept in memory up to this size, then spill to disk
+REPORT_SPOOL_BYTES = 1024 * 1024
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+
+
+class LocationImportRow(BaseModel):
+    name: str = Field(..., description="Name of the location")
+    category: LocationType = Field(..., description="Category of the location")
+    floor_id: str = Field(..., description="ID of the floor this location belongs to")
+    shape: ShapeType = Field(..., description="Shape type - circle or rectangle")
+    x: float = Field(..., description="X coordinate position")
+    y: float = Field(..., description="Y coordinate position")
+    width: Optional[float] = Field(None, description="Width for rectangle shape")
+    height: Optional[float] = Field(None, description="Height for rectangle shape")
+    radius: Optional[float] = Field(None, description="Radius for circle shape")
+    logo_url: Optional[str] = Field(None, alias="logoUrl", description="URL for location logo/icon")
+    color: str = Field(default="#3b82f6", description="Color for location display")
+    text_color: str = Field(default="#000000", description="Text color for location")
+    is_published: bool = Field(default=True, description="Whether location is published")
+    description: Optional[str] = Field(None, description="Description of the location")
+
+    @validator('width', 'height', always=True)
+    def validate_rectangle_dimensions(cls, v, values):
+        if values.get('shape') == ShapeType.RECTANGLE and not v:
+            raise ValueError('Width and height are required for rectangle shape')
+        return v
+
+    @validator('radius', always=True)
+    def validate_circle_radius(cls, v, values):
+        if values.get('shape') == ShapeType.CIRCLE and not v:
+            raise ValueError('Radius is required for circle shape')
+        return v
+
+    @validator('color', 'text_color')
+    def validate_color_format(cls, v):
+        if v and not v.startswith('#'):
+            raise ValueError('Color must be in hex format (e.g., #3b82f6)')
+        if v and len(v) != 7:
+            raise ValueError('Color must be 7 characters long including # (e.g., #3b82f6)')
+        return v
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+async def iter_lines(request: Request) -> AsyncIterator[str]:
+    """Decode the request body into lines as chunks arrive"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    header: Optional[List[str]] = None
+    record, start_line, line_number = [], 0, 0
+    async for line in lines:
+        line_number += 1
+        if not record:
+            start_line = line_number
+        record.append(line)
+        # An odd number of quotes means a quoted field continues on the next line
+        if sum(part.count('"') for part in record) % 2:
+            continue
+        text, record = "\n".join(record), []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [column.strip() for column in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        # Empty cells mean "not provided" so model defaults apply
+        yield start_line, {column: value.strip() for column, value in zip(header, values) if value.strip() != ""}
+    if record:
+        yield start_line, ValueError("Unterminated quoted field")
+
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+            continue
+        yield line_number, row if isinstance(row, dict) else ValueError("Each line must be a JSON object")
+
+
+def row_errors(error: Exception) -> List[str]:
+    if isinstance(error, ValidationError):
+        return [f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()]
+    return [str(error)]
+
+
+class LocationImporter:
+    """
+    Validates parsed rows and inserts them batch by batch. Only the current batch and the
+    floors seen so far are held in memory; failed rows are written to the report as they occur.
+    """
+
+    def __init__(self, report, created_by: Optional[str]):
+        self.report = report
+        self.created_by = created_by
+        self.batch: List[Tuple[int, LocationImportRow]] = []
+        self.active_floors: Dict[str, bool] = {}
+        self.floors_affected = set()
+        self.total_rows = 0
+        self.inserted = 0
+        self.failed = 0
+
+    def write(self, line: Dict[str, Any]) -> None:
+        self.report.write((json.dumps(line) + "\n").encode("utf-8"))
+
+    def fail(self, row: int, errors: List[str], name: Optional[str] = None) -> None:
+        self.failed += 1
+        self.write({"type": "error", "row": row, "name": name, "errors": errors})
+
+    async def add(self, row_number: int, row: Any) -> None:
+        self.total_rows += 1
+        if isinstance(row, Exception):
+            self.fail(row_number, row_errors(row))
+            return
+        try:
+            self.batch.append((row_number, LocationImportRow(**row)))
+        except ValidationError as ve:
+            self.fail(row_number, row_errors(ve), row.get("name"))
+            return
+        if len(self.batch) >= IMPORT_BATCH_SIZE:
+            await self.flush()
+
+    async def _check_floors(self, floor_ids: List[str]) -> None:
+        unknown = [fid for fid in floor_ids if fid not in self.active_floors]
+        if not unknown:
+            return
+        found = await Floor.find({"floor_id": {"$in": unknown}, "status": "active"}).to_list()
+        found_ids = {floor.floor_id for floor in found}
+        for fid in unknown:
+            self.active_floors[fid] = fid in found_ids
+
+    async def _taken_names(self, floor_id: str, names: List[str]) -> set:
+        holders = await Location.find({
+            "floor_id": floor_id,
+            "name": {"$in": names},
+            "status": "active"
+        }).to_list()
+        return {holder.name for holder in holders}
+
+    async def flush(self) -> None:
+        batch, self.batch = self.batch, []
+        if not batch:
+            return
+
+        await self._check_floors(list({row.floor_id for _, row in batch}))
+
+        # Names already used earlier in this batch, then names already stored (which includes earlier batches)
+        names_by_floor: Dict[str, Dict[str, int]] = defaultdict(dict)
+        accepted: List[Tuple[int, LocationImportRow]] = []
+        for row_number, row in batch:
+            if not self.active_floors[row.floor_id]:
+                self.fail(row_number, [f"Floor with ID '{row.floor_id}' not found"], row.name)
+                continue
+            if row.name in names_by_floor[row.floor_id]:
+                self.fail(row_number, [f"Location with name '{row.name}' appears more than once on this floor"], row.name)
+                continue
+            names_by_floor[row.floor_id][row.name] = row_number
+            accepted.append((row_number, row))
+
+        floor_ids = list(names_by_floor)
+        taken = await asyncio.gather(*(self._taken_names(fid, list(names_by_floor[fid])) for fid in floor_ids))
+        taken_by_floor = dict(zip(floor_ids, taken))
+
+        now = time.time()
+        documents: List[Tuple[int, Location]] = []
+        for row_number, row in accepted:
+            if row.name in taken_by_floor[row.floor_id]:
+                self.fail(row_number, [f"Location with name '{row.name}' already exists on this floor"], row.name)
+                continue
+            documents.append((row_number, Location(
+                **row.dict(),
+                created_by=self.created_by,
+                datetime=now,
+                status="active"
+            )))
+
+        if not documents:
+            return
+
+        failed_positions = set()
+        try:
+            await Location.insert_many([doc for _, doc in documents], ordered=False)
+        except BulkWriteError as bwe:
+            for error in bwe.details.get("writeErrors", []):
+                failed_positions.add(error["index"])
+                row_number, doc = documents[error["index"]]
+                self.fail(row_number, [error.get("errmsg", "Write failed")], doc.name)
+
+        inserted = [(row_number, doc) for position, (row_number, doc) in enumerate(documents) if position not in failed_positions]
+        linked = await self._link_to_floors(inserted, now)
+        if not linked:
+            return
+
+        self.floors_affected.update(doc.floor_id for doc in linked)
+        self.inserted += len(linked)
+        await map_counters.locations_changed((None, location_key(doc)) for doc in linked)
+        self.write({"type": "batch", "inserted": len(linked), "total_inserted": self.inserted})
+
+    async def _link_to_floors(self, inserted: List[Tuple[int, Location]], now: float) -> List[Location]:
+        """
+        Add the batch's locations to their floors with one $addToSet/$each per floor. Locations whose
+        floor could not be updated are removed again and reported, so none is left unlinked.
+        """
+        if not inserted:
+            return []
+        by_floor: Dict[str, List[Tuple[int, Location]]] = defaultdict(list)
+        for row_number, doc in inserted:
+            by_floor[doc.floor_id].append((row_number, doc))
+        floor_ids = list(by_floor)
+
+        failed_floors: Dict[str, str] = {}
+        try:
+            await Floor.get_motor_collection().bulk_write([
+                UpdateOne(
+                    {"floor_id": floor_id},
+                    {"$addToSet": {"locations": {"$each": [doc.location_id for _, doc in by_floor[floor_id]]}}, "$set": {"update_on": now}}
+                )
+                for floor_id in floor_ids
+            ], ordered=False)
+        except BulkWriteError as bwe:
+            for error in bwe.details.get("writeErrors", []):
+                failed_floors[floor_ids[error["index"]]] = error.get("errmsg", "Write failed")
+        except Exception as e:
+            failed_floors = {floor_id: str(e) for floor_id in floor_ids}
+
+        if failed_floors:
+            unlinked = [doc.location_id for floor_id in failed_floors for _, doc in by_floor[floor_id]]
+            logger.error(f"Could not link {len(unlinked)} imported location(s) to floors {list(failed_floors)}; removing them")
+            await Location.get_motor_collection().delete_many({"location_id": {"$in": unlinked}})
+            for floor_id, message in failed_floors.items():
+                for row_number, doc in by_floor[floor_id]:
+                    self.fail(row_number, [f"Could not add location to floor '{floor_id}': {message}"], doc.name)
+
+        return [doc for floor_id in floor_ids if floor_id not in failed_floors for _, doc in by_floor[floor_id]]
+
+
+async def stream_report(report) -> AsyncIterator[bytes]:
+    try:
+        report.seek(0)
+        for line in report:
+            yield line
+    finally:
+        report.close()
+
+
+async def main(
+    request: Request,
+    input_format: Optional[str] = Query(None, alias="format", description="Body format, csv or ndjson; defaults from the Content-Type header"),
+    created_by: Optional[str] = Query(None, description="User performing the import"),
+):
+    report = SpooledTemporaryFile(max_size=REPORT_SPOOL_BYTES)
+    importer: Optional[LocationImporter] = None
+    body_format = None
+    try:
+        if input_format not in (None, "csv", "ndjson"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="format must be 'csv' or 'ndjson'"
+            )
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        body_format = input_format or ("csv" if content_type in CSV_CONTENT_TYPES else "ndjson")
+        rows = iter_csv_rows(iter_lines(request)) if body_format == "csv" else iter_ndjson_rows(iter_lines(request))
+
+        start = time.time()
+        importer = LocationImporter(report, created_by)
+        async for row_number, row in rows:
+            await importer.add(row_number, row)
+        await importer.flush()
+
+        if importer.total_rows == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No location rows found in the request body"
+            )
+
+        importer.write({
+            "type": "summary",
+            "status": "completed",
+            "format": body_format,
+            "total_rows": importer.total_rows,
+            "inserted": importer.inserted,
+            "failed": importer.failed,
+        })
+        logger.info(f"Location import completed in {time.time() - start:.4f} seconds: {importer.inserted} inserted, {importer.failed} failed")
+
+        return StreamingResponse(stream_report(report), media_type="application/x-ndjson")
+
+    except HTTPException:
+        report.close()
+        raise
+    except Exception as e:
+        logger.exception(f"Error importing locations: {str(e)}")
+        if importer is None:
+            report.close()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to import locations: {str(e)}"
+            )
+        # Earlier batches are committed; report what was inserted before the failure
+        importer.write({
+            "type": "summary",
+            "status": "failed",
+            "format": body_format,
+            "error": f"Failed to import locations: {str(e)}",
+            "total_rows": importer.total_rows,
+            "inserted": importer.inserted,
+            "failed": importer.failed,
+        })
+        return StreamingResponse(
+            stream_report(report),
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            media_type="application/x-ndjson"
+        )
+    finally:
+        # Committed batches reach the search index, graph, bundle and change log even if a later one failed
+        if importer is not None and importer.floors_affected:
+            await mapStateModify("location", floor_ids=list(importer.floors_affected))
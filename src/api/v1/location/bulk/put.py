@@ -1,10 +1,16 @@
 from fastapi import HTTPException, Depends, status
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
+from collections import defaultdict
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import asyncio
 import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import Location, ShapeType, LocationType
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, location_key
 
 
 logger = logging.getLogger(__name__)
@@ -17,7 +23,7 @@ def api_config():
         "tags": ["Location"],
         "summary": "Bulk Update Locations",
         "response_model": dict,
-        "description": "Update multiple location tags at once including size, shape, color and position.",
+        "description": "Update multiple location tags at once including size, shape, color and position. Large requests are processed in chunks, each written with a single bulk write.",
         "response_description": "Bulk update results with success and failure details",
         "deprecated": False,
     }
@@ -60,8 +66,6 @@ class BulkLocationUpdateRequest(BaseModel):
     def validate_locations_not_empty(cls, v):
         if not v:
             raise ValueError('At least one location must be provided for update')
-        if len(v) > 100:  # Reasonable limit for bulk operations
-            raise ValueError('Maximum 100 locations can be updated at once')
         return v
 
 
@@ -97,152 +101,185 @@ async def validate_shape_requirements(location_data: LocationUpdateData, existin
             raise ValueError("Radius is required for circle shape")
 
 
-async def update_single_location(location_data: LocationUpdateData, updated_by: Optional[str]) -> LocationUpdateResult:
-    """Update a single location and return the result"""
-    try:
-        # Find the existing location
-        existing_location = await Location.find_one({
-            "location_id": location_data.location_id,
+# Updates are validated and written this many at a time to bound memory on large re-imports
+BULK_CHUNK_SIZE = 500
+
+# Request field -> stored field, in the order they are reported in updated_fields
+UPDATABLE_FIELDS = [
+    "name", "category", "shape", "x", "y", "width", "height", "radius",
+    "logo_url", "color", "text_color", "is_published", "description",
+]
+
+
+def build_update_data(location_data: LocationUpdateData, updated_by: Optional[str]) -> Dict[str, Any]:
+    """Collect the provided fields into a $set document"""
+    update_data = {}
+    for field in UPDATABLE_FIELDS:
+        value = getattr(location_data, field)
+        if value is not None:
+            update_data[field] = value.value if hasattr(value, "value") else value
+
+    # Add update metadata
+    update_data["updated_by"] = updated_by
+    update_data["update_on"] = time.time()
+    return update_data
+
+
+async def find_name_conflicts(floor_id: str, names: List[str]) -> Dict[str, str]:
+    """Active locations on a floor holding any of the given names, as name -> location_id"""
+    holders = await Location.find({
+        "floor_id": floor_id,
+        "name": {"$in": names},
+        "status": "active"
+    }).to_list()
+    return {holder.name: holder.location_id for holder in holders}
+
+
+def find_duplicate_ids(locations: List[LocationUpdateData]) -> Set[int]:
+    """Positions of items whose location_id already appeared earlier in the request"""
+    seen_ids: Set[str] = set()
+    duplicates: Set[int] = set()
+    for index, item in enumerate(locations):
+        if item.location_id in seen_ids:
+            duplicates.add(index)
+        seen_ids.add(item.location_id)
+    return duplicates
+
+
+async def update_locations_chunk(
+    chunk: List[LocationUpdateData], updated_by: Optional[str], duplicates: Set[int]
+) -> Tuple[List[LocationUpdateResult], List[Tuple[Any, Any]], Set[str]]:
+    """
+    Validate and write one chunk; returns per-item results, counter changes and touched floors.
+    `duplicates` are the chunk positions whose location_id appeared earlier in the request.
+    """
+    results: Dict[int, LocationUpdateResult] = {}
+
+    def fail(index: int, message: str) -> None:
+        results[index] = LocationUpdateResult(
+            location_id=chunk[index].location_id,
+            status="failed",
+            message=message
+        )
+
+    # One $in prefetch for the whole chunk
+    existing = {
+        location.location_id: location
+        for location in await Location.find({
+            "location_id": {"$in": list({item.location_id for item in chunk})},
             "status": "active"
-        })
-        
+        }).to_list()
+    }
+
+    renames: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for index, item in enumerate(chunk):
+        existing_location = existing.get(item.location_id)
+        if index in duplicates:
+            fail(index, f"Location with ID '{item.location_id}' appears more than once in this request")
+            continue
         if not existing_location:
-            return LocationUpdateResult(
-                location_id=location_data.location_id,
-                status="failed",
-                message=f"Location with ID '{location_data.location_id}' not found"
-            )
-        
-        # Validate shape requirements
-        await validate_shape_requirements(location_data, existing_location)
-        
-        # Check for name conflicts if name is being updated
-        if location_data.name and location_data.name != existing_location.name:
-            name_conflict = await Location.find_one({
-                "name": location_data.name,
-                "floor_id": existing_location.floor_id,
-                "status": "active",
-                "location_id": {"$ne": location_data.location_id}
-            })
-            
-            if name_conflict:
-                return LocationUpdateResult(
-                    location_id=location_data.location_id,
-                    status="failed",
-                    message=f"Location with name '{location_data.name}' already exists on this floor"
-                )
-        
-        # Track updated fields
-        updated_fields = []
-        
-        # Update fields that are provided
-        update_data = {}
-        
-        if location_data.name is not None:
-            update_data["name"] = location_data.name
-            updated_fields.append("name")
-        
-        if location_data.category is not None:
-            update_data["category"] = location_data.category
-            updated_fields.append("category")
-        
-        if location_data.shape is not None:
-            update_data["shape"] = location_data.shape
-            updated_fields.append("shape")
-        
-        if location_data.x is not None:
-            update_data["x"] = location_data.x
-            updated_fields.append("x")
-        
-        if location_data.y is not None:
-            update_data["y"] = location_data.y
-            updated_fields.append("y")
-        
-        if location_data.width is not None:
-            update_data["width"] = location_data.width
-            updated_fields.append("width")
-        
-        if location_data.height is not None:
-            update_data["height"] = location_data.height
-            updated_fields.append("height")
-        
-        if location_data.radius is not None:
-            update_data["radius"] = location_data.radius
-            updated_fields.append("radius")
-        
-        if location_data.logo_url is not None:
-            update_data["logo_url"] = location_data.logo_url
-            updated_fields.append("logo_url")
-        
-        if location_data.color is not None:
-            update_data["color"] = location_data.color
-            updated_fields.append("color")
-        
-        if location_data.text_color is not None:
-            update_data["text_color"] = location_data.text_color
-            updated_fields.append("text_color")
-        
-        if location_data.is_published is not None:
-            update_data["is_published"] = location_data.is_published
-            updated_fields.append("is_published")
-        
-        if location_data.description is not None:
-            update_data["description"] = location_data.description
-            updated_fields.append("description")
-        
-        # Add update metadata
-        update_data["updated_by"] = updated_by
-        update_data["update_on"] = time.time()
-        updated_fields.extend(["updated_by", "update_on"])
-        
-        # Perform the update
-        await existing_location.update({"$set": update_data})
-        
-        return LocationUpdateResult(
-            location_id=location_data.location_id,
+            fail(index, f"Location with ID '{item.location_id}' not found")
+            continue
+        try:
+            await validate_shape_requirements(item, existing_location)
+        except ValueError as ve:
+            fail(index, str(ve))
+            continue
+
+        if item.name and item.name != existing_location.name:
+            floor_renames = renames[existing_location.floor_id]
+            if item.name in floor_renames:
+                fail(index, f"Location with name '{item.name}' is requested twice on this floor")
+                continue
+            floor_renames[item.name] = index
+
+    # One name-conflict query per floor, run concurrently
+    floor_ids = list(renames)
+    conflicts = await asyncio.gather(*(find_name_conflicts(fid, list(renames[fid])) for fid in floor_ids))
+    for floor_id, holders in zip(floor_ids, conflicts):
+        for name, holder_id in holders.items():
+            index = renames[floor_id][name]
+            if holder_id != chunk[index].location_id:
+                fail(index, f"Location with name '{name}' already exists on this floor")
+
+    operations = []
+    pending: List[Tuple[int, Dict[str, Any]]] = []
+    for index, item in enumerate(chunk):
+        if index in results:
+            continue
+        update_data = build_update_data(item, updated_by)
+        operations.append(UpdateOne({"location_id": item.location_id, "status": "active"}, {"$set": update_data}))
+        pending.append((index, update_data))
+
+    write_errors: Dict[int, str] = {}
+    if operations:
+        try:
+            await Location.get_motor_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as bwe:
+            for error in bwe.details.get("writeErrors", []):
+                write_errors[error["index"]] = error.get("errmsg", "Write failed")
+
+    counter_changes = []
+    floors_affected: Set[str] = set()
+    for position, (index, update_data) in enumerate(pending):
+        item = chunk[index]
+        if position in write_errors:
+            fail(index, f"Internal error: {write_errors[position]}")
+            continue
+        existing_location = existing[item.location_id]
+        before = location_key(existing_location)
+        counter_changes.append((before, (before[0], update_data.get("category", before[1]), before[2])))
+        floors_affected.add(existing_location.floor_id)
+        results[index] = LocationUpdateResult(
+            location_id=item.location_id,
             status="success",
             message="Location updated successfully",
-            updated_fields=updated_fields
-        )
-        
-    except ValueError as ve:
-        return LocationUpdateResult(
-            location_id=location_data.location_id,
-            status="failed",
-            message=str(ve)
-        )
-    except Exception as e:
-        logger.exception(f"Error updating location {location_data.location_id}: {str(e)}")
-        return LocationUpdateResult(
-            location_id=location_data.location_id,
-            status="failed",
-            message=f"Internal error: {str(e)}"
+            updated_fields=list(update_data)
         )
 
+    return [results[index] for index in range(len(chunk))], counter_changes, floors_affected
+
 
 async def main(
     bulk_update_data: BulkLocationUpdateRequest,
 ):
     try:
-        logger.info(f"Starting bulk update for {len(bulk_update_data.locations)} locations")
+        locations = bulk_update_data.locations
+        logger.info(f"Starting bulk update for {len(locations)} locations")
         
         results = []
-        successful_updates = 0
-        failed_updates = 0
-        
-        # Process each location update
-        for location_data in bulk_update_data.locations:
-            result = await update_single_location(location_data, bulk_update_data.updated_by)
-            results.append(result)
-            
-            if result.status == "success":
-                successful_updates += 1
-            else:
-                failed_updates += 1
+        counter_changes = []
+        floors_affected: Set[str] = set()
+
+        # Repeated IDs are found across the whole request, so chunking cannot update one twice
+        duplicates = find_duplicate_ids(locations)
+
+        # Process the request chunk by chunk; each chunk is a single unordered bulk_write
+        for offset in range(0, len(locations), BULK_CHUNK_SIZE):
+            chunk_results, chunk_changes, chunk_floors = await update_locations_chunk(
+                locations[offset:offset + BULK_CHUNK_SIZE],
+                bulk_update_data.updated_by,
+                {index - offset for index in duplicates if offset <= index < offset + BULK_CHUNK_SIZE}
+            )
+            results.extend(chunk_results)
+            counter_changes.extend(chunk_changes)
+            floors_affected.update(chunk_floors)
+
+        successful_updates = sum(1 for result in results if result.status == "success")
+        failed_updates = len(results) - successful_updates
+
+        if counter_changes:
+            await map_counters.locations_changed(counter_changes)
+            # One floor-level notification instead of one per location
+            await mapStateModify(
+                "location",
+                floor_ids=list(floors_affected),
+                entity_ids=[result.location_id for result in results if result.status == "success"]
+            )
         
         # Prepare response
         response = BulkUpdateResponse(
-            total_requested=len(bulk_update_data.locations),
+            total_requested=len(locations),
             successful_updates=successful_updates,
             failed_updates=failed_updates,
             results=results
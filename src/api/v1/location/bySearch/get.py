@@ -2,8 +2,8 @@ from fastapi import HTTPException, Query, status
 from pydantic import BaseModel, Field
 from typing import Optional, List
 import logging
-from src.datamodel.database.domain.DigitalSignage import Location
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.search.location_search import location_search
 
 
 logger = logging.getLogger(__name__)
@@ -62,6 +62,7 @@ async def main(
     q: str = Query(..., description="Search query (searches in name, category, and description)"),
     status_filter: Optional[str] = Query("active", description="Filter by status (active, inactive, deleted, all)"),
     category: Optional[str] = Query(None, description="Filter by specific category"),
+    building_id: Optional[str] = Query(None, description="Filter by specific building ID"),
     floor_id: Optional[str] = Query(None, description="Filter by specific floor ID"),
     shape: Optional[str] = Query(None, description="Filter by shape type (circle, rectangle)"),
     limit: Optional[int] = Query(20, description="Limit number of results"),
@@ -76,84 +77,40 @@ async def main(
                 detail="Search query must be at least 2 characters long"
             )
 
-        # Build search query
         search_pattern = q.strip()
-        if exact_match:
-            # Exact match search
-            search_conditions = [
-                {"name": {"$regex": f"^{search_pattern}$", "$options": "i"}},
-                {"category": {"$regex": f"^{search_pattern}$", "$options": "i"}},
-                {"description": {"$regex": f"^{search_pattern}$", "$options": "i"}}
-            ]
-        else:
-            # Partial match search
-            search_conditions = [
-                {"name": {"$regex": search_pattern, "$options": "i"}},
-                {"category": {"$regex": search_pattern, "$options": "i"}},
-                {"description": {"$regex": search_pattern, "$options": "i"}}
-            ]
-
-        # Build main query filter
-        query_filter = {
-            "$or": search_conditions
+        sort_keys = {
+            "name": lambda m: (m[0].name or "").lower(),
+            "category": lambda m: m[0].category.value,
+            "datetime": lambda m: -(m[0].datetime or 0),  # Newest first for datetime
+            "floor_id": lambda m: m[0].floor_id,
         }
-        
-        # Add additional filters
-        if status_filter and status_filter != "all":
-            query_filter["status"] = status_filter
-            
-        if category:
-            query_filter["category"] = {"$regex": category, "$options": "i"}
-            
-        if floor_id:
-            query_filter["floor_id"] = floor_id
-            
-        if shape:
-            query_filter["shape"] = shape
-
-        # Execute search query
-        if sort_by == "relevance":
-            # For relevance sorting, we'll use text search if available, otherwise sort by name
-            query = Location.find(query_filter).sort("name")
-        else:
-            sort_direction = 1 if sort_by != "datetime" else -1  # Newest first for datetime
-            query = Location.find(query_filter).sort([(sort_by, sort_direction)])
-        
-        if skip:
-            query = query.skip(skip)
+        if sort_by != "relevance" and sort_by not in sort_keys:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid sort_by '{sort_by}'. Valid values: relevance, {', '.join(sort_keys)}"
+            )
+
+        # Rank every match from the in-memory index first, then paginate
+        matches = await location_search.search(
+            search_pattern,
+            building_id=building_id,
+            floor_id=floor_id,
+            status_filter=status_filter,
+            category=category,
+            shape=shape,
+            exact_match=bool(exact_match),
+        )
+        if sort_by != "relevance":
+            matches.sort(key=sort_keys[sort_by])
+
+        total_results = len(matches)
+        floors_found = {location.floor_id for location, _ in matches if location.floor_id}
+        page = matches[skip or 0:]
         if limit:
-            query = query.limit(limit)
-            
-        locations = await query.to_list()
-        
-        # Calculate relevance scores and prepare response
+            page = page[:limit]
+
         location_list = []
-        floors_found = set()
-        
-        for location in locations:
-            # Track floors found in search results
-            if location.floor_id:
-                floors_found.add(location.floor_id)
-            
-            # Simple relevance scoring based on where the match occurs
-            relevance_score = 0.0
-            search_lower = search_pattern.lower()
-            
-            if location.name and search_lower in location.name.lower():
-                if location.name.lower().startswith(search_lower):
-                    relevance_score += 3.0  # Higher score for name prefix match
-                else:
-                    relevance_score += 2.0  # Medium score for name partial match
-                    
-            if location.category and search_lower in location.category.lower():
-                if location.category.lower().startswith(search_lower):
-                    relevance_score += 2.0  # Higher score for category prefix match
-                else:
-                    relevance_score += 1.0  # Lower score for category partial match
-                    
-            if location.description and search_lower in location.description.lower():
-                relevance_score += 0.5  # Lowest score for description match
-            
+        for location, relevance_score in page:
             location_response = LocationSearchResponse(
                 location_id=location.location_id,
                 name=location.name,
@@ -176,14 +133,11 @@ async def main(
             )
             location_list.append(location_response)
 
-        # Sort by relevance if requested
-        if sort_by == "relevance":
-            location_list.sort(key=lambda x: x.relevance_score, reverse=True)
-
         # Create comprehensive response
         search_filters = {
             "status": status_filter,
             "category": category,
+            "building_id": building_id,
             "floor_id": floor_id,
             "shape": shape,
             "exact_match": exact_match,
@@ -192,17 +146,17 @@ async def main(
 
         response = SearchResultsResponse(
             query=search_pattern,
-            total_results=len(location_list),
+            total_results=total_results,
             results=location_list,
             search_filters=search_filters,
             floors_found=list(floors_found)
         )
 
-        logger.info(f"Search completed for query '{search_pattern}': {len(location_list)} results found across {len(floors_found)} floors")
+        logger.info(f"Search completed for query '{search_pattern}': {total_results} results found across {len(floors_found)} floors")
 
         return {
             "status": "success",
-            "message": f"Found {len(location_list)} locations matching '{search_pattern}' across {len(floors_found)} floors",
+            "message": f"Found {total_results} locations matching '{search_pattern}' across {len(floors_found)} floors",
             "data": response
         }
 
@@ -2,6 +2,7 @@ from fastapi import HTTPException, Path, Query, status
 from pydantic import BaseModel, Field
 from typing import Optional, List
 import logging
+import re
 from src.datamodel.database.domain.DigitalSignage import Floor, Location
 from src.datamodel.datavalidation.apiconfig import ApiConfig
 
@@ -87,7 +88,7 @@ async def main(
             query_filter["status"] = status_filter
             
         if category:
-            query_filter["category"] = {"$regex": category, "$options": "i"}
+            query_filter["category"] = {"$regex": re.escape(category), "$options": "i"}
 
         # Execute query to get locations
         query = Location.find(query_filter).sort("name")  # Sort by name
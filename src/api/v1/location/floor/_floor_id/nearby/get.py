@@ -0,0 +1,140 @@
+from fastapi import HTTPException, Path, Query, status
+from pydantic import BaseModel
+from typing import Optional, List
+import logging
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation.spatial_index import spatial_index_cache, SpatialItem
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Location"],
+        "summary": "Find Nearby Locations and Connectors",
+        "response_model": dict,
+        "description": (
+            "Spatial query over a floor's locations and vertical connectors, answered from the in-memory floor index. "
+            "Pass min_x/min_y/max_x/max_y for a bounding-box query, x/y with radius for a radius query "
+            "(radius=0 hit-tests a tap), or x/y alone for the k nearest items."
+        ),
+        "response_description": "Matching items with their distance from the query point",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+class NearbyItemResponse(BaseModel):
+    item_id: str
+    kind: str
+    name: str
+    shape: str
+    x: float
+    y: float
+    width: Optional[float] = None
+    height: Optional[float] = None
+    radius: Optional[float] = None
+    category: Optional[str] = None
+    connector_type: Optional[str] = None
+    is_published: bool
+    distance: Optional[float] = None
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+class NearbyResponse(BaseModel):
+    floor_id: str
+    query_type: str
+    total: int
+    items: List[NearbyItemResponse]
+
+    class Config:
+        allow_population_by_field_name = True
+
+
+def _to_response(item: SpatialItem, distance: Optional[float] = None) -> NearbyItemResponse:
+    data = item._asdict()
+    data.pop("floor_id")
+    return NearbyItemResponse(**data, distance=distance)
+
+
+async def main(
+    floor_id: str = Path(..., description="Floor ID to search on"),
+    x: Optional[float] = Query(None, description="X coordinate of the query point"),
+    y: Optional[float] = Query(None, description="Y coordinate of the query point"),
+    k: int = Query(5, ge=1, le=100, description="Number of nearest items to return when no radius or box is given"),
+    radius: Optional[float] = Query(None, ge=0, description="Return every item within this distance of the point"),
+    min_x: Optional[float] = Query(None, description="Bounding box minimum X"),
+    min_y: Optional[float] = Query(None, description="Bounding box minimum Y"),
+    max_x: Optional[float] = Query(None, description="Bounding box maximum X"),
+    max_y: Optional[float] = Query(None, description="Bounding box maximum Y"),
+    kind: Optional[str] = Query(None, description="Filter by item kind (location, vertical_connector)"),
+    category: Optional[str] = Query(None, description="Filter locations by category"),
+    connector_type: Optional[str] = Query(None, description="Filter connectors by type"),
+    published_only: bool = Query(False, description="Only return published items"),
+):
+    try:
+        box = [min_x, min_y, max_x, max_y]
+        if any(v is not None for v in box) and not all(v is not None for v in box):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="min_x, min_y, max_x and max_y must be provided together"
+            )
+        use_box = all(v is not None for v in box)
+        if not use_box and (x is None or y is None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="x and y are required unless a bounding box is given"
+            )
+
+        index = await spatial_index_cache.get_floor_index(floor_id)
+        if index is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Floor with ID '{floor_id}' not found"
+            )
+
+        def accept(item: SpatialItem) -> bool:
+            return (
+                (kind is None or item.kind == kind)
+                and (category is None or item.category == category)
+                and (connector_type is None or item.connector_type == connector_type)
+                and (not published_only or item.is_published)
+            )
+
+        if use_box:
+            query_type = "bbox"
+            items = [_to_response(item) for item in index.within_box(min_x, min_y, max_x, max_y) if accept(item)]
+            items.sort(key=lambda i: i.name)
+        elif radius is not None:
+            query_type = "radius"
+            items = [_to_response(item, d) for item, d in index.within_radius(x, y, radius) if accept(item)]
+        else:
+            query_type = "nearest"
+            items = [_to_response(item, d) for item, d in index.nearest(x, y, k, accept)]
+
+        response = NearbyResponse(
+            floor_id=floor_id,
+            query_type=query_type,
+            total=len(items),
+            items=items
+        )
+
+        return {
+            "status": "success",
+            "message": f"Found {len(items)} items on floor",
+            "data": response
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error running spatial query for floor {floor_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to find nearby items: {str(e)}"
+        )
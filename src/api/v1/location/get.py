@@ -2,6 +2,7 @@ from fastapi import HTTPException, Query, status
 from pydantic import BaseModel, Field
 from typing import Optional, List
 import logging
+import re
 from src.datamodel.database.domain.DigitalSignage import Location, ShapeType
 from src.datamodel.datavalidation.apiconfig import ApiConfig
 
@@ -68,7 +69,7 @@ async def main(
             query_filter["status"] = status_filter
         
         if category:
-            query_filter["category"] = {"$regex": category, "$options": "i"}  # Case-insensitive partial match
+            query_filter["category"] = {"$regex": re.escape(category), "$options": "i"}  # Case-insensitive partial match
             
         if floor_id:
             query_filter["floor_id"] = floor_id
@@ -77,7 +78,7 @@ async def main(
             query_filter["shape"] = shape
         
         if name:
-            query_filter["name"] = {"$regex": name, "$options": "i"}  # Case-insensitive partial match
+            query_filter["name"] = {"$regex": re.escape(name), "$options": "i"}  # Case-insensitive partial match
 
         # Execute query with sorting
         sort_direction = 1 if sort_order.lower() == "asc" else -1
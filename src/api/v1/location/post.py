@@ -5,6 +5,8 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import Location, ShapeType, LocationType
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, location_key
 
 
 logger = logging.getLogger(__name__)
@@ -164,6 +166,8 @@ async def main(
             floor.update_on = time.time()
             await floor.save()
         
+        await map_counters.location_changed(None, location_key(new_location))
+        await mapStateModify("location", new_location.location_id, floor_ids=[new_location.floor_id])
         logger.info(f"Location created successfully: {new_location.location_id} on floor: {location_data.floor_id}")
 
         # Prepare response
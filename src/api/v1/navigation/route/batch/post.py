@@ -0,0 +1,88 @@
+from fastapi import HTTPException, status
+from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any
+import logging
+
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation_service import navigation_service
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Navigation"],
+        "summary": "Find Routes to Many Destinations",
+        "response_model": dict,
+        "description": "Find routes from one source location to many destinations with a single graph expansion. Unreachable destinations are reported individually.",
+        "response_description": "One route (or failure reason) per destination",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+class BatchRouteRequest(BaseModel):
+    source_location_id: str = Field(..., description="Location the routes start from")
+    destination_location_ids: List[str] = Field(..., description="Locations to route to")
+    preferred_connector_type: Optional[str] = Field(None, description="Preferred vertical connector type (elevator, stairs, escalator)")
+
+    @validator("destination_location_ids")
+    def validate_destinations(cls, v):
+        if not v:
+            raise ValueError("At least one destination location is required")
+        if len(v) > 1000:
+            raise ValueError("Maximum 1000 destinations can be routed at once")
+        # Keep request order, drop duplicates
+        return list(dict.fromkeys(v))
+
+
+class BatchRouteResult(BaseModel):
+    destination_location_id: str
+    status: str  # "success" or "failed"
+    message: Optional[str] = None
+    route: Optional[Dict[str, Any]] = None
+
+
+async def main(batch_request: BatchRouteRequest):
+    try:
+        routes = await navigation_service.find_routes_to_many(
+            batch_request.source_location_id,
+            batch_request.destination_location_ids,
+            batch_request.preferred_connector_type,
+        )
+
+        results = [
+            BatchRouteResult(
+                destination_location_id=destination_id,
+                status="success",
+                route=route.model_dump(),
+            ) if route else BatchRouteResult(
+                destination_location_id=destination_id,
+                status="failed",
+                message="Destination not found or not reachable",
+            )
+            for destination_id, route in routes.items()
+        ]
+        found = sum(1 for r in results if r.status == "success")
+
+        return {
+            "status": "success" if found else "warning",
+            "message": f"Routes found for {found} of {len(results)} destinations",
+            "data": results,
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error finding batch routes: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to find routes: {str(e)}",
+        )
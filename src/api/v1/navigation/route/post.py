@@ -0,0 +1,47 @@
+from fastapi import HTTPException, status
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import NavigationRequest
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation_service import navigation_service
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Navigation"],
+        "summary": "Find Route",
+        "response_model": dict,
+        "description": "Find the fastest route between two locations, across floors when needed, using published paths and vertical connectors.",
+        "response_description": "Route segments, vertical transitions and estimated time",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main(route_request: NavigationRequest):
+    try:
+        route = await navigation_service.find_multi_floor_route(route_request)
+
+        return {
+            "status": "success",
+            "message": "Route found successfully",
+            "data": route,
+        }
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error finding route: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to find route: {str(e)}",
+        )
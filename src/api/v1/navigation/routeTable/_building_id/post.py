@@ -0,0 +1,57 @@
+from fastapi import HTTPException, Path as FastAPIPath, status
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import Building
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation_service import navigation_service
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Navigation"],
+        "summary": "Precompute Kiosk Route Table",
+        "response_model": dict,
+        "description": "Precompute shortest-path trees from every kiosk and entrance location of a building so their routes are served without a search.",
+        "response_description": "Route table version and size",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main(
+    building_id: str = FastAPIPath(..., description="Building ID to precompute routes for"),
+):
+    try:
+        building = await Building.find_one({"building_id": building_id, "status": "active"})
+        if not building:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Building with ID '{building_id}' not found",
+            )
+
+        table = await navigation_service.precompute_route_table(building_id)
+
+        return {
+            "status": "success",
+            "message": "Route table precomputed successfully",
+            "data": {
+                "building_id": building_id,
+                "version": table.version,
+                "sources": len(table.predecessors),
+                "nodes": len(table.node_ids),
+                "built_at": table.built_at,
+            },
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error precomputing route table for building '{building_id}': {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to precompute route table: {str(e)}",
+        )
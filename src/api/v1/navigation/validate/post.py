@@ -0,0 +1,42 @@
+from fastapi import HTTPException, status
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import NavigationRequest
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation_service import navigation_service
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Navigation"],
+        "summary": "Validate Navigation Request",
+        "response_model": dict,
+        "description": "Check that source and destination exist, that their floors are connected and that a published route joins them.",
+        "response_description": "Validation result with errors and warnings",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main(route_request: NavigationRequest):
+    try:
+        validation = await navigation_service.validate_navigation_request(route_request)
+
+        return {
+            "status": "success",
+            "message": "Navigation request is valid" if validation["is_valid"] else "Navigation request is invalid",
+            "data": validation,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error validating navigation request: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to validate navigation request: {str(e)}",
+        )
@@ -200,6 +200,7 @@ from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.services.permit.permit_service import PermitService
+from src.services.identity.user_cache import user_identities
 from sqlalchemy import select
 import time
 from src.core.middleware.token_validate_middleware import validate_token
@@ -267,6 +268,7 @@ async def delete_organization(entity_uuid: str, user_uuid: str, db: AsyncSession
         
         # Commit the deletion of mappings before proceeding
         await db.commit()
+        user_identities.invalidate(*user_uuids)
 
         # Delete users only if they're not linked to any other entity - SECOND TRANSACTION
         for user_uuid in set(user_uuids):
@@ -289,6 +291,7 @@ async def delete_organization(entity_uuid: str, user_uuid: str, db: AsyncSession
         
         # Commit user deletions
         await db.commit()
+        user_identities.invalidate(*user_uuids)
 
         # Delete the entity itself - THIRD TRANSACTION
         await db.delete(tenant)
@@ -308,16 +311,11 @@ async def delete_organization(entity_uuid: str, user_uuid: str, db: AsyncSession
         logger.error(f"Error while deleting organization: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
-async def main(entity_uuid: str, request: Request, db: AsyncSession = Depends(db)):
+async def main(entity_uuid: str, request: Request, claims: dict = Depends(validate_token), db: AsyncSession = Depends(db)):
     # Get entity_uuid from request
-    validate_token_start = time.time()
-    
-    validate_token(request)
     # await verify_permissions(request, "content", "read")
 
     # entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
     
     return await delete_organization(entity_uuid, user_uuid, db)
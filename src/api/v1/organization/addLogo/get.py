@@ -7,7 +7,6 @@ from src.datamodel.datavalidation.apiconfig import ApiConfig
 from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy import select
 from src.core.middleware.token_validate_middleware import validate_token
-import time
 
 
 logger = logging.getLogger(__name__)
@@ -85,17 +84,14 @@ async def get_entity_logo(
 
 async def main(
     request: Request,
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db),
 ):
     
 
     # Validate token and get user info
-    validate_token_start = time.time()
-    validate_token(request)
     entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
     role_id = request.state.role_id
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     return await get_entity_logo(db, entity_uuid, user_uuid)
@@ -12,7 +12,6 @@ from src.core.database.dbs.getdb import postresql as db
 from src.services.files.minio_service import MinioService, MINIO_BUCKET
 from sqlalchemy import select
 from src.core.middleware.token_validate_middleware import validate_token
-import time
 
 logger = logging.getLogger(__name__)
 minio_service = MinioService()
@@ -135,16 +134,13 @@ async def main(
     entity_uuid: str,
     request: Request,
     logo: UploadFile = File(...),
+    claims: dict = Depends(validate_token),
     db: AsyncSession = Depends(db),
 ):
     # Validate token and get user info
-    validate_token_start = time.time()
-    validate_token(request)
     # entity_uuid = request.state.entity_uuid
     user_uuid = request.state.user_uuid
     role_id = request.state.role_id
-    validate_token_time = time.time() - validate_token_start
-    logger.info(f"PERFORMANCE: Token validation took {validate_token_time:.4f} seconds")
 
     return await upload_entity_logo(entity_uuid, logo, db, role_id, user_uuid)
 
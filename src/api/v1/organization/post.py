@@ -15,6 +15,7 @@ from sqlalchemy.exc import IntegrityError
 from src.datamodel.datavalidation.apiconfig import ApiConfig  
 from src.core.database.dbs.getdb import postresql as db
 from src.services.permit.permit_service import PermitService
+from src.services.identity.user_cache import user_identities
 from sqlalchemy import select
 
 
@@ -128,6 +129,7 @@ async def create_entity(entity_data: EntityCreate, db: AsyncSession, current_use
             db.add(role_mapping)
             try:
                 await db.commit()
+                user_identities.invalidate(current_user.user_uuid)
             except IntegrityError as e:
                 await db.rollback()
                 # If we still get an integrity error, it might be a race condition
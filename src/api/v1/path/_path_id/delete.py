@@ -5,6 +5,8 @@ import logging
 
 from src.datamodel.database.domain.DigitalSignage import Path, Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, path_key
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,7 @@ async def main(
         # Preserve current floors to remove membership
         path.recompute_denorm()
         floors_to_update = set(path.floors or [])
+        counted_before = path_key(path)
 
         already_inactive = path.status != "active"
 
@@ -60,6 +63,9 @@ async def main(
                     await floor.save()
                     floors_updated += 1
 
+        await map_counters.path_changed(counted_before, path_key(path))
+        await mapStateModify("path", path.path_id, floor_ids=list(floors_to_update), building_id=path.building_id)
+
         msg = "Path already inactive; memberships cleaned" if already_inactive else "Path deleted successfully"
 
         return {
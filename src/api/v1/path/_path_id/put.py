@@ -6,15 +6,13 @@ import logging
 
 from src.datamodel.database.domain.DigitalSignage import (
     Path,
-    PathPoint,
     FloorSegment,
-    NodeKind,
-    Location,
-    VerticalConnector,
     Floor,
-    Building,
 )
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation.path_references import PathReferences
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, path_key
 
 logger = logging.getLogger(__name__)
 
@@ -93,71 +91,9 @@ class PathDetail(BaseModel):
 # Helper validations
 # -----------------------------
 
-async def _ensure_building_exists(building_id: str):
-    building = await Building.find_one({"building_id": building_id, "status": "active"})
-    if not building:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Building with ID '{building_id}' not found",
-        )
-
-
-async def _ensure_floors_exist(floor_ids: List[str]):
-    if not floor_ids:
-        return
-    missing: List[str] = []
-    for fid in set(floor_ids):
-        f = await Floor.find_one({"floor_id": fid, "status": "active"})
-        if not f:
-            missing.append(fid)
-    if missing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Floor(s) not found: {', '.join(missing)}",
-        )
-
-
-async def _validate_and_enrich_points(seg: FloorSegment) -> FloorSegment:
-    enriched_points: List[PathPoint] = []
-    for p in seg.points:
-        if p.kind == NodeKind.LOCATION:
-            if not p.ref_id:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Location point requires ref_id")
-            loc = await Location.find_one({"location_id": p.ref_id, "status": "active"})
-            if not loc:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Location with ID '{p.ref_id}' not found",
-                )
-            if loc.floor_id != seg.floor_id:
-                logger.warning(f"Location {loc.location_id} belongs to floor {loc.floor_id}, but used on segment floor {seg.floor_id}")
-
-        elif p.kind == NodeKind.VERTICAL_CONNECTOR:
-            if not p.ref_id:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Vertical connector point requires ref_id")
-            conn = await VerticalConnector.find_one({
-                "connector_id": p.ref_id,
-                "status": "active",
-            })
-            if not conn:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Vertical connector with ID '{p.ref_id}' not found",
-                )
-            if conn.floor_id != seg.floor_id:
-                logger.warning(f"Vertical connector {conn.connector_id} belongs to floor {conn.floor_id}, used on floor {seg.floor_id}")
-            if not p.shared_id:
-                p.shared_id = conn.shared_id
-
-        elif p.kind == NodeKind.WAYPOINT:
-            if p.x is None or p.y is None:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Waypoint requires x and y coordinates")
-        else:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported point kind: {p.kind}")
-        enriched_points.append(p)
-
-    seg.points = enriched_points
-    return seg
+def _reference_error(error: Exception) -> HTTPException:
+    code = status.HTTP_404_NOT_FOUND if isinstance(error, LookupError) else status.HTTP_400_BAD_REQUEST
+    return HTTPException(status_code=code, detail=str(error))
 
 
 # -----------------------------
@@ -179,10 +115,20 @@ async def main(
         # Keep original floors for membership updates
         existing.recompute_denorm()
         old_floors = set(existing.floors or [])
+        counted_before = path_key(existing)
+
+        # Prefetch the new building and every point referenced by replacement segments
+        refs = await PathReferences.load(
+            (path_data.floor_segments or []) if path_data else [],
+            [path_data.building_id] if path_data and path_data.building_id is not None else [],
+        )
 
         # Optional building update
         if path_data and path_data.building_id is not None:
-            await _ensure_building_exists(path_data.building_id)
+            try:
+                refs.ensure_building(path_data.building_id)
+            except LookupError as e:
+                raise _reference_error(e)
             existing.building_id = path_data.building_id
 
         # Simple scalar fields
@@ -201,14 +147,10 @@ async def main(
 
         # Floor segments replacement
         if path_data and path_data.floor_segments is not None:
-            await _ensure_floors_exist([s.floor_id for s in path_data.floor_segments])
-
-            validated_segments: List[FloorSegment] = []
-            for seg in sorted(path_data.floor_segments, key=lambda s: s.sequence):
-                validated = await _validate_and_enrich_points(seg)
-                validated_segments.append(validated)
-
-            existing.floor_segments = validated_segments
+            try:
+                existing.floor_segments = refs.validate_segments(path_data.floor_segments)
+            except (LookupError, ValueError) as e:
+                raise _reference_error(e)
 
         # Recompute denormalized helpers, timestamps, and updater
         existing.recompute_denorm()
@@ -224,23 +166,22 @@ async def main(
         to_add = new_floors - old_floors
         to_remove = old_floors - new_floors
 
-        for fid in to_add:
-            floor = await Floor.find_one({"floor_id": fid, "status": "active"})
-            if floor:
-                if existing.path_id not in (floor.paths or []):
-                    floor.paths.append(existing.path_id)
-                floor.update_on = time.time()
-                await floor.save()
-
-        for fid in to_remove:
-            floor = await Floor.find_one({"floor_id": fid, "status": "active"})
-            if floor and floor.paths:
-                if existing.path_id in floor.paths:
-                    floor.paths.remove(existing.path_id)
-                floor.update_on = time.time()
-                await floor.save()
+        floors = Floor.get_motor_collection()
+        if to_add:
+            await floors.update_many(
+                {"floor_id": {"$in": list(to_add)}, "status": "active"},
+                {"$addToSet": {"paths": existing.path_id}, "$set": {"update_on": time.time()}},
+            )
+        if to_remove:
+            await floors.update_many(
+                {"floor_id": {"$in": list(to_remove)}, "status": "active"},
+                {"$pull": {"paths": existing.path_id}, "$set": {"update_on": time.time()}},
+            )
 
         # Build response
+        await map_counters.path_changed(counted_before, path_key(existing))
+        await mapStateModify("path", existing.path_id, floor_ids=list(old_floors | new_floors), building_id=existing.building_id)
+
         resp = PathDetail(
             path_id=existing.path_id,
             name=existing.name,
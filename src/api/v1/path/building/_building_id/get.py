@@ -5,6 +5,7 @@ import logging
 
 from src.datamodel.database.domain.DigitalSignage import Path, Building, Location, FloorSegment
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation.path_references import expand_paths
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,12 @@ class PathListItem(BaseModel):
     connector_shared_ids: List[str] = []
     floor_segments: List[FloorSegment] = []
 
+    # Present when expand=true
+    start_point: Optional[dict] = None
+    end_point: Optional[dict] = None
+    floors_details: Optional[List[dict]] = None
+    vertical_connectors: Optional[List[dict]] = None
+
     tags: List[str] = []
     datetime: float
     status: str
@@ -49,6 +56,7 @@ async def main(
     building_id: str = FastAPIPath(..., description="Building ID to get paths for"),
     is_multifloor: Optional[bool] = Query(None, description="True for multi-floor paths, False for single-floor"),
     is_published: Optional[bool] = Query(None, description="Filter by published status"),
+    expand: bool = Query(False, description="Include start/end locations, floors and transition connectors for every path"),
 ):
     try:
         # Validate building existence
@@ -71,12 +79,21 @@ async def main(
 
         paths = await Path.find(filter_query).to_list()
 
-        # Prefetch start/end location names for endpoints
-        location_ids = {p.start_point_id for p in paths if getattr(p, "start_point_id", None)} | {p.end_point_id for p in paths if getattr(p, "end_point_id", None)}
+        # Expanded references for all paths at once, otherwise just the start/end location names
+        expansions = {}
         location_names = {}
-        if location_ids:
-            locations = await Location.find({"location_id": {"$in": list(location_ids)}, "status": "active"}).to_list()
-            location_names = {loc.location_id: loc.name for loc in locations}
+        if expand and paths:
+            expansions = await expand_paths(paths)
+            location_names = {
+                point["location_id"]: point["name"]
+                for expansion in expansions.values()
+                for point in (expansion["start_point"], expansion["end_point"]) if point
+            }
+        else:
+            location_ids = {p.start_point_id for p in paths if getattr(p, "start_point_id", None)} | {p.end_point_id for p in paths if getattr(p, "end_point_id", None)}
+            if location_ids:
+                locations = await Location.find({"location_id": {"$in": list(location_ids)}, "status": "active"}).to_list()
+                location_names = {loc.location_id: loc.name for loc in locations}
 
         items: List[PathListItem] = []
         for p in paths:
@@ -95,6 +112,7 @@ async def main(
                     floors=p.floors or [],
                     connector_shared_ids=p.connector_shared_ids or [],
                     floor_segments=p.floor_segments or [],
+                    **expansions.get(p.path_id, {}),
                     tags=p.tags or [],
                     datetime=p.datetime,
                     status=p.status,
@@ -111,6 +129,7 @@ async def main(
                     "building_id": building_id,
                     "is_multifloor": is_multifloor,
                     "is_published": is_published,
+                    "expand": expand,
                 },
             },
         }
@@ -0,0 +1,200 @@
+from fastapi import HTTPException, status
+from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any, Set
+from collections import defaultdict
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Path,
+    Floor,
+    FloorSegment,
+)
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation.path_references import PathReferences
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, path_key
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 201,
+        "tags": ["Path"],
+        "summary": "Bulk Create Paths",
+        "response_model": dict,
+        "description": "Create many navigation paths at once. Every referenced building, floor, location and connector is fetched with one query per collection; valid paths are inserted together and failures are reported per item.",
+        "response_description": "Bulk creation results with success and failure details",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+# -----------------------------
+# Request/Response Models
+# -----------------------------
+
+class PathCreateData(BaseModel):
+    name: Optional[str] = Field(None, description="Human-friendly name for the path")
+    building_id: str = Field(..., description="Building this path belongs to")
+
+    # Endpoints
+    start_point_id: str = Field(..., description="Starting point Id (Location/Connector/Waypoint synthetic id)")
+    end_point_id: str = Field(..., description="End point Id (Location/Connector/Waypoint synthetic id)")
+
+    # Publication & behavior
+    is_published: bool = Field(False, description="Whether the path is published")
+
+    # Geometry
+    floor_segments: List[FloorSegment] = Field(..., description="Per-floor segments forming the path")
+
+    # Common metadata
+    tags: List[str] = Field(default_factory=list, description="Search/filter tags")
+    metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional metadata")
+
+    @validator("floor_segments")
+    def validate_segments(cls, v: List[FloorSegment]):
+        if not v or len(v) == 0:
+            raise ValueError("At least one floor segment is required")
+        for seg in v:
+            if not seg.points or len(seg.points) < 2:
+                raise ValueError("Each floor segment must have at least 2 points")
+        return v
+
+
+class BulkPathCreateRequest(BaseModel):
+    paths: List[PathCreateData] = Field(..., description="Paths to create")
+    created_by: Optional[str] = Field(None, description="User who created the paths")
+
+    @validator("paths")
+    def validate_paths_not_empty(cls, v):
+        if not v:
+            raise ValueError("At least one path must be provided")
+        return v
+
+
+class PathCreateResult(BaseModel):
+    index: int
+    name: Optional[str] = None
+    status: str  # "success" or "failed"
+    message: str
+    path_id: Optional[str] = None
+    floors: List[str] = []
+    is_multifloor: Optional[bool] = None
+
+
+# -----------------------------
+# Endpoint
+# -----------------------------
+
+async def main(bulk_data: BulkPathCreateRequest):
+    try:
+        items = bulk_data.paths
+        results: Dict[int, PathCreateResult] = {}
+
+        def fail(index: int, message: str) -> None:
+            results[index] = PathCreateResult(index=index, name=items[index].name, status="failed", message=message)
+
+        # One $in query per collection for everything the batch references
+        refs = await PathReferences.load(
+            (seg for item in items for seg in item.floor_segments),
+            (item.building_id for item in items),
+        )
+
+        now = time.time()
+        pending: List[tuple] = []
+        for index, item in enumerate(items):
+            try:
+                refs.ensure_building(item.building_id)
+                validated_segments = refs.validate_segments(item.floor_segments)
+            except (LookupError, ValueError) as e:
+                fail(index, str(e))
+                continue
+
+            new_path = Path(
+                name=item.name,
+                building_id=item.building_id,
+                created_by=bulk_data.created_by,
+                start_point_id=item.start_point_id,
+                end_point_id=item.end_point_id,
+                is_published=item.is_published,
+                floor_segments=validated_segments,
+                tags=item.tags or [],
+                metadata=item.metadata or {},
+                datetime=now,
+                status="active",
+            )
+            new_path.recompute_denorm()
+            pending.append((index, new_path))
+
+        failed_positions: Set[int] = set()
+        if pending:
+            try:
+                await Path.insert_many([path for _, path in pending], ordered=False)
+            except BulkWriteError as bwe:
+                for error in bwe.details.get("writeErrors", []):
+                    failed_positions.add(error["index"])
+                    fail(pending[error["index"]][0], f"Internal error: {error.get('errmsg', 'Write failed')}")
+
+        created = [(index, path) for position, (index, path) in enumerate(pending) if position not in failed_positions]
+        by_floor: Dict[str, List[str]] = defaultdict(list)
+        floors_by_building: Dict[str, Set[str]] = defaultdict(set)
+        for index, path in created:
+            for fid in set(path.floors):
+                by_floor[fid].append(path.path_id)
+            floors_by_building[path.building_id].update(path.floors)
+            results[index] = PathCreateResult(
+                index=index,
+                name=path.name,
+                status="success",
+                message="Path created successfully",
+                path_id=path.path_id,
+                floors=path.floors,
+                is_multifloor=path.is_multifloor,
+            )
+
+        if by_floor:
+            # One round trip appends the new IDs to every floor's paths list
+            await Floor.get_motor_collection().bulk_write([
+                UpdateOne(
+                    {"floor_id": floor_id, "status": "active"},
+                    {"$addToSet": {"paths": {"$each": path_ids}}, "$set": {"update_on": now}},
+                )
+                for floor_id, path_ids in by_floor.items()
+            ], ordered=False)
+            await map_counters.paths_changed((None, path_key(path)) for _, path in created)
+            for building_id, floor_ids in floors_by_building.items():
+                await mapStateModify(
+                    "path",
+                    floor_ids=list(floor_ids),
+                    building_id=building_id,
+                    entity_ids=[path.path_id for _, path in created if path.building_id == building_id],
+                )
+
+        successful = len(created)
+        failed = len(items) - successful
+        logger.info(f"Bulk path creation completed: {successful} successful, {failed} failed")
+
+        return {
+            "status": "completed",
+            "message": f"Bulk path creation completed: {successful} successful, {failed} failed",
+            "data": {
+                "total_requested": len(items),
+                "successful_creations": successful,
+                "failed_creations": failed,
+                "results": [results[index] for index in range(len(items))],
+            },
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error in bulk path creation: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create paths: {str(e)}",
+        )
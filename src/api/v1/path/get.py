@@ -5,6 +5,7 @@ import logging
 
 from src.datamodel.database.domain.DigitalSignage import Path, Location, FloorSegment
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation.path_references import expand_paths
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,12 @@ class PathListItem(BaseModel):
     connector_shared_ids: List[str] = []
     floor_segments: List[FloorSegment] = []
 
+    # Present when expand=true
+    start_point: Optional[dict] = None
+    end_point: Optional[dict] = None
+    floors_details: Optional[List[dict]] = None
+    vertical_connectors: Optional[List[dict]] = None
+
     tags: List[str] = []
     datetime: float
     status: str
@@ -49,6 +56,7 @@ async def main(
     building_id: Optional[str] = Query(None, description="Filter by building ID"),
     created_by: Optional[str] = Query(None, description="Filter by creator"),
     is_multi_floor: Optional[bool] = Query(None, description="True for multi-floor paths, False for single-floor"),
+    expand: bool = Query(False, description="Include start/end locations, floors and transition connectors for every path"),
 ):
     try:
         filter_query = {"status": "active"}
@@ -63,12 +71,21 @@ async def main(
 
         paths = await Path.find(filter_query).to_list()
 
-        # Prefetch start/end location names
-        location_ids = {p.start_point_id for p in paths if getattr(p, "start_point_id", None)} | {p.end_point_id for p in paths if getattr(p, "end_point_id", None)}
+        # Expanded references for all paths at once, otherwise just the start/end location names
+        expansions = {}
         location_names = {}
-        if location_ids:
-            locations = await Location.find({"location_id": {"$in": list(location_ids)}, "status": "active"}).to_list()
-            location_names = {loc.location_id: loc.name for loc in locations}
+        if expand and paths:
+            expansions = await expand_paths(paths)
+            location_names = {
+                point["location_id"]: point["name"]
+                for expansion in expansions.values()
+                for point in (expansion["start_point"], expansion["end_point"]) if point
+            }
+        else:
+            location_ids = {p.start_point_id for p in paths if getattr(p, "start_point_id", None)} | {p.end_point_id for p in paths if getattr(p, "end_point_id", None)}
+            if location_ids:
+                locations = await Location.find({"location_id": {"$in": list(location_ids)}, "status": "active"}).to_list()
+                location_names = {loc.location_id: loc.name for loc in locations}
 
         path_list: List[PathListItem] = []
         for p in paths:
@@ -86,6 +103,7 @@ async def main(
                 floors=p.floors or [],
                 connector_shared_ids=p.connector_shared_ids or [],
                 floor_segments=p.floor_segments or [],
+                **expansions.get(p.path_id, {}),
                 tags=p.tags or [],
                 datetime=p.datetime,
                 status=p.status,
@@ -102,6 +120,7 @@ async def main(
                     "building_id": building_id,
                     "created_by": created_by,
                     "is_multi_floor": is_multi_floor,
+                    "expand": expand,
                 },
             },
         }
@@ -7,14 +7,12 @@ import logging
 from src.datamodel.database.domain.DigitalSignage import (
     Path,
     Floor,
-    Building,
-    Location,
-    VerticalConnector,
-    PathPoint,
     FloorSegment,
-    NodeKind,
 )
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.navigation.path_references import PathReferences
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, path_key
 
 logger = logging.getLogger(__name__)
 
@@ -90,75 +88,9 @@ class PathResponse(BaseModel):
 # Helper validations
 # -----------------------------
 
-async def _ensure_building_exists(building_id: str):
-    building = await Building.find_one({"building_id": building_id, "status": "active"})
-    if not building:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Building with ID '{building_id}' not found",
-        )
-
-
-async def _ensure_floors_exist(floor_ids: List[str]):
-    if not floor_ids:
-        return
-    missing: List[str] = []
-    for fid in set(floor_ids):
-        f = await Floor.find_one({"floor_id": fid, "status": "active"})
-        if not f:
-            missing.append(fid)
-    if missing:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Floor(s) not found: {', '.join(missing)}",
-        )
-
-
-async def _validate_and_enrich_points(seg: FloorSegment) -> FloorSegment:
-    """Validate referenced entities for a segment's points. Enrich vertical connectors' shared_id if missing."""
-    enriched_points: List[PathPoint] = []
-    for p in seg.points:
-        if p.kind == NodeKind.LOCATION:
-            if not p.ref_id:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Location point requires ref_id")
-            loc = await Location.find_one({"location_id": p.ref_id, "status": "active"})
-            if not loc:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Location with ID '{p.ref_id}' not found",
-                )
-            # Optionally validate the location's floor matches segment floor
-            if loc.floor_id != seg.floor_id:
-                logger.warning(f"Location {loc.location_id} belongs to floor {loc.floor_id}, but used on segment floor {seg.floor_id}")
-
-        elif p.kind == NodeKind.VERTICAL_CONNECTOR:
-            if not p.ref_id:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Vertical connector point requires ref_id")
-            conn = await VerticalConnector.find_one({
-                "connector_id": p.ref_id,
-                "status": "active",
-            })
-            if not conn:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Vertical connector with ID '{p.ref_id}' not found",
-                )
-            # Best-effort: ensure it's present on this floor
-            if conn.floor_id != seg.floor_id:
-                logger.warning(f"Vertical connector {conn.connector_id} belongs to floor {conn.floor_id}, used on floor {seg.floor_id}")
-            # Enrich shared_id if not provided
-            if not p.shared_id:
-                p.shared_id = conn.shared_id
-
-        elif p.kind == NodeKind.WAYPOINT:
-            if p.x is None or p.y is None:
-                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Waypoint requires x and y coordinates")
-        else:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unsupported point kind: {p.kind}")
-        enriched_points.append(p)
-
-    seg.points = enriched_points
-    return seg
+def _reference_error(error: Exception) -> HTTPException:
+    code = status.HTTP_404_NOT_FOUND if isinstance(error, LookupError) else status.HTTP_400_BAD_REQUEST
+    return HTTPException(status_code=code, detail=str(error))
 
 
 # -----------------------------
@@ -167,15 +99,13 @@ async def _validate_and_enrich_points(seg: FloorSegment) -> FloorSegment:
 
 async def main(path_data: PathCreateRequest):
     try:
-        # Validate building and floors
-        await _ensure_building_exists(path_data.building_id)
-        await _ensure_floors_exist([s.floor_id for s in path_data.floor_segments])
-
-        # Validate and enrich points per segment
-        validated_segments: List[FloorSegment] = []
-        for seg in sorted(path_data.floor_segments, key=lambda s: s.sequence):
-            validated = await _validate_and_enrich_points(seg)
-            validated_segments.append(validated)
+        # Validate building, floors and every referenced point from one prefetch
+        refs = await PathReferences.load(path_data.floor_segments, [path_data.building_id])
+        try:
+            refs.ensure_building(path_data.building_id)
+            validated_segments = refs.validate_segments(path_data.floor_segments)
+        except (LookupError, ValueError) as e:
+            raise _reference_error(e)
 
         # Create the Path document
         new_path = Path(
@@ -199,15 +129,13 @@ async def main(path_data: PathCreateRequest):
         await new_path.insert()
 
         # Update each floor's paths list
-        unique_floors = set(new_path.floors)
-        for fid in unique_floors:
-            floor = await Floor.find_one({"floor_id": fid, "status": "active"})
-            if floor:
-                if new_path.path_id not in (floor.paths or []):
-                    floor.paths.append(new_path.path_id)
-                floor.update_on = time.time()
-                await floor.save()
+        await Floor.get_motor_collection().update_many(
+            {"floor_id": {"$in": list(set(new_path.floors))}, "status": "active"},
+            {"$addToSet": {"paths": new_path.path_id}, "$set": {"update_on": time.time()}},
+        )
 
+        await map_counters.path_changed(None, path_key(new_path))
+        await mapStateModify("path", new_path.path_id, floor_ids=new_path.floors, building_id=new_path.building_id)
         logger.info(f"Path created successfully: {new_path.path_id} | multi-floor={new_path.is_multifloor}")
 
         # Prepare response
@@ -5,6 +5,7 @@ import logging
 
 from src.datamodel.database.domain.DigitalSignage import Path
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import publishMapChange, PathPublished
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,13 @@ async def main(
         path.update_on = time.time()
 
         await path.save()
+        # Subscribers invalidate caches and rebuild kiosk routes off the request path
+        await publishMapChange(PathPublished(
+            entity_id=path.path_id,
+            floor_ids=path.floors,
+            building_id=path.building_id,
+            is_published=path.is_published,
+        ))
 
         return {
             "status": "success",
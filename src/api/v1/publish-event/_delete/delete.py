@@ -12,6 +12,7 @@ from sqlalchemy.exc import IntegrityError
 from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy.orm import Session
 from src.datamodel.database.domain.DigitalSignage import Event
+from src.services.realtime.pubsub import change_hub, events_topic
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.services.permit.permit_service import PermitService
 from sqlalchemy import select
@@ -35,19 +36,20 @@ def api_config():
     }
     return ApiConfig(**config)
 
-async def delete_event_in_db(id: str):
+async def delete_event_in_db(id: str, entity_uuid: str):
     try:
         event = await Event.find_one(Event.event_id == id)
         if not event:
             raise HTTPException(status_code=404, detail="Event not found")
 
         await event.delete()
+        await change_hub.publish(events_topic(entity_uuid), {"type": "event_change", "action": "deleted", "event_id": id})
 
         return {"message": "Event deleted successfully", "event_id": id}
     except Exception as e:
         logger.error(f"Error deleting event {id}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error deleting event: {str(e)}")
 
-async def main(id: str, db: AsyncSession = Depends(db)):
+async def main(id: str, claims: dict = Depends(validate_token), db: AsyncSession = Depends(db)):
     
-    return await delete_event_in_db(id)
+    return await delete_event_in_db(id, claims["entity_uuid"])
@@ -7,8 +7,10 @@ import logging
 from typing import Dict
 from typing import Optional
 from src.datamodel.database.domain.DigitalSignage import Event
+from src.services.realtime.pubsub import change_hub, events_topic
 from src.datamodel.datavalidation.apiconfig import ApiConfig
 from src.core.authentication.authentication import get_current_user, get_token_payload
+from src.core.middleware.token_validate_middleware import validate_token
 from src.datamodel.database.userauth.AuthenticationTables import  User
 from src.core.database.dbs.getdb import postresql as db
 from src.services.permit.permit_service import PermitService
@@ -107,7 +109,8 @@ async def update_event_in_db(
     is_published: Optional[bool],
     metadata: Optional[str],
     image_base64: Optional[dict],
-    current_user: User
+    current_user: User,
+    organization_uuid: str
 ):
     try:
         # Fetch the existing event
@@ -135,6 +138,7 @@ async def update_event_in_db(
 
         # Save updates
         await existing_event.save()
+        await change_hub.publish(events_topic(organization_uuid), {"type": "event_change", "action": "updated", "event_id": entity_uuid})
         return {"message": "Event updated successfully", "event_id": entity_uuid}
 
     except HTTPException:
@@ -154,6 +158,7 @@ async def main( request: Request,
     is_published: Optional[str] = Form(None),
     metadata: Optional[str] = Form(None),
     image_file: Optional[UploadFile] = File(None),
+    claims: dict = Depends(validate_token),
 ):
     # Parse metadata
     try:
@@ -176,5 +181,6 @@ async def main( request: Request,
         is_published=is_published,
         metadata=metadata_dict,
         image_base64=image_base64,
-        current_user="shamimahmadupup1"
+        current_user="shamimahmadupup1",
+        organization_uuid=claims["entity_uuid"]
     )
\ No newline at end of file
@@ -4,7 +4,9 @@ from typing import Optional, Dict, Any
 import uuid, base64, logging, json
 from src.datamodel.database.userauth.AuthenticationTables import User
 from src.datamodel.database.domain.DigitalSignage import Event
+from src.services.realtime.pubsub import change_hub, events_topic
 from src.core.authentication.authentication import get_current_user
+from src.core.middleware.token_validate_middleware import validate_token
 from b2sdk.v2 import InMemoryAccountInfo, B2Api
 import os
 from src.datamodel.datavalidation.apiconfig import ApiConfig  
@@ -105,7 +107,8 @@ async def create_event_in_db(
     is_published: bool,
     metadata: Dict[str, Any],
     image_base64,
-    current_user: User
+    current_user: User,
+    entity_uuid: str
 ):
     try:
         event_id = str(uuid.uuid4())
@@ -125,6 +128,7 @@ async def create_event_in_db(
         )
 
         await new_event.insert()
+        await change_hub.publish(events_topic(entity_uuid), {"type": "event_change", "action": "created", "event_id": event_id})
         return {"message": "Event created successfully", "event_id": event_id, "title": name}
 
     except Exception as e:
@@ -141,6 +145,7 @@ async def main(
     is_published: Optional[str] = Form("true"),
     metadata: Optional[str] = Form("{}"),
     image_file: Optional[UploadFile] = File(None),
+    claims: dict = Depends(validate_token),
 ):
     # Parse metadata
     try:
@@ -161,6 +166,7 @@ async def main(
         is_published=is_published,
         metadata=metadata_dict,
         image_base64=image_base64,
-       current_user="shamimahmadupup1"
+       current_user="shamimahmadupup1",
+        entity_uuid=claims["entity_uuid"]
     )
 
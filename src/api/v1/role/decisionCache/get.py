@@ -0,0 +1,35 @@
+from fastapi import HTTPException, status
+import logging
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.permit.decision_cache import permission_decisions
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Roles"],
+        "summary": "Get Permission Decision Cache Metrics",
+        "response_model": dict,
+        "description": "Size, hit rate, evictions and invalidations of the local cache of Permit.io permission decisions in this process.",
+        "response_description": "Decision cache metrics",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main():
+    try:
+        return {
+            "status": "success",
+            "message": "Permission decision cache metrics retrieved",
+            "data": permission_decisions.stats()
+        }
+    except Exception as e:
+        logger.exception(f"Error retrieving permission decision cache metrics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve decision cache metrics: {str(e)}"
+        )
@@ -0,0 +1,36 @@
+from fastapi import HTTPException, status
+import logging
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.core.authentication.cred_load import POLICY_MODE
+from src.services.permit.policy_engine import policy_engine
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Roles"],
+        "summary": "Get Embedded Policy Engine Metrics",
+        "response_model": dict,
+        "description": "Policy mode, size and age of the in-process role/permission matrix, checks, reloads and mismatches against Permit.io in this process.",
+        "response_description": "Policy engine metrics",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main():
+    try:
+        return {
+            "status": "success",
+            "message": "Policy engine metrics retrieved",
+            "data": {"mode": POLICY_MODE, **policy_engine.stats()}
+        }
+    except Exception as e:
+        logger.exception(f"Error retrieving policy engine metrics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve policy engine metrics: {str(e)}"
+        )
@@ -0,0 +1,56 @@
+from fastapi import HTTPException, Path, Query, status
+import logging
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.sync.change_log import map_change_log
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["Sync"],
+        "summary": "Sync Building Map Changes",
+        "response_model": dict,
+        "description": "Floors, locations, vertical connectors and paths upserted or deleted in a building since the given revision (the version of the client's map bundle or of its last sync). A deleted floor takes its locations and connectors with it. When reset is true the client is too far behind and should download the building map bundle again.",
+        "response_description": "Upserted and deleted entities since the revision",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main(
+    building_id: str = Path(..., description="Building ID to sync"),
+    since: int = Query(..., ge=0, description="Revision the client already has"),
+    published_only: bool = Query(False, description="Treat unpublished locations, connectors and paths as deleted")
+):
+    try:
+        changes = await map_change_log.changes_since(building_id, since, published_only=published_only)
+
+        if changes is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Building with ID '{building_id}' not found"
+            )
+
+        if changes["reset"]:
+            message = f"Revision {since} cannot be synced; download the building map bundle"
+        else:
+            message = f"Changes from revision {since} to {changes['revision']}"
+
+        return {
+            "status": "success",
+            "message": message,
+            "data": changes
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error syncing building {building_id} since revision {since}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to sync building map changes: {str(e)}"
+        )
@@ -0,0 +1,77 @@
+from fastapi import WebSocket, WebSocketDisconnect, status
+import asyncio
+import logging
+from src.datamodel.database.domain.DigitalSignage import Building
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.services.realtime.pubsub import change_hub, building_topic, events_topic
+from src.services.sync.change_log import map_change_log
+
+
+logger = logging.getLogger(__name__)
+
+
+# A ping is sent after this many seconds without a message so idle connections stay open through proxies
+HEARTBEAT_SECONDS = 30
+
+
+def api_config():
+    config = {
+        "path": "",
+        "tags": ["Sync"],
+        "summary": "Live Building Map Changes",
+        "description": "WebSocket pushing a compact notice for every location, floor, connector and path write in the building, and for every event write in the building's organization. Each map notice carries the new revision; call the sync endpoint with the previous one to fetch the changes. An overflow notice means notices were dropped and the client should sync.",
+    }
+    return ApiConfig(**config)
+
+
+async def _receive_until_closed(websocket: WebSocket) -> None:
+    # Clients only need to send pings; anything received is ignored
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+async def _send_changes(websocket: WebSocket, subscription) -> None:
+    while True:
+        try:
+            message = await asyncio.wait_for(subscription.get(), timeout=HEARTBEAT_SECONDS)
+        except asyncio.TimeoutError:
+            message = {"type": "ping"}
+        await websocket.send_json(message)
+
+
+async def main(websocket: WebSocket, building_id: str):
+    building = await Building.find_one({"building_id": building_id, "status": "active"})
+    if not building:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=f"Building with ID '{building_id}' not found")
+        return
+
+    await websocket.accept()
+    # Subscribe before reading the revision so no change between the two is missed
+    topics = [building_topic(building_id)]
+    if building.entity_uuid:
+        topics.append(events_topic(building.entity_uuid))
+    subscription = change_hub.subscribe(topics)
+    tasks = []
+    try:
+        await websocket.send_json({
+            "type": "hello",
+            "building_id": building_id,
+            "revision": await map_change_log.current_revision(building_id),
+        })
+        tasks = [
+            asyncio.create_task(_receive_until_closed(websocket)),
+            asyncio.create_task(_send_changes(websocket, subscription)),
+        ]
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if not task.cancelled() and task.exception() and not isinstance(task.exception(), WebSocketDisconnect):
+                logger.error(f"Live map connection for building {building_id} failed: {task.exception()}")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        subscription.close()
@@ -11,6 +11,8 @@ from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.services.permit.permit_service import PermitService
+from src.core.database.curd.user import delete_user as delete_user_row
+from src.services.identity.user_cache import user_identities
 from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
@@ -100,6 +102,7 @@ async def delete_user(user_id: str, db: AsyncSession, current_user: User):
             await db.delete(mapping)
 
         await db.commit()    
+        user_identities.invalidate(user_to_delete.user_uuid)
 
         # Delete from Permit.io if entity_key was found
         if entity_key:
@@ -110,8 +113,7 @@ async def delete_user(user_id: str, db: AsyncSession, current_user: User):
             )
 
         # Delete the user
-        await db.delete(user_to_delete)
-        await db.commit()
+        await delete_user_row(db, user_to_delete)
 
         return {
             "message": f"User with ID {user_id} deleted successfully"
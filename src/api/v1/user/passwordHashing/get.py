@@ -0,0 +1,35 @@
+from fastapi import HTTPException, status
+import logging
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.core.authentication.password_hashing import password_hasher
+
+logger = logging.getLogger(__name__)
+
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 200,
+        "tags": ["User"],
+        "summary": "Get Password Hashing Metrics",
+        "response_model": dict,
+        "description": "Scheme, worker pool size, queue depth, rejections, rehashes and average wait/run time of password hashing in this process.",
+        "response_description": "Password hashing metrics",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+
+async def main():
+    try:
+        return {
+            "status": "success",
+            "message": "Password hashing metrics retrieved",
+            "data": password_hasher.stats()
+        }
+    except Exception as e:
+        logger.exception(f"Error retrieving password hashing metrics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve password hashing metrics: {str(e)}"
+        )
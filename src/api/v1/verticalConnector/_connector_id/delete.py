@@ -4,6 +4,8 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import VerticalConnector, Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, connector_key
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,7 @@ async def main(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Vertical connector with ID '{connector_id}' not found"
             )
+        counted_before = connector_key(existing_connector)
 
         # Mark connector as inactive (soft delete)
         existing_connector.status = "inactive"
@@ -62,6 +65,8 @@ async def main(
             logger.warning(f"Failed to update floor vertical_connectors list: {str(floor_update_error)}")
             # Don't fail the deletion if floor update fails
         
+        await map_counters.connector_changed(counted_before, connector_key(existing_connector))
+        await mapStateModify("vertical_connector", connector_id, floor_ids=[existing_connector.floor_id])
         logger.info(f"Vertical connector deleted successfully: {connector_id}")
 
         return {
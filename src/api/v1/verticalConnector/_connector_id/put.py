@@ -5,6 +5,8 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import VerticalConnector, ShapeType, ConnectorType
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, connector_key
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +88,7 @@ async def main(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Vertical connector with ID '{connector_id}' not found"
             )
+        counted_before = connector_key(existing_connector)
 
         # Validate shape-specific requirements if shape is being updated
         if connector_data.shape:
@@ -156,6 +159,8 @@ async def main(
         
         await existing_connector.save()
         
+        await map_counters.connector_changed(counted_before, connector_key(existing_connector))
+        await mapStateModify("vertical_connector", connector_id, floor_ids=[existing_connector.floor_id])
         logger.info(f"Vertical connector updated successfully: {connector_id}")
 
         # Prepare response
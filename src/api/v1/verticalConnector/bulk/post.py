@@ -0,0 +1,194 @@
+from fastapi import HTTPException, status
+from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Set, Tuple
+from collections import defaultdict
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+import time
+import logging
+from src.datamodel.database.domain.DigitalSignage import VerticalConnector, ShapeType, ConnectorType, Floor
+from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, connector_key
+
+logger = logging.getLogger(__name__)
+
+def api_config():
+    config = {
+        "path": "",
+        "status_code": 201,
+        "tags": ["Vertical Connector"],
+        "summary": "Bulk Create Vertical Connectors",
+        "response_model": dict,
+        "description": "Create many vertical connectors at once. Floors and name conflicts are checked for the whole batch up front; valid connectors are inserted together and failures are reported per item.",
+        "response_description": "Bulk creation results with success and failure details",
+        "deprecated": False,
+    }
+    return ApiConfig(**config)
+
+class VerticalConnectorCreateData(BaseModel):
+    name: str = Field(..., description="Name of the connector (e.g., 'Elevator A', 'Main Stairs')")
+    shared_id: str = Field(..., description="Shared identifier across floors (e.g., 'elv-a', 'stairs-1')")
+    connector_type: ConnectorType = Field(..., description="Type of vertical connector")
+    floor_id: str = Field(..., description="ID of the floor this connector instance belongs to")
+    shape: ShapeType = Field(..., description="Shape type - circle or rectangle")
+    x: float = Field(..., description="X coordinate position")
+    y: float = Field(..., description="Y coordinate position")
+    width: Optional[float] = Field(None, description="Width for rectangle shape")
+    height: Optional[float] = Field(None, description="Height for rectangle shape")
+    radius: Optional[float] = Field(None, description="Radius for circle shape")
+    color: str = Field(default="#8b5cf6", description="Color for connector display")
+    is_published: bool = Field(default=True, description="Whether connector is published")
+
+    @validator('width', 'height', always=True)
+    def validate_rectangle_dimensions(cls, v, values):
+        if values.get('shape') == ShapeType.RECTANGLE and not v:
+            raise ValueError('Width and height are required for rectangle shape')
+        return v
+
+    @validator('radius', always=True)
+    def validate_circle_radius(cls, v, values):
+        if values.get('shape') == ShapeType.CIRCLE and not v:
+            raise ValueError('Radius is required for circle shape')
+        return v
+
+    @validator('color')
+    def validate_color_format(cls, v):
+        if v and not v.startswith('#'):
+            raise ValueError('Color must be in hex format (e.g., #8b5cf6)')
+        if v and len(v) != 7:
+            raise ValueError('Color must be 7 characters long including # (e.g., #8b5cf6)')
+        return v
+
+    class Config:
+        allow_population_by_field_name = True
+
+class BulkVerticalConnectorCreateRequest(BaseModel):
+    connectors: List[VerticalConnectorCreateData] = Field(..., description="Connectors to create")
+    created_by: Optional[str] = Field(None, description="User who created the connectors")
+
+    @validator('connectors')
+    def validate_connectors_not_empty(cls, v):
+        if not v:
+            raise ValueError('At least one connector must be provided')
+        return v
+
+class ConnectorCreateResult(BaseModel):
+    index: int
+    name: str
+    floor_id: str
+    status: str  # "success" or "failed"
+    message: str
+    connector_id: Optional[str] = None
+    shared_id: Optional[str] = None
+
+async def main(bulk_data: BulkVerticalConnectorCreateRequest):
+    try:
+        items = bulk_data.connectors
+        results: Dict[int, ConnectorCreateResult] = {}
+
+        def fail(index: int, message: str) -> None:
+            results[index] = ConnectorCreateResult(
+                index=index,
+                name=items[index].name,
+                floor_id=items[index].floor_id,
+                status="failed",
+                message=message
+            )
+
+        # Every referenced floor and every (floor, name) pair in two queries
+        floor_ids = list({item.floor_id for item in items})
+        floors = await Floor.find({"floor_id": {"$in": floor_ids}, "status": "active"}).to_list()
+        active_floors = {floor.floor_id for floor in floors}
+        taken = await VerticalConnector.find({
+            "floor_id": {"$in": floor_ids},
+            "name": {"$in": list({item.name for item in items})},
+            "status": "active"
+        }).to_list()
+        taken_names: Set[Tuple[str, str]] = {(conn.floor_id, conn.name) for conn in taken}
+
+        now = time.time()
+        pending: List[Tuple[int, VerticalConnector]] = []
+        seen: Set[Tuple[str, str]] = set()
+        for index, item in enumerate(items):
+            key = (item.floor_id, item.name)
+            if item.floor_id not in active_floors:
+                fail(index, f"Floor with ID '{item.floor_id}' not found")
+            elif key in taken_names:
+                fail(index, f"Vertical connector with name '{item.name}' already exists on this floor")
+            elif key in seen:
+                fail(index, f"Vertical connector with name '{item.name}' appears more than once for this floor")
+            else:
+                seen.add(key)
+                pending.append((index, VerticalConnector(
+                    **item.dict(),
+                    created_by=bulk_data.created_by,
+                    datetime=now,
+                    status="active"
+                )))
+
+        failed_positions: Set[int] = set()
+        if pending:
+            try:
+                await VerticalConnector.insert_many([conn for _, conn in pending], ordered=False)
+            except BulkWriteError as bwe:
+                for error in bwe.details.get("writeErrors", []):
+                    failed_positions.add(error["index"])
+                    fail(pending[error["index"]][0], f"Internal error: {error.get('errmsg', 'Write failed')}")
+
+        created = [(index, conn) for position, (index, conn) in enumerate(pending) if position not in failed_positions]
+        by_floor: Dict[str, List[str]] = defaultdict(list)
+        for index, conn in created:
+            by_floor[conn.floor_id].append(conn.connector_id)
+            results[index] = ConnectorCreateResult(
+                index=index,
+                name=conn.name,
+                floor_id=conn.floor_id,
+                status="success",
+                message="Vertical connector created successfully",
+                connector_id=conn.connector_id,
+                shared_id=conn.shared_id
+            )
+
+        if by_floor:
+            # One round trip appends the new IDs to every floor's vertical_connectors list
+            await Floor.get_motor_collection().bulk_write([
+                UpdateOne(
+                    {"floor_id": floor_id},
+                    {
+                        "$addToSet": {"vertical_connectors": {"$each": connector_ids}},
+                        "$set": {"updated_by": bulk_data.created_by, "update_on": now}
+                    }
+                )
+                for floor_id, connector_ids in by_floor.items()
+            ], ordered=False)
+            await map_counters.connectors_changed((None, connector_key(conn)) for _, conn in created)
+            await mapStateModify(
+                "vertical_connector",
+                floor_ids=list(by_floor),
+                entity_ids=[conn.connector_id for _, conn in created]
+            )
+
+        successful = len(created)
+        failed = len(items) - successful
+        logger.info(f"Bulk connector creation completed: {successful} successful, {failed} failed")
+
+        return {
+            "status": "completed",
+            "message": f"Bulk connector creation completed: {successful} successful, {failed} failed",
+            "data": {
+                "total_requested": len(items),
+                "successful_creations": successful,
+                "failed_creations": failed,
+                "results": [results[index] for index in range(len(items))]
+            }
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"Error in bulk vertical connector creation: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create vertical connectors: {str(e)}"
+        )
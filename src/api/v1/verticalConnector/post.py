@@ -5,6 +5,8 @@ import time
 import logging
 from src.datamodel.database.domain.DigitalSignage import VerticalConnector, ShapeType, ConnectorType, Floor
 from src.datamodel.datavalidation.apiconfig import ApiConfig
+from src.utility.mapStateModified import mapStateModify
+from src.services.statistics.counters import map_counters, connector_key
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +155,8 @@ async def main(connector_data: VerticalConnectorCreateRequest):
             floor.update_on = time.time()
             await floor.save()
         
+        await map_counters.connector_changed(None, connector_key(new_connector))
+        await mapStateModify("vertical_connector", new_connector.connector_id, floor_ids=[new_connector.floor_id])
         logger.info(f"Vertical connector created successfully: {new_connector.connector_id} on floor: {connector_data.floor_id}")
 
         # Prepare response
@@ -9,9 +9,12 @@ import uuid
 import logging
 from typing import Annotated, Optional
 from src.core.authentication.cred_load import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, SESSION_COOKIE_NAME
+from src.core.authentication.token_cache import verified_tokens
+from src.services.identity.user_cache import user_identities
 from src.datamodel.database.userauth.AuthenticationTables import User, Entity, Role, UserEntityRoleMap
 from src.core.database.dbs.getdb import postresql as db
-from src.core.database.curd.user import get_user, add_user, DuplicateError
+from src.core.database.curd.user import get_user, add_user, DuplicateError, update_user_password
+from src.core.authentication.password_hashing import password_hasher
 from src.datamodel.datavalidation.user import UserDetails
 from src.services.otp_generation.otp_service import OTPService
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -29,8 +32,9 @@ class BearAuthException(Exception):
     pass
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = password_hasher.context
 
+# Blocking; async handlers should await password_hasher instead
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -50,13 +54,23 @@ async def authenticate_user(db: AsyncSession, username: str, password:str, provi
         return False
     elif user and auth_flow == 'thrid_party':
         return user
-    elif not verify_password(password, user.password_hash) and auth_flow == 'login':
-        print("Wrong password")
-        raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Incorrect username or password",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+    elif auth_flow == 'login':
+        valid, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+        if not valid:
+            print("Wrong password")
+            raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Incorrect username or password",
+                        headers={"WWW-Authenticate": "Bearer"},
+                    )
+        if new_hash:
+            # Stored with outdated parameters; upgrade it while the plain password is at hand
+            try:
+                await update_user_password(db, user, new_hash)
+            except Exception as e:
+                await db.rollback()
+                logger.warning(f"Could not upgrade password hash for {user.user_uuid}: {str(e)}")
+        return user
     elif user and auth_flow == 'signup':
         raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT,
@@ -96,6 +110,11 @@ def get_token_payload(session_token: str = Depends(COOKIE)):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Session token is missing"
             )
+        # Tokens already verified are answered from the cache until their exp
+        claims = verified_tokens.get(session_token)
+        if claims is not None:
+            return claims
+
         # payload = jwt.decode(session_token, SECRET_KEY, algorithms=[ALGORITHMS.HS256])
         payload = jwt.decode(session_token, SECRET_KEY, algorithms=[ALGORITHM])
 
@@ -110,7 +129,7 @@ def get_token_payload(session_token: str = Depends(COOKIE)):
 
         if username is None or provider is None:
             raise BearAuthException("Token could not be validated")
-        return {
+        claims = {
             "username": username,
             "provider": provider,
             "role_id": role_id,
@@ -120,6 +139,8 @@ def get_token_payload(session_token: str = Depends(COOKIE)):
             "entity_uuid": entity_uuid,
             "entity_key": entity_key
         }
+        verified_tokens.put(session_token, claims, exp=payload.get("exp"))
+        return claims
     except JWTError as e:
         raise BearAuthException(f"Token could not be validated: {e}")
 
@@ -145,7 +166,12 @@ async def get_current_user(db: AsyncSession = Depends(db), token_payload: dict =
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Token payload is missing required information"
         )
-    user = await get_user(db, username=username, provider=provider)
+    user_uuid = token_payload.get('user_uuid')
+    if user_uuid:
+        # Cached by user_uuid; the session only opens a connection on a miss
+        user = await user_identities.get_user(db, user_uuid)
+    else:
+        user = await get_user(db, username=username, provider=provider)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -54,9 +54,19 @@ SPOTIFY_CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
 
 PERMIT_API_KEY = os.getenv("PERMIT_API_KEY")
 PERMIT_PDP = os.getenv("PERMIT_PDP")
+# remote: every check goes to Permit.io; embedded: checks run on the roles mirrored in Postgres;
+# shadow: embedded, with each decision also checked against Permit.io in the background
+POLICY_MODE = os.getenv("POLICY_MODE", "remote").lower()
 
 RESET_PASSWORD_EXPIRE_MINUTES = os.getenv("RESET_PASSWORD_EXPIRE_MINUTES", 120)
 
+# Password hashing: new hashes use PASSWORD_HASH_SCHEME (bcrypt or argon2); hashes made with
+# other schemes or weaker bcrypt rounds still verify and are replaced on the next login
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt").lower()
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+PASSWORD_HASH_MAX_WAITING = int(os.getenv("PASSWORD_HASH_MAX_WAITING", 256))
+
 # MinIO configuration - use environment variables in production
 MINIO_ENDPOINT = os.getenv("MINIO_ENDPOINT")
 MINIO_ACCESS_KEY = os.getenv("MINIO_ACCESS_KEY")
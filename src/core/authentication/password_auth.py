@@ -26,8 +26,9 @@ from src.core.authentication.authentication import (
 )
 from src.core.database.dbs.getdb import postresql as db
 from src.datamodel.datavalidation.user import User, UserSignUp, UserLogin, Token
-from src.core.database.curd.user import add_user, DuplicateError , get_user
+from src.core.database.curd.user import add_user, DuplicateError , get_user, update_user_password
 from src.core.authentication.authentication import verify_password, get_token_payload
+from src.core.authentication.password_hashing import password_hasher
 from src.datamodel.database.userauth.AuthenticationTables import Role
 
 
@@ -61,7 +62,7 @@ async def create_user(user_signup: UserSignUp, db: AsyncSession = Depends(db)):
     # if hasattr(user_signup, 'phone_number') and user_signup.phone_number is None:
     #     user_signup.phone_number = None  # Explicitly set to None
 
-    user_signup.password = get_password_hash(user_signup.password)
+    user_signup.password = await password_hasher.hash(user_signup.password)
     try:
         access_token = await login_flow(user=user_signup, db=db, auth_flow="signup")
 
@@ -421,9 +422,8 @@ async def reset_password(reset_data: PasswordResetConfirm, db: AsyncSession = De
             raise HTTPException(status_code=404, detail="User not found")
         
         # Update password
-        hashed_password = get_password_hash(reset_data.password)
-        user.password_hash = hashed_password
-        await db.commit()
+        hashed_password = await password_hasher.hash(reset_data.password)
+        await update_user_password(db, user, hashed_password)
         
         return {"message": "Password has been reset successfully"}
     
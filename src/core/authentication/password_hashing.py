@@ -0,0 +1,120 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import time
+import logging
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from src.core.authentication.cred_load import (
+    PASSWORD_HASH_SCHEME,
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_MAX_WAITING,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_crypt_context(scheme: str = PASSWORD_HASH_SCHEME, bcrypt_rounds: int = BCRYPT_ROUNDS) -> CryptContext:
+    # The first scheme hashes; the others only verify and are marked deprecated, so they get rehashed
+    schemes = ["argon2", "bcrypt"] if scheme == "argon2" else ["bcrypt"]
+    return CryptContext(schemes=schemes, deprecated="auto", bcrypt__rounds=bcrypt_rounds)
+
+
+class PasswordHasher:
+    """
+    Password hashing and verification on a dedicated thread pool, so a login storm never blocks
+    the event loop. At most `workers` hashes run at once; callers beyond `max_waiting` queued
+    ones are turned away with a 503 instead of piling up.
+    """
+
+    def __init__(
+        self,
+        context: Optional[CryptContext] = None,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_waiting: int = PASSWORD_HASH_MAX_WAITING,
+    ):
+        self.context = context or build_crypt_context()
+        self.workers = max(1, workers)
+        self.max_waiting = max_waiting
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.waiting = 0
+        self.running = 0
+        self.max_waiting_seen = 0
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    async def _run(self, fn: Callable, *args) -> Any:
+        if self.waiting >= self.max_waiting:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password operations in progress, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.workers)
+
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        self.max_waiting_seen = max(self.max_waiting_seen, self.waiting)
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        started_at = time.perf_counter()
+        self.total_wait_seconds += started_at - queued_at
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.total_run_seconds += time.perf_counter() - started_at
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify(self, password: str, password_hash: Optional[str]) -> bool:
+        if not password or not password_hash:
+            return False
+        return await self._run(self.context.verify, password, password_hash)
+
+    async def verify_and_update(self, password: str, password_hash: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and, when its hash uses an outdated scheme or cost, return a new hash
+        with the current parameters (otherwise None) for the caller to store.
+        """
+        if not password or not password_hash:
+            return False, None
+        valid, new_hash = await self._run(self.context.verify_and_update, password, password_hash)
+        if valid and new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "scheme": self.context.default_scheme(),
+            "workers": self.workers,
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "max_waiting_seen": self.max_waiting_seen,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+
+# Create global instance
+password_hasher = PasswordHasher()
@@ -0,0 +1,76 @@
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Most verified tokens kept; least recently used are evicted first
+MAX_CACHED_TOKENS = 10000
+
+# A verified token is reused at most this long, even when its exp is later or missing
+TOKEN_CACHE_MAX_SECONDS = 900
+
+
+class TokenEntry:
+    __slots__ = ("claims", "expires_at")
+
+    def __init__(self, claims: Dict[str, Any], expires_at: float):
+        self.claims = claims
+        self.expires_at = expires_at
+
+
+class VerifiedTokenCache:
+    """
+    Claims of tokens whose signature was already verified, so the many identical kiosk tokens
+    skip jwt.decode. An entry is dropped at the token's exp; only valid tokens are stored.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_TOKENS, max_seconds: float = TOKEN_CACHE_MAX_SECONDS):
+        self.max_entries = max_entries
+        self.max_seconds = max_seconds
+        self._entries: "OrderedDict[str, TokenEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(token)
+        if entry is None or entry.expires_at <= time.time():
+            if entry is not None:
+                del self._entries[token]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        # Callers get their own copy so one request cannot change another's claims
+        return dict(entry.claims)
+
+    def put(self, token: str, claims: Dict[str, Any], exp: Optional[float] = None) -> None:
+        expires_at = time.time() + self.max_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        self._entries[token] = TokenEntry(dict(claims), expires_at)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+# Create global instance
+verified_tokens = VerifiedTokenCache()
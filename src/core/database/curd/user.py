@@ -8,6 +8,7 @@ import time
 from src.datamodel.datavalidation.user import UserDetails, UserUpdate,Token
 from src.datamodel.database.userauth.AuthenticationTables import User , Role,UserEntityRoleMap, Entity
 from src.services.permit.permit_service import PermitService
+from src.services.identity.user_cache import user_identities
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -111,6 +112,7 @@ async def add_user(db: AsyncSession, user: UserDetails) :
         db.add(user_table)
         await db.commit()
         await db.refresh(user_table)
+        user_identities.invalidate(user_table.user_uuid)
     
 
     except IntegrityError as e:
@@ -134,6 +136,19 @@ async def get_user(db: AsyncSession, username: str, provider: str = 'local'):
     user = result.scalar_one_or_none()
     return user
 
+async def update_user_password(db: AsyncSession, user: User, password_hash: str):
+    user.password_hash = password_hash
+    await db.commit()
+    user_identities.invalidate(user.user_uuid)
+    return user
+
+
+async def delete_user(db: AsyncSession, user: User):
+    await db.delete(user)
+    await db.commit()
+    user_identities.invalidate(user.user_uuid)
+
+
 # def get_password(db: Session, user_uuid: int):
 #     password = db.query(Password).filter(Password.user_uuid == user_uuid).first()
 #     return password.password_hash
@@ -179,6 +194,7 @@ def update_user(db: Session, user: UserUpdate):
                 role_user_map = RoleUserMap(user_uuid=user_details.user_uuid, role_id=role.role_id, created_on=datetime.utcnow())
                 db.add(role_user_map)
         db.commit() 
+        user_identities.invalidate_username(user.username, provider)
     except IntegrityError as e:
         db.rollback()
         logger.error(f'Following error occured while commiting to DB: {e}')
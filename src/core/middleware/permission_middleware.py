@@ -1,44 +1,55 @@
 from fastapi import Request, HTTPException, status, Depends
 # from src.core.permit.permit_service import PermitService
 from src.services.permit.permit_service import PermitService
-from src.core.authentication.cred_load import Actions, Resources, SECRET_KEY, ALGORITHM
+from src.services.permit.policy_engine import policy_engine
+from src.core.authentication.cred_load import Actions, Resources, SECRET_KEY, ALGORITHM, POLICY_MODE
 from src.core.authentication.authentication import get_current_user, get_token_payload
+from src.core.middleware.token_validate_middleware import token_claims
 from jose import jwt
 from src.datamodel.database.userauth.AuthenticationTables import Entity, Address, User, Role, UserEntityRoleMap
 from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy.sql import select
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+
+logger = logging.getLogger(__name__)
 
 permit_service = PermitService()
 
+
+async def _check_permission(user_uuid: str, entity_uuid: str, username: str, entity_key: str, resource: str, action: str) -> bool:
+    def remote_check():
+        return permit_service.check_permission(
+            user_id=username,
+            action=action,
+            resource=resource,
+            org_id=entity_key
+        )
+
+    if POLICY_MODE not in ("embedded", "shadow"):
+        return await remote_check()
+
+    try:
+        allowed = await policy_engine.allows(user_uuid, entity_uuid, resource, action)
+    except Exception as e:
+        # Roles could never be loaded from Postgres; Permit.io still answers
+        logger.error(f"Embedded policy check failed, asking Permit.io: {str(e)}")
+        return await remote_check()
+
+    if POLICY_MODE == "shadow":
+        policy_engine.check_consistency(allowed, remote_check, f"{username} {action} {resource} in {entity_key}")
+    return allowed
+
 async def verify_permissions(
     request: Request,
     resource: str,
     action: str,
 ):
-    # Get token from request
-    auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing authentication token")
-        
-    try:
-        token_type, token = auth_header.split()
-        if token_type.lower() != "bearer":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token format"
-            )
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token format"
-        )
-    
-    try:
-        # Validate token and get user
-        token_payload = get_token_payload(token)
+    # Verified once per request; claims and context are kept on request.state
+    token_payload = token_claims(request)
 
+    try:
         entity_uuid = token_payload.get("entity_uuid")
         entity_key = token_payload.get("entity_key")
         user_uuid = token_payload.get("user_uuid")
@@ -47,12 +58,14 @@ async def verify_permissions(
         
 
         
-        # Check permission with Permit.io
-        has_permission = await permit_service.check_permission(
-            user_id=username,
-            action=action,  # Use the parameter
+        # Check permission in process or with Permit.io, depending on POLICY_MODE
+        has_permission = await _check_permission(
+            user_uuid,
+            entity_uuid,
+            username,
+            entity_key,
             resource=resource,  # Use the parameter
-            org_id=entity_key
+            action=action,  # Use the parameter
         )
 
         if not has_permission:
@@ -61,10 +74,6 @@ async def verify_permissions(
                 detail=f"Not authorized to {action} {resource}"
             )
         
-        # Add context to request state
-        request.state.user_uuid = user_uuid
-        request.state.entity_uuid = entity_uuid
-        
         return has_permission  # Return something to satisfy the dependency
 
     except Exception as e:
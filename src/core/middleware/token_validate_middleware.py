@@ -5,14 +5,12 @@ from src.core.database.dbs.getdb import postresql as db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-def validate_token(
-    request: Request,
-):
+def bearer_token(request: Request) -> str:
     # Get token from request
     auth_header = request.headers.get("Authorization")
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing authentication token")
-        
+
     try:
         token_type, token = auth_header.split()
         if token_type.lower() != "bearer":
@@ -25,41 +23,51 @@ def validate_token(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token format"
         )
-    
-    try:
-        # Validate token and get user
-        token_payload = get_token_payload(token)
+    return token
 
-        entity_uuid = token_payload.get("entity_uuid")
-        user_uuid = token_payload.get("user_uuid")
-        role_id = token_payload.get("role_id")
-        username = token_payload.get("username")
-        first_name = token_payload.get("first_name")
-        last_name = token_payload.get("last_name")
-        entity_key = token_payload.get("entity_key")
-        provider = token_payload.get("provider")
-        
-        if not entity_uuid:
-            raise HTTPException(status_code=403, detail="entity_uuid not associated with any entity")
 
-        if not user_uuid:
-            raise HTTPException(status_code=403, detail="user_uuid not associated with any user")
-        
-        # Add context to request state
-        request.state.user_uuid = user_uuid
-        request.state.entity_uuid = entity_uuid
-        request.state.role_id = role_id
-        request.state.username = username
-        request.state.first_name = first_name
-        request.state.last_name = last_name
-        request.state.entity_key = entity_key
-        request.state.provider = provider
-        
-        
-        return True
+def token_claims(request: Request) -> dict:
+    """
+    Verify the request's bearer token once and keep its claims on request.state;
+    later calls in the same request (validate_token, verify_permissions) reuse them.
+    """
+    claims = getattr(request.state, "token_claims", None)
+    if claims is not None:
+        return claims
 
+    token = bearer_token(request)
+    try:
+        # Validate token and get user
+        claims = get_token_payload(token)
     except Exception as e:
         raise HTTPException(
-                status_code=403, 
+                status_code=403,
                 detail=f"Token validation failed: {str(e)}"
             )
+
+    # Add context to request state
+    request.state.token_claims = claims
+    request.state.user_uuid = claims.get("user_uuid")
+    request.state.entity_uuid = claims.get("entity_uuid")
+    request.state.role_id = claims.get("role_id")
+    request.state.username = claims.get("username")
+    request.state.first_name = claims.get("first_name")
+    request.state.last_name = claims.get("last_name")
+    request.state.entity_key = claims.get("entity_key")
+    request.state.provider = claims.get("provider")
+    return claims
+
+
+async def validate_token(
+    request: Request,
+) -> dict:
+    # Async so FastAPI runs it on the event loop instead of a threadpool worker
+    claims = token_claims(request)
+
+    if not claims.get("entity_uuid"):
+        raise HTTPException(status_code=403, detail="entity_uuid not associated with any entity")
+
+    if not claims.get("user_uuid"):
+        raise HTTPException(status_code=403, detail="user_uuid not associated with any user")
+
+    return claims
@@ -120,6 +120,9 @@ class RouteBuilder:
                         self.router.put(**api_config)(self.__async_decorator(endpoint_function) if is_async else self.__sync_decorator(endpoint_function))
                     elif crud_op == 'patch':
                         self.router.patch(**api_config)(self.__async_decorator(endpoint_function) if is_async else self.__sync_decorator(endpoint_function))
+                    elif crud_op == 'websocket':
+                        # HTTP error handling does not apply once the socket is accepted
+                        self.router.websocket(api_config['path'])(endpoint_function)
         except Exception as err:
             logger.error(f"Error setting endpoints at {getattr(func, '__file__')}: {err}")
             traceback.print_exc()
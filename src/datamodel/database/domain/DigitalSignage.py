@@ -1,4 +1,5 @@
 from beanie import Document, Indexed
+from pymongo import IndexModel
 from pydantic import Field, BaseModel
 from typing import Optional, Dict, List, Any
 from enum import Enum
@@ -289,3 +290,81 @@ class Path(Document):
                 if p.kind == NodeKind.VERTICAL_CONNECTOR and p.shared_id:
                     shared_ids.append(p.shared_id)
         self.connector_shared_ids = sorted(set(shared_ids))
+
+
+# -----------------------------
+# Navigation Models
+# -----------------------------
+
+class NavigationRequest(BaseModel):
+    source_location_id: str = Field(..., description="Location the route starts from")
+    destination_location_id: str = Field(..., description="Location the route ends at")
+    preferred_connector_type: Optional[str] = Field(None, description="Preferred vertical connector type (elevator, stairs, escalator)")
+
+
+class MultiFloorRoute(BaseModel):
+    total_floors: int = Field(..., description="Number of distinct floors the route touches")
+    route_segments: List[Dict[str, Any]] = Field(default_factory=list, description="Horizontal walking segments, one per floor leg")
+    vertical_transitions: List[Dict[str, Any]] = Field(default_factory=list, description="Vertical connector hops between floors")
+    estimated_time: int = Field(0, description="Estimated travel time in minutes")
+
+
+# -----------------------------
+# Counter Models
+# -----------------------------
+
+class CounterScope(str, Enum):
+    BUILDING = "building"
+    FLOOR = "floor"
+
+
+class MapCounters(Document):
+    scope: CounterScope = Field(..., description="Whether the counters cover a building or a floor")
+    scope_id: str = Field(..., description="building_id or floor_id the counters belong to")
+    locations: int = Field(default=0, description="Active locations")
+    vertical_connectors: int = Field(default=0, description="Active vertical connectors")
+    paths: int = Field(default=0, description="Active paths (per floor: active paths with a segment on the floor)")
+    categories: Dict[str, int] = Field(default_factory=dict, description="Active locations per category")
+    statuses: Dict[str, int] = Field(default_factory=dict, description="Locations per status, deleted included")
+    initialized: bool = Field(default=False, description="False until counts have been rebuilt from source documents")
+    seq: int = Field(default=0, description="Bumped by every increment, so a rebuild can tell whether one landed while it counted")
+    rebuilt_at: Optional[float] = Field(None, description="Timestamp of the last rebuild from source documents")
+    update_on: Optional[float] = Field(None, description="Timestamp of last update")
+
+    class Settings:
+        name = "counters"
+        indexes = [
+            IndexModel([("scope", 1), ("scope_id", 1)], unique=True),  # one counters document per scope
+        ]
+
+
+# -----------------------------
+# Map Version Models
+# -----------------------------
+
+class MapVersion(Document):
+    building_id: str = Field(..., description="Building the version belongs to")
+    version: int = Field(default=0, description="Incremented on every write to the building's floors, locations, connectors or paths")
+    update_on: Optional[float] = Field(None, description="Timestamp of last increment")
+
+    class Settings:
+        name = "map_versions"
+        indexes = [
+            IndexModel([("building_id", 1)], unique=True),  # one version document per building
+        ]
+
+
+class MapChangeEntry(Document):
+    building_id: str = Field(..., description="Building the change belongs to")
+    revision: int = Field(..., description="Building map version assigned to this change")
+    entity: str = Field(..., description="Changed entity type: location, vertical_connector, path, floor or building")
+    entity_ids: List[str] = Field(default_factory=list, description="IDs of the changed entities; empty when too many to list")
+    floor_ids: List[str] = Field(default_factory=list, description="Floors touched by the change")
+    removed: bool = Field(default=False, description="Whether the changed documents were removed from the database")
+    datetime: float = Field(default_factory=time.time, description="Timestamp of the change")
+
+    class Settings:
+        name = "map_change_log"
+        indexes = [
+            IndexModel([("building_id", 1), ("revision", 1)], unique=True),  # one entry per building revision
+        ]
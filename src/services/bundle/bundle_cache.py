@@ -0,0 +1,124 @@
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from enum import Enum
+import asyncio
+import gzip
+import json
+import time
+import logging
+
+from src.services.bundle.map_bundle import load_building_tree
+from src.services.sync.change_log import map_change_log
+
+logger = logging.getLogger(__name__)
+
+
+# Serialized bundles kept per process; least recently served are evicted first
+MAX_CACHED_BUNDLES = 64
+
+BUNDLE_COMPRESS_LEVEL = 6
+
+BundleKey = Tuple[str, bool]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def bundle_etag(building_id: str, version: int, published_only: bool) -> str:
+    return f'W/"{building_id}.{version}.{"published" if published_only else "all"}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    return any((tag[2:] if tag.startswith("W/") else tag) == opaque for tag in candidates)
+
+
+class MapBundle:
+    """One serialized, gzip-compressed bundle for a building at a given version"""
+
+    def __init__(self, building_id: str, version: int, published_only: bool, body: bytes, size: int):
+        self.building_id = building_id
+        self.version = version
+        self.published_only = published_only
+        self.etag = bundle_etag(building_id, version, published_only)
+        self.body = body
+        self.size = size
+        self.built_at = time.time()
+
+
+class MapBundleCache:
+    """
+    Per-building map bundles, serialized and compressed once per version.
+    The version is the building's change log revision, kept in MongoDB so every process and
+    every restart agrees on it.
+    """
+
+    def __init__(self):
+        self._bundles: "OrderedDict[BundleKey, MapBundle]" = OrderedDict()
+        self._locks: Dict[BundleKey, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def current_version(self, building_id: str) -> int:
+        return await map_change_log.current_revision(building_id)
+
+    async def get_bundle(self, building_id: str, published_only: bool, version: int) -> Optional[MapBundle]:
+        key = (building_id, bool(published_only))
+        bundle = self._cached(key, version)
+        if bundle is not None:
+            return bundle
+
+        async with self._locks[key]:
+            bundle = self._cached(key, version)
+            if bundle is not None:
+                return bundle
+
+            # The version is read before the data, so a write landing in between only labels
+            # newer data with the older version and clients fetch again on their next poll
+            tree = await load_building_tree(building_id, published_only=published_only)
+            if tree is None:
+                self._bundles.pop(key, None)
+                return None
+
+            body = json.dumps({
+                "status": "success",
+                "message": f"Map bundle retrieved for building '{tree['building'].get('name')}'",
+                "data": {"version": version, **tree},
+            }, separators=(",", ":"), default=_json_default).encode("utf-8")
+            bundle = MapBundle(
+                building_id,
+                version,
+                published_only,
+                gzip.compress(body, compresslevel=BUNDLE_COMPRESS_LEVEL),
+                len(body),
+            )
+
+            current = self._bundles.get(key)
+            if current is None or current.version <= version:
+                self._bundles[key] = bundle
+                self._bundles.move_to_end(key)
+                while len(self._bundles) > MAX_CACHED_BUNDLES:
+                    self._bundles.popitem(last=False)
+            logger.info(
+                f"Map bundle built for building {building_id} v{version}: "
+                f"{bundle.size} bytes, {len(bundle.body)} compressed"
+            )
+            return bundle
+
+    def _cached(self, key: BundleKey, version: int) -> Optional[MapBundle]:
+        bundle = self._bundles.get(key)
+        if bundle is None or bundle.version != version:
+            return None
+        self._bundles.move_to_end(key)
+        return bundle
+
+
+# Create global instance
+map_bundle_cache = MapBundleCache()
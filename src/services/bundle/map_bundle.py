@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional
+from collections import defaultdict
+import asyncio
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Building, Floor, Location, VerticalConnector, Path
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Documents are read as plain dicts; the Mongo _id and Beanie revision are not part of the bundle
+RAW_PROJECTION = {"_id": 0, "revision_id": 0}
+
+
+async def find_raw(document, query: Dict[str, Any], sort: Optional[List[tuple]] = None) -> List[Dict[str, Any]]:
+    cursor = document.get_motor_collection().find(query, RAW_PROJECTION)
+    if sort:
+        cursor = cursor.sort(sort)
+    return await cursor.to_list(length=None)
+
+
+async def load_building_tree(building_id: str, published_only: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    The whole map of a building as one floor -> locations/connectors/paths tree.
+    Building and floors are read together, then locations, connectors and paths with one query
+    each for all floors, so the cost does not grow with the number of floors.
+    Single-floor paths sit under their floor; paths crossing floors are listed once at the top.
+    """
+    start = time.time()
+    buildings, floors = await asyncio.gather(
+        find_raw(Building, {"building_id": building_id, "status": "active"}),
+        find_raw(Floor, {"building_id": building_id, "status": "active"}, sort=[("floor_number", 1)]),
+    )
+    if not buildings:
+        return None
+    building = buildings[0]
+
+    floor_ids = [floor["floor_id"] for floor in floors]
+    published = {"is_published": True} if published_only else {}
+    locations, connectors, paths = await asyncio.gather(
+        find_raw(Location, {"floor_id": {"$in": floor_ids}, "status": "active", **published}),
+        find_raw(VerticalConnector, {"floor_id": {"$in": floor_ids}, "status": "active", **published}),
+        find_raw(Path, {"building_id": building_id, "status": "active", **published}),
+    )
+
+    locations_by_floor: Dict[str, List[dict]] = defaultdict(list)
+    for location in locations:
+        locations_by_floor[location["floor_id"]].append(location)
+    connectors_by_floor: Dict[str, List[dict]] = defaultdict(list)
+    for connector in connectors:
+        connectors_by_floor[connector["floor_id"]].append(connector)
+    paths_by_floor: Dict[str, List[dict]] = defaultdict(list)
+    multifloor_paths: List[dict] = []
+    for path in paths:
+        path_floors = set(path.get("floors") or [])
+        if len(path_floors) == 1:
+            paths_by_floor[path_floors.pop()].append(path)
+        else:
+            multifloor_paths.append(path)
+
+    # The ID lists on the floor documents are replaced by the documents themselves
+    tree_floors = []
+    for floor in floors:
+        floor_id = floor["floor_id"]
+        tree_floors.append({
+            **floor,
+            "locations": locations_by_floor.get(floor_id, []),
+            "vertical_connectors": connectors_by_floor.get(floor_id, []),
+            "paths": paths_by_floor.get(floor_id, []),
+        })
+
+    building.pop("floors", None)
+    logger.info(f"Building tree loaded for {building_id} in {time.time() - start:.4f} seconds")
+    return {
+        "building": building,
+        "floors": tree_floors,
+        "multifloor_paths": multifloor_paths,
+        "totals": {
+            "floors": len(floors),
+            "locations": len(locations),
+            "vertical_connectors": len(connectors),
+            "paths": len(paths),
+        },
+    }
@@ -0,0 +1,316 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+from collections import defaultdict
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Location, Floor, Building, VerticalConnector, Path
+)
+from src.utility.mapStateModified import mapStateModify, publishMapChange, FloorDeleted
+from src.services.statistics.counters import map_counters
+
+logger = logging.getLogger(__name__)
+
+
+# Status written by a soft delete; connectors and paths are deactivated rather than deleted
+SOFT_DELETE_STATUS = {
+    "building": "deleted",
+    "floor": "deleted",
+    "location": "deleted",
+    "vertical_connector": "inactive",
+    "path": "inactive",
+}
+
+# Only the fields needed to cascade, update counters and notify listeners are read
+_PROJECTIONS = {
+    "building": {"_id": 0, "building_id": 1, "floors": 1, "status": 1},
+    "floor": {"_id": 0, "floor_id": 1, "building_id": 1, "status": 1},
+    "location": {"_id": 0, "location_id": 1, "name": 1, "floor_id": 1, "category": 1, "status": 1},
+    "vertical_connector": {"_id": 0, "connector_id": 1, "floor_id": 1, "status": 1},
+    "path": {"_id": 0, "path_id": 1, "building_id": 1, "floors": 1, "status": 1},
+}
+
+
+def _in(field: str, ids: Iterable[str]) -> Optional[Dict[str, Any]]:
+    ids = [i for i in dict.fromkeys(ids) if i]
+    return {field: {"$in": ids}} if ids else None
+
+
+async def _find(document, kind: str, clauses: List[Optional[Dict[str, Any]]], session=None) -> List[Dict[str, Any]]:
+    clauses = [c for c in clauses if c]
+    if not clauses:
+        return []
+    query = clauses[0] if len(clauses) == 1 else {"$or": clauses}
+    cursor = document.get_motor_collection().find(query, _PROJECTIONS[kind], session=session)
+    return await cursor.to_list(length=None)
+
+
+class CascadePlan:
+    """
+    Every document a delete reaches, keyed by ID, resolved before anything is written.
+    """
+
+    def __init__(self, hard_delete: bool):
+        self.hard_delete = hard_delete
+        self.buildings: Dict[str, Dict[str, Any]] = {}
+        self.floors: Dict[str, Dict[str, Any]] = {}
+        self.locations: Dict[str, Dict[str, Any]] = {}
+        self.connectors: Dict[str, Dict[str, Any]] = {}
+        self.paths: Dict[str, Dict[str, Any]] = {}
+        self.missing: List[str] = []
+        self.floors_updated: Set[str] = set()
+        self.buildings_updated: Set[str] = set()
+
+    @property
+    def delete_type(self) -> str:
+        return "hard" if self.hard_delete else "soft"
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "buildings": len(self.buildings),
+            "floors": len(self.floors),
+            "locations": len(self.locations),
+            "vertical_connectors": len(self.connectors),
+            "paths": len(self.paths),
+        }
+
+
+class CascadeDeleteEngine:
+    """
+    Set-based deletes for buildings, floors and locations.
+    The affected IDs of every dependent collection are resolved with a few $in queries, then each
+    collection is written once with update_many (soft) or delete_many (hard), optionally inside a
+    transaction. Listeners and counters are notified once the writes have gone through.
+    """
+
+    def _reaches(self, doc: Dict[str, Any], hard_delete: bool) -> bool:
+        # Soft deletes leave already deleted/inactive children untouched
+        return hard_delete or doc.get("status") == "active"
+
+    async def resolve(
+        self,
+        building_ids: Iterable[str] = (),
+        floor_ids: Iterable[str] = (),
+        location_ids: Iterable[str] = (),
+        cascade: bool = True,
+        hard_delete: bool = False,
+        session=None,
+    ) -> CascadePlan:
+        plan = CascadePlan(hard_delete)
+        building_ids, floor_ids, location_ids = list(building_ids), list(floor_ids), list(location_ids)
+
+        for doc in await _find(Building, "building", [_in("building_id", building_ids)], session):
+            plan.buildings[doc["building_id"]] = doc
+
+        floor_docs = await _find(Floor, "floor", [
+            _in("floor_id", floor_ids),
+            _in("building_id", plan.buildings) if cascade else None,
+        ], session)
+        requested_floors = set(floor_ids)
+        for doc in floor_docs:
+            if doc["floor_id"] in requested_floors or self._reaches(doc, hard_delete):
+                plan.floors[doc["floor_id"]] = doc
+
+        requested_locations = set(location_ids)
+        if cascade:
+            location_docs = await _find(Location, "location", [
+                _in("location_id", location_ids),
+                _in("floor_id", plan.floors),
+            ], session)
+            connector_docs = await _find(VerticalConnector, "vertical_connector", [_in("floor_id", plan.floors)], session)
+        else:
+            location_docs = await _find(Location, "location", [_in("location_id", location_ids)], session)
+            connector_docs = []
+
+        for doc in location_docs:
+            if doc["location_id"] in requested_locations or self._reaches(doc, hard_delete):
+                plan.locations[doc["location_id"]] = doc
+        for doc in connector_docs:
+            if self._reaches(doc, hard_delete):
+                plan.connectors[doc["connector_id"]] = doc
+
+        # Paths crossing a removed floor or ending at a removed node can no longer be walked
+        if cascade:
+            endpoints = list(plan.locations) + list(plan.connectors)
+            path_docs = await _find(Path, "path", [
+                _in("building_id", plan.buildings),
+                _in("floors", plan.floors),
+                _in("start_point_id", endpoints),
+                _in("end_point_id", endpoints),
+            ], session)
+            for doc in path_docs:
+                if self._reaches(doc, hard_delete):
+                    plan.paths[doc["path_id"]] = doc
+
+        plan.missing = (
+            [i for i in building_ids if i not in plan.buildings]
+            + [i for i in floor_ids if i not in plan.floors]
+            + [i for i in location_ids if i not in plan.locations]
+        )
+        return plan
+
+    async def apply(self, plan: CascadePlan, updated_by: Optional[str] = None, session=None) -> None:
+        now = time.time()
+        targets = [
+            (Path, "path", "path_id", plan.paths),
+            (VerticalConnector, "vertical_connector", "connector_id", plan.connectors),
+            (Location, "location", "location_id", plan.locations),
+            (Floor, "floor", "floor_id", plan.floors),
+            (Building, "building", "building_id", plan.buildings),
+        ]
+        for document, kind, id_field, docs in targets:
+            if not docs:
+                continue
+            collection = document.get_motor_collection()
+            query = {id_field: {"$in": list(docs)}}
+            if plan.hard_delete:
+                await collection.delete_many(query, session=session)
+            else:
+                await collection.update_many(query, {"$set": {
+                    "status": SOFT_DELETE_STATUS[kind],
+                    "updated_by": updated_by,
+                    "update_on": now,
+                }}, session=session)
+
+        await self._pull_memberships(plan, updated_by, now, session)
+
+    async def _pull_memberships(self, plan: CascadePlan, updated_by: Optional[str], now: float, session=None) -> None:
+        # Connectors and paths leave their floors' lists on any delete, locations and floors only on hard delete
+        pulls = {}
+        if plan.connectors:
+            pulls["vertical_connectors"] = list(plan.connectors)
+        if plan.paths:
+            pulls["paths"] = list(plan.paths)
+        if plan.hard_delete and plan.locations:
+            pulls["locations"] = list(plan.locations)
+
+        if pulls:
+            floors = Floor.get_motor_collection()
+            query = {
+                "floor_id": {"$nin": list(plan.floors)},
+                "$or": [{field: {"$in": ids}} for field, ids in pulls.items()],
+            }
+            holders = await floors.find(query, {"_id": 0, "floor_id": 1}, session=session).to_list(length=None)
+            if holders:
+                plan.floors_updated = {doc["floor_id"] for doc in holders}
+                await floors.update_many(
+                    {"floor_id": {"$in": list(plan.floors_updated)}},
+                    {
+                        "$pull": {field: {"$in": ids} for field, ids in pulls.items()},
+                        "$set": {"updated_by": updated_by, "update_on": now},
+                    },
+                    session=session,
+                )
+
+        if plan.hard_delete and plan.floors:
+            buildings = Building.get_motor_collection()
+            query = {
+                "building_id": {"$nin": list(plan.buildings)},
+                "floors": {"$in": list(plan.floors)},
+            }
+            holders = await buildings.find(query, {"_id": 0, "building_id": 1}, session=session).to_list(length=None)
+            if holders:
+                plan.buildings_updated = {doc["building_id"] for doc in holders}
+                await buildings.update_many(
+                    {"building_id": {"$in": list(plan.buildings_updated)}},
+                    {
+                        "$pull": {"floors": {"$in": list(plan.floors)}},
+                        "$set": {"updated_by": updated_by, "update_on": now},
+                    },
+                    session=session,
+                )
+
+    async def notify(self, plan: CascadePlan) -> None:
+        hard = plan.hard_delete
+
+        # Increment counters for every removed child; floor/building notifications below reset the
+        # counters of removed floors and buildings, so their increments are simply overwritten
+        await map_counters.locations_changed(
+            ((doc.get("floor_id"), doc.get("category"), doc.get("status")),
+             None if hard else (doc.get("floor_id"), doc.get("category"), SOFT_DELETE_STATUS["location"]))
+            for doc in plan.locations.values() if doc.get("floor_id")
+        )
+        await map_counters.connectors_changed(
+            ((doc.get("floor_id"), doc.get("status")),
+             None if hard else (doc.get("floor_id"), SOFT_DELETE_STATUS["vertical_connector"]))
+            for doc in plan.connectors.values() if doc.get("floor_id")
+        )
+        await map_counters.paths_changed(
+            ((doc.get("building_id"), tuple(doc.get("floors") or []), doc.get("status")),
+             None if hard else (doc.get("building_id"), tuple(doc.get("floors") or []), SOFT_DELETE_STATUS["path"]))
+            for doc in plan.paths.values()
+        )
+
+        covered: Set[str] = set()
+        for building_id, doc in plan.buildings.items():
+            floor_ids = list(dict.fromkeys(
+                list(doc.get("floors") or [])
+                + [fid for fid, floor in plan.floors.items() if floor.get("building_id") == building_id]
+            ))
+            covered.update(floor_ids)
+            await mapStateModify("building", building_id, floor_ids=floor_ids, building_id=building_id, removed=hard)
+
+        for floor_id, doc in plan.floors.items():
+            if floor_id in covered:
+                continue
+            covered.add(floor_id)
+            await publishMapChange(FloorDeleted(
+                entity_id=floor_id,
+                floor_ids=[floor_id],
+                building_id=doc.get("building_id"),
+                removed=hard,
+            ))
+
+        for kind, docs in (("location", plan.locations), ("vertical_connector", plan.connectors)):
+            uncovered = {entity_id: doc for entity_id, doc in docs.items() if doc.get("floor_id") not in covered}
+            floor_ids = {doc.get("floor_id") for doc in uncovered.values()} - {None}
+            if floor_ids:
+                await mapStateModify(kind, floor_ids=list(floor_ids), entity_ids=list(uncovered), removed=hard)
+
+        paths_by_building: Dict[Optional[str], Set[str]] = defaultdict(set)
+        path_ids_by_building: Dict[Optional[str], List[str]] = defaultdict(list)
+        for path_id, doc in plan.paths.items():
+            if doc.get("building_id") not in plan.buildings:
+                paths_by_building[doc.get("building_id")].update(doc.get("floors") or [])
+                path_ids_by_building[doc.get("building_id")].append(path_id)
+        for building_id, floor_ids in paths_by_building.items():
+            await mapStateModify(
+                "path",
+                floor_ids=list(floor_ids - covered),
+                building_id=building_id,
+                entity_ids=path_ids_by_building[building_id],
+                removed=hard,
+            )
+
+    async def delete(
+        self,
+        building_ids: Iterable[str] = (),
+        floor_ids: Iterable[str] = (),
+        location_ids: Iterable[str] = (),
+        cascade: bool = True,
+        hard_delete: bool = False,
+        updated_by: Optional[str] = None,
+        use_transaction: bool = False,
+    ) -> CascadePlan:
+        """
+        Resolve and apply a delete. With use_transaction the reads and writes share one Mongo
+        transaction (requires a replica set); otherwise each collection write is independent.
+        """
+        start = time.time()
+        if use_transaction:
+            client = Location.get_motor_collection().database.client
+            async with await client.start_session() as session:
+                async with session.start_transaction():
+                    plan = await self.resolve(building_ids, floor_ids, location_ids, cascade, hard_delete, session)
+                    await self.apply(plan, updated_by, session)
+        else:
+            plan = await self.resolve(building_ids, floor_ids, location_ids, cascade, hard_delete)
+            await self.apply(plan, updated_by)
+
+        await self.notify(plan)
+        logger.info(f"Cascade {plan.delete_type} delete {plan.counts()} in {time.time() - start:.4f} seconds")
+        return plan
+
+
+# Create global instance
+cascade_delete = CascadeDeleteEngine()
@@ -0,0 +1,99 @@
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Type
+import asyncio
+import inspect
+import logging
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+# Events buffered per subscriber; publishers wait when a subscriber falls this far behind
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+# Most events handed to a subscriber in one call
+DEFAULT_BATCH_SIZE = 100
+
+BatchHandler = Callable[[List[BaseModel]], Any]
+
+
+class EventSubscriber:
+    """One handler with its own queue and worker task, so a slow subscriber never delays another"""
+
+    def __init__(self, name: str, event_types: Tuple[Type[BaseModel], ...], handler: BatchHandler, batch_size: int):
+        self.name = name
+        self.event_types = event_types
+        self.handler = handler
+        self.batch_size = batch_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker: Optional[asyncio.Task] = None
+
+    def accepts(self, event: BaseModel) -> bool:
+        return isinstance(event, self.event_types)
+
+    def ensure_started(self) -> None:
+        if self.worker is None or self.worker.done():
+            self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+            self.worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self.queue.get()]
+            # Whatever queued up while the previous batch ran goes out together
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                result = self.handler(batch)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Domain event subscriber {self.name} failed on {len(batch)} event(s): {str(e)}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+
+class DomainEventBus:
+    """
+    Typed domain events delivered to subscribers off the request path. Each subscriber gets the
+    events matching its types in order, in batches; publishing only waits when a subscriber's
+    queue is full.
+    """
+
+    def __init__(self):
+        self._subscribers: List[EventSubscriber] = []
+
+    def subscribe(
+        self,
+        event_types: Tuple[Type[BaseModel], ...],
+        handler: BatchHandler,
+        name: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> EventSubscriber:
+        subscriber = EventSubscriber(name or getattr(handler, "__qualname__", repr(handler)), event_types, handler, batch_size)
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    async def publish(self, event: BaseModel) -> None:
+        for subscriber in list(self._subscribers):
+            if subscriber.accepts(event):
+                subscriber.ensure_started()
+                await subscriber.queue.put(event)
+
+    def pending(self) -> int:
+        """Events queued and not yet handed to a subscriber, over all subscribers"""
+        return sum(
+            subscriber.queue.qsize()
+            for subscriber in self._subscribers
+            if subscriber.queue is not None and subscriber.worker is not None and not subscriber.worker.done()
+        )
+
+    async def drain(self) -> None:
+        """Wait until every published event has been handled"""
+        for subscriber in list(self._subscribers):
+            if subscriber.worker is not None and not subscriber.worker.done():
+                await subscriber.queue.join()
+
+
+# Create global instance
+domain_events = DomainEventBus()
@@ -0,0 +1,138 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import time
+import logging
+
+from sqlalchemy import select, inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.datamodel.database.userauth.AuthenticationTables import User, UserEntityRoleMap
+
+logger = logging.getLogger(__name__)
+
+
+# A user is reused for this long; writes through curd/user.py invalidate sooner
+USER_CACHE_TTL_SECONDS = 60
+
+# Most users kept; least recently used are evicted first
+MAX_CACHED_USERS = 10000
+
+USER_COLUMNS = [column.key for column in sa_inspect(User).column_attrs]
+
+
+class UserIdentity:
+    """A User row with the organizations and roles it is mapped to in UserEntityRoleMap"""
+    __slots__ = ("columns", "entity_roles", "expires_at", "generation")
+
+    def __init__(self, columns: Dict[str, Any], entity_roles: List[Tuple[str, int]], expires_at: float, generation: int):
+        self.columns = columns
+        self.entity_roles = entity_roles
+        self.expires_at = expires_at
+        self.generation = generation
+
+    def user(self) -> User:
+        # A fresh detached instance per caller, as if loaded by its own session
+        user = User(**self.columns)
+        make_transient_to_detached(user)
+        return user
+
+
+class UserIdentityCache:
+    """
+    Current-user lookups keyed by user_uuid, so authenticated requests identify their caller
+    without a Postgres round trip. Invalidating a user bumps its generation; a load in flight
+    during the bump is not stored.
+    """
+
+    def __init__(self, ttl: float = USER_CACHE_TTL_SECONDS, max_entries: int = MAX_CACHED_USERS):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, UserIdentity]" = OrderedDict()
+        self._generation: Dict[str, int] = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _current_generation(self, user_uuid: str) -> Tuple[int, int]:
+        return self._epoch, self._generation.get(user_uuid, 0)
+
+    async def _load(self, db: AsyncSession, user_uuid: str) -> Optional[Tuple[Dict[str, Any], List[Tuple[str, int]]]]:
+        user = (await db.execute(select(User).where(User.user_uuid == user_uuid))).scalar_one_or_none()
+        if user is None:
+            return None
+        entity_roles = (await db.execute(
+            select(UserEntityRoleMap.entity_uuid, UserEntityRoleMap.role_id)
+            .where(UserEntityRoleMap.user_uuid == user_uuid)
+        )).all()
+        return {key: getattr(user, key) for key in USER_COLUMNS}, [tuple(row) for row in entity_roles]
+
+    async def get(self, db: AsyncSession, user_uuid: str) -> Optional[UserIdentity]:
+        """The user's identity, or None if no user has this UUID. Missing users are not cached."""
+        if not user_uuid:
+            return None
+        generation = self._current_generation(user_uuid)
+        entry = self._entries.get(user_uuid)
+        if entry is not None:
+            if entry.expires_at > time.monotonic() and entry.generation == generation:
+                self._entries.move_to_end(user_uuid)
+                self.hits += 1
+                return entry
+            del self._entries[user_uuid]
+
+        self.misses += 1
+        loaded = await self._load(db, user_uuid)
+        if loaded is None:
+            return None
+        entry = UserIdentity(*loaded, time.monotonic() + self.ttl, generation)
+        # Drop the result if the user changed while it was being read
+        if generation == self._current_generation(user_uuid):
+            self._entries[user_uuid] = entry
+            self._entries.move_to_end(user_uuid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    async def get_user(self, db: AsyncSession, user_uuid: str) -> Optional[User]:
+        identity = await self.get(db, user_uuid)
+        return identity.user() if identity else None
+
+    def invalidate(self, *user_uuids: str) -> None:
+        for user_uuid in user_uuids:
+            if not user_uuid:
+                continue
+            self._generation[user_uuid] = self._generation.get(user_uuid, 0) + 1
+            self._entries.pop(user_uuid, None)
+            self.invalidations += 1
+
+    def invalidate_username(self, username: str, provider: Optional[str] = None) -> None:
+        """For writes that only know the username; scans the cache"""
+        self.invalidate(*[
+            user_uuid for user_uuid, entry in list(self._entries.items())
+            if entry.columns.get("username") == username and (provider is None or entry.columns.get("provider") == provider)
+        ])
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# Create global instance
+user_identities = UserIdentityCache()
@@ -0,0 +1,98 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+import numpy as np
+
+
+class SegmentSnap(NamedTuple):
+    segment: int
+    t: float
+    x: float
+    y: float
+    distance: float
+
+
+def as_points(points: Iterable) -> np.ndarray:
+    """
+    Pack points into a contiguous (N, 2) float64 array. Accepts {"x", "y"} dicts, (x, y) pairs
+    or objects with x/y attributes.
+    """
+    coords = []
+    for p in points:
+        if isinstance(p, dict):
+            coords.append((p["x"], p["y"]))
+        elif hasattr(p, "x"):
+            coords.append((p.x, p.y))
+        else:
+            coords.append((p[0], p[1]))
+    return np.ascontiguousarray(np.asarray(coords, dtype=np.float64).reshape(-1, 2))
+
+
+def polyline_length(points) -> float:
+    xy = points if isinstance(points, np.ndarray) else as_points(points)
+    if len(xy) < 2:
+        return 0.0
+    return float(np.hypot(*np.diff(xy, axis=0).T).sum())
+
+
+def segment_lengths(xy: np.ndarray) -> np.ndarray:
+    if len(xy) < 2:
+        return np.zeros(0, dtype=np.float64)
+    return np.hypot(*np.diff(xy, axis=0).T)
+
+
+def nearest_k(xy: np.ndarray, x: float, y: float, k: int = 1) -> np.ndarray:
+    """
+    Indices of the k points closest to (x, y), nearest first.
+    """
+    if len(xy) == 0 or k <= 0:
+        return np.zeros(0, dtype=np.intp)
+    d2 = (xy[:, 0] - x) ** 2 + (xy[:, 1] - y) ** 2
+    if k < len(xy):
+        idx = np.argpartition(d2, k - 1)[:k]
+    else:
+        idx = np.arange(len(xy))
+    return idx[np.argsort(d2[idx], kind="stable")]
+
+
+def snap_to_segments(a: np.ndarray, b: np.ndarray, x: float, y: float) -> Optional[SegmentSnap]:
+    """
+    Project (x, y) onto every segment a[i] -> b[i] at once and return the closest projection.
+    """
+    if len(a) == 0:
+        return None
+    ab = b - a
+    ap = np.array([x, y]) - a
+    denom = (ab ** 2).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(denom > 0, (ap * ab).sum(axis=1) / denom, 0.0)
+    t = np.clip(t, 0.0, 1.0)
+    proj = a + ab * t[:, None]
+    dist = np.hypot(proj[:, 0] - x, proj[:, 1] - y)
+    i = int(np.argmin(dist))
+    return SegmentSnap(segment=i, t=float(t[i]), x=float(proj[i, 0]), y=float(proj[i, 1]), distance=float(dist[i]))
+
+
+class FloorGeometry:
+    """
+    Coordinates of one floor's graph nodes and edges as contiguous float arrays.
+    """
+
+    def __init__(self, node_ids: Sequence[str], xy: np.ndarray, edges: Sequence[tuple] = ()):
+        self.node_ids = list(node_ids)
+        self.xy = np.ascontiguousarray(xy, dtype=np.float64).reshape(-1, 2)
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.edges = list(edges)
+        if self.edges:
+            pairs = np.array([(self.index[u], self.index[v]) for u, v in self.edges], dtype=np.intp)
+            self.edge_a = self.xy[pairs[:, 0]]
+            self.edge_b = self.xy[pairs[:, 1]]
+        else:
+            self.edge_a = self.edge_b = np.zeros((0, 2), dtype=np.float64)
+
+    def nearest(self, x: float, y: float, k: int = 1, candidates: Optional[List[str]] = None) -> List[str]:
+        if candidates is None:
+            return [self.node_ids[i] for i in nearest_k(self.xy, x, y, k)]
+        rows = np.array([self.index[c] for c in candidates], dtype=np.intp)
+        return [candidates[i] for i in nearest_k(self.xy[rows], x, y, k)]
+
+    def snap(self, x: float, y: float) -> Optional[SegmentSnap]:
+        return snap_to_segments(self.edge_a, self.edge_b, x, y)
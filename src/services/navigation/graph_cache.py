@@ -0,0 +1,327 @@
+from typing import Dict, List, NamedTuple, Optional, Set
+from collections import defaultdict
+import asyncio
+import math
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Location, Floor, VerticalConnector, Path, NodeKind
+)
+from src.services.navigation.geometry import FloorGeometry, as_points
+from src.utility.mapStateModified import MapChange, PathPublished, register_map_listener
+
+logger = logging.getLogger(__name__)
+
+
+class GraphNode(NamedTuple):
+    node_id: str
+    kind: str
+    floor_id: str
+    x: float
+    y: float
+    name: Optional[str] = None
+    shared_id: Optional[str] = None
+    connector_type: Optional[str] = None
+    category: Optional[str] = None
+
+
+class BuildingGraph:
+    """
+    Navigation graph of one building: adjacency of published path edges plus a node-coordinate table.
+    Connectors sharing a shared_id are linked between adjacent floors through `vertical`.
+    """
+
+    def __init__(self, building_id: str):
+        self.building_id = building_id
+        self.floor_numbers: Dict[str, int] = {}
+        self.floor_rank: Dict[str, int] = {}
+        self.nodes: Dict[str, GraphNode] = {}
+        self.adjacency: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.vertical: Dict[str, List[str]] = defaultdict(list)
+        self.max_connector_shift = 0.0
+        self.connector_types: Set[str] = set()
+        self.geometry: Dict[str, FloorGeometry] = {}
+        self.built_at = time.time()
+
+    def add_edge(self, a: str, b: str, weight: float) -> None:
+        if a == b:
+            return
+        # Keep the cheapest edge when several paths share the same two nodes
+        if weight < self.adjacency[a].get(b, math.inf):
+            self.adjacency[a][b] = weight
+            self.adjacency[b][a] = weight
+
+    def floor_nodes(self, floor_id: str, kind: Optional[str] = None) -> List[GraphNode]:
+        return [
+            n for n in self.nodes.values()
+            if n.floor_id == floor_id and (kind is None or n.kind == kind)
+        ]
+
+    def link_connectors(self) -> None:
+        """
+        Chain connectors with the same shared_id floor by floor (ordered by floor_number).
+        Also records the largest x/y offset between linked connectors, used to keep A* admissible.
+        """
+        ordered = sorted(self.floor_numbers, key=lambda fid: self.floor_numbers[fid])
+        self.floor_rank = {fid: rank for rank, fid in enumerate(ordered)}
+
+        by_shared_id: Dict[str, List[GraphNode]] = defaultdict(list)
+        for node in self.nodes.values():
+            if node.connector_type:
+                self.connector_types.add(node.connector_type)
+            if node.kind == NodeKind.VERTICAL_CONNECTOR.value and node.shared_id:
+                by_shared_id[node.shared_id].append(node)
+
+        for shaft in by_shared_id.values():
+            shaft.sort(key=lambda n: self.floor_rank[n.floor_id])
+            for lower, upper in zip(shaft, shaft[1:]):
+                if lower.floor_id == upper.floor_id:
+                    continue
+                self.vertical[lower.node_id].append(upper.node_id)
+                self.vertical[upper.node_id].append(lower.node_id)
+                self.max_connector_shift = max(
+                    self.max_connector_shift,
+                    math.hypot(upper.x - lower.x, upper.y - lower.y),
+                )
+
+    def index_geometry(self) -> None:
+        """
+        Pack each floor's node coordinates and path edges into a FloorGeometry.
+        """
+        by_floor: Dict[str, List[GraphNode]] = defaultdict(list)
+        for node in self.nodes.values():
+            by_floor[node.floor_id].append(node)
+
+        self.geometry = {}
+        for floor_id, nodes in by_floor.items():
+            edges = [
+                (node.node_id, other)
+                for node in nodes
+                for other in self.adjacency.get(node.node_id, ())
+                if node.node_id < other
+            ]
+            self.geometry[floor_id] = FloorGeometry([n.node_id for n in nodes], as_points(nodes), edges)
+
+    def attach_unrouted_nodes(self, fallback_k: int = 3) -> None:
+        """
+        Join locations and connectors that no published path passes through to their floor network.
+        They are snapped onto the closest path edge; on floors without paths they are linked
+        straight to the nearest connectors instead.
+        """
+        connector_kind = NodeKind.VERTICAL_CONNECTOR.value
+        for floor_id, geo in self.geometry.items():
+            unrouted = [
+                n for n in self.floor_nodes(floor_id)
+                if n.kind != NodeKind.WAYPOINT.value and not self.adjacency.get(n.node_id)
+            ]
+            for node in unrouted:
+                snap = geo.snap(node.x, node.y)
+                if snap is None:
+                    candidates = [
+                        n.node_id for n in self.floor_nodes(floor_id, connector_kind)
+                        if n.node_id != node.node_id
+                    ]
+                    for other in (geo.nearest(node.x, node.y, fallback_k, candidates) if candidates else []):
+                        target = self.nodes[other]
+                        self.add_edge(node.node_id, other, math.hypot(target.x - node.x, target.y - node.y))
+                    continue
+
+                a, b = geo.edges[snap.segment]
+                if snap.t <= 0.0 or snap.t >= 1.0:
+                    self.add_edge(node.node_id, a if snap.t <= 0.0 else b, snap.distance)
+                    continue
+
+                snap_id = f"snap:{node.node_id}"
+                self.nodes[snap_id] = GraphNode(
+                    node_id=snap_id, kind=NodeKind.WAYPOINT.value, floor_id=floor_id, x=snap.x, y=snap.y
+                )
+                self.add_edge(node.node_id, snap_id, snap.distance)
+                for end in (a, b):
+                    end_node = self.nodes[end]
+                    self.add_edge(snap_id, end, math.hypot(end_node.x - snap.x, end_node.y - snap.y))
+
+        self.index_geometry()
+
+    def nearest_connectors(
+        self, floor_id: str, x: float, y: float, k: int = 1, connector_type: Optional[str] = None
+    ) -> List[GraphNode]:
+        geo = self.geometry.get(floor_id)
+        candidates = [
+            n.node_id for n in self.floor_nodes(floor_id, NodeKind.VERTICAL_CONNECTOR.value)
+            if connector_type is None or n.connector_type == connector_type
+        ]
+        if geo is None or not candidates:
+            return []
+        return [self.nodes[node_id] for node_id in geo.nearest(x, y, k, candidates)]
+
+
+def _waypoint_id(floor_id: str, x: float, y: float) -> str:
+    # Waypoints without ref_id are keyed by position so paths crossing at a point are joined
+    return f"wp:{floor_id}:{round(x, 3)}:{round(y, 3)}"
+
+
+class NavigationGraphCache:
+    """
+    Process-local cache of BuildingGraph objects, invalidated through mapStateModify.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[str, BuildingGraph] = {}
+        self._floor_building: Dict[str, str] = {}
+        self._generation: Dict[str, int] = defaultdict(int)
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def get_building_graph(self, building_id: str) -> BuildingGraph:
+        graph = self._graphs.get(building_id)
+        if graph is not None:
+            return graph
+
+        async with self._locks[building_id]:
+            graph = self._graphs.get(building_id)
+            if graph is not None:
+                return graph
+
+            generation = self._generation[building_id]
+            graph = await self._build(building_id)
+
+            # Drop the result if a write landed while we were reading
+            if generation == self._generation[building_id]:
+                self._graphs[building_id] = graph
+            return graph
+
+    async def get_floor_graph(self, floor_id: str) -> Optional[BuildingGraph]:
+        building_id = self._floor_building.get(floor_id)
+        if building_id is None:
+            floor = await Floor.find_one({"floor_id": floor_id, "status": "active"})
+            if not floor or not floor.building_id:
+                return None
+            building_id = floor.building_id
+            self._floor_building[floor_id] = building_id
+        return await self.get_building_graph(building_id)
+
+    async def get_node_graph(self, node_id: str) -> Optional[BuildingGraph]:
+        for graph in list(self._graphs.values()):
+            if node_id in graph.nodes:
+                return graph
+
+        location = await Location.find_one({"location_id": node_id, "status": "active"})
+        if location:
+            return await self.get_floor_graph(location.floor_id)
+        connector = await VerticalConnector.find_one({"connector_id": node_id, "status": "active"})
+        if connector:
+            return await self.get_floor_graph(connector.floor_id)
+        return None
+
+    def invalidate_building(self, building_id: str) -> None:
+        self._generation[building_id] += 1
+        if self._graphs.pop(building_id, None) is not None:
+            logger.info(f"Navigation graph invalidated for building {building_id}")
+
+    def invalidate_floor(self, floor_id: str) -> None:
+        building_id = self._floor_building.get(floor_id)
+        if building_id is None:
+            for graph in self._graphs.values():
+                if floor_id in graph.floor_numbers:
+                    building_id = graph.building_id
+                    break
+        if building_id is not None:
+            self.invalidate_building(building_id)
+
+    def clear(self) -> None:
+        for building_id in list(self._graphs):
+            self.invalidate_building(building_id)
+        self._floor_building.clear()
+
+    def on_map_change(self, change: MapChange) -> None:
+        # on_paths_published invalidates and rebuilds in one step; invalidating here could land mid-rebuild
+        if isinstance(change, PathPublished) and change.building_id:
+            return
+        if change.building_id:
+            self.invalidate_building(change.building_id)
+        for floor_id in change.floor_ids:
+            self.invalidate_floor(floor_id)
+            if change.entity in ("floor", "building"):
+                self._floor_building.pop(floor_id, None)
+
+    async def _build(self, building_id: str) -> BuildingGraph:
+        start = time.time()
+        graph = BuildingGraph(building_id)
+
+        floors = await Floor.find({"building_id": building_id, "status": "active"}).to_list()
+        floor_ids = [f.floor_id for f in floors]
+        for f in floors:
+            graph.floor_numbers[f.floor_id] = f.floor_number
+            self._floor_building[f.floor_id] = building_id
+
+        locations, connectors, paths = await asyncio.gather(
+            Location.find({"floor_id": {"$in": floor_ids}, "status": "active"}).to_list(),
+            VerticalConnector.find({"floor_id": {"$in": floor_ids}, "status": "active"}).to_list(),
+            Path.find({"building_id": building_id, "status": "active", "is_published": True}).to_list(),
+        )
+
+        for loc in locations:
+            graph.nodes[loc.location_id] = GraphNode(
+                node_id=loc.location_id,
+                kind=NodeKind.LOCATION.value,
+                floor_id=loc.floor_id,
+                x=loc.x,
+                y=loc.y,
+                name=loc.name,
+                category=loc.category.value,
+            )
+        for conn in connectors:
+            graph.nodes[conn.connector_id] = GraphNode(
+                node_id=conn.connector_id,
+                kind=NodeKind.VERTICAL_CONNECTOR.value,
+                floor_id=conn.floor_id,
+                x=conn.x,
+                y=conn.y,
+                name=conn.name,
+                shared_id=conn.shared_id,
+                connector_type=conn.connector_type.value,
+            )
+
+        for path in paths:
+            for seg in path.floor_segments or []:
+                if seg.floor_id not in graph.floor_numbers:
+                    continue
+                previous: Optional[GraphNode] = None
+                for p in seg.points:
+                    node = self._resolve_point(graph, seg.floor_id, p)
+                    # An inactive or missing reference breaks the chain rather than bridging over it
+                    if node is not None and previous is not None:
+                        graph.add_edge(
+                            previous.node_id,
+                            node.node_id,
+                            math.hypot(node.x - previous.x, node.y - previous.y),
+                        )
+                    previous = node
+
+        graph.index_geometry()
+        graph.attach_unrouted_nodes()
+        graph.link_connectors()
+
+        logger.info(
+            f"Navigation graph built for building {building_id}: {len(graph.nodes)} nodes, "
+            f"{sum(len(e) for e in graph.adjacency.values()) // 2} edges in {time.time() - start:.4f}s"
+        )
+        return graph
+
+    def _resolve_point(self, graph: BuildingGraph, floor_id: str, p) -> Optional[GraphNode]:
+        if p.kind in (NodeKind.LOCATION, NodeKind.VERTICAL_CONNECTOR):
+            return graph.nodes.get(p.ref_id) if p.ref_id else None
+
+        if p.x is None or p.y is None:
+            return None
+        node_id = p.ref_id or _waypoint_id(floor_id, p.x, p.y)
+        node = graph.nodes.get(node_id)
+        if node is None:
+            node = GraphNode(node_id=node_id, kind=NodeKind.WAYPOINT.value, floor_id=floor_id, x=p.x, y=p.y)
+            graph.nodes[node_id] = node
+        return node
+
+
+# Create global instance
+navigation_graph_cache = NavigationGraphCache()
+register_map_listener(navigation_graph_cache.on_map_change)
@@ -0,0 +1,203 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import asyncio
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Building, Floor, Location, VerticalConnector, Path, FloorSegment, PathPoint, NodeKind
+)
+
+logger = logging.getLogger(__name__)
+
+
+def referenced_ids(segments: Iterable[FloorSegment], kind: NodeKind) -> List[str]:
+    return list(dict.fromkeys(
+        p.ref_id for seg in segments for p in (seg.points or []) if p.kind == kind and p.ref_id
+    ))
+
+
+class PathReferences:
+    """
+    Buildings, floors, locations and connectors referenced by one or more paths, fetched with one
+    $in query per collection. Lookups raise LookupError for missing references and ValueError for
+    malformed points so callers can map them to 404/400.
+    """
+
+    def __init__(self):
+        self.buildings: Dict[str, Building] = {}
+        self.floors: Dict[str, Floor] = {}
+        self.locations: Dict[str, Location] = {}
+        self.connectors: Dict[str, VerticalConnector] = {}
+
+    @classmethod
+    async def load(
+        cls,
+        segments: Iterable[FloorSegment],
+        building_ids: Iterable[str] = (),
+    ) -> "PathReferences":
+        segments = list(segments)
+        refs = cls()
+        building_ids = list(dict.fromkeys(b for b in building_ids if b))
+        floor_ids = list(dict.fromkeys(seg.floor_id for seg in segments))
+        location_ids = referenced_ids(segments, NodeKind.LOCATION)
+        connector_ids = referenced_ids(segments, NodeKind.VERTICAL_CONNECTOR)
+
+        async def fetch(document, field, ids):
+            if not ids:
+                return []
+            return await document.find({field: {"$in": ids}, "status": "active"}).to_list()
+
+        buildings, floors, locations, connectors = await asyncio.gather(
+            fetch(Building, "building_id", building_ids),
+            fetch(Floor, "floor_id", floor_ids),
+            fetch(Location, "location_id", location_ids),
+            fetch(VerticalConnector, "connector_id", connector_ids),
+        )
+        refs.buildings = {b.building_id: b for b in buildings}
+        refs.floors = {f.floor_id: f for f in floors}
+        refs.locations = {loc.location_id: loc for loc in locations}
+        refs.connectors = {conn.connector_id: conn for conn in connectors}
+        return refs
+
+    def ensure_building(self, building_id: str) -> Building:
+        building = self.buildings.get(building_id)
+        if not building:
+            raise LookupError(f"Building with ID '{building_id}' not found")
+        return building
+
+    def ensure_floors(self, floor_ids: Iterable[str]) -> None:
+        missing = [fid for fid in dict.fromkeys(floor_ids) if fid not in self.floors]
+        if missing:
+            raise LookupError(f"Floor(s) not found: {', '.join(missing)}")
+
+    def validate_segment(self, seg: FloorSegment) -> FloorSegment:
+        """Validate referenced entities for a segment's points. Enrich vertical connectors' shared_id if missing."""
+        enriched_points: List[PathPoint] = []
+        for p in seg.points:
+            if p.kind == NodeKind.LOCATION:
+                if not p.ref_id:
+                    raise ValueError("Location point requires ref_id")
+                loc = self.locations.get(p.ref_id)
+                if not loc:
+                    raise LookupError(f"Location with ID '{p.ref_id}' not found")
+                if loc.floor_id != seg.floor_id:
+                    logger.warning(f"Location {loc.location_id} belongs to floor {loc.floor_id}, but used on segment floor {seg.floor_id}")
+
+            elif p.kind == NodeKind.VERTICAL_CONNECTOR:
+                if not p.ref_id:
+                    raise ValueError("Vertical connector point requires ref_id")
+                conn = self.connectors.get(p.ref_id)
+                if not conn:
+                    raise LookupError(f"Vertical connector with ID '{p.ref_id}' not found")
+                if conn.floor_id != seg.floor_id:
+                    logger.warning(f"Vertical connector {conn.connector_id} belongs to floor {conn.floor_id}, used on floor {seg.floor_id}")
+                if not p.shared_id:
+                    p.shared_id = conn.shared_id
+
+            elif p.kind == NodeKind.WAYPOINT:
+                if p.x is None or p.y is None:
+                    raise ValueError("Waypoint requires x and y coordinates")
+            else:
+                raise ValueError(f"Unsupported point kind: {p.kind}")
+            enriched_points.append(p)
+
+        seg.points = enriched_points
+        return seg
+
+    def validate_segments(self, segments: Iterable[FloorSegment]) -> List[FloorSegment]:
+        segments = list(segments)
+        self.ensure_floors(seg.floor_id for seg in segments)
+        return [self.validate_segment(seg) for seg in sorted(segments, key=lambda s: s.sequence)]
+
+
+def dump_document(doc) -> Optional[dict]:
+    """Return a plain dict for a Beanie Document without the internal 'id' (PydanticObjectId)."""
+    if not doc:
+        return None
+    return doc.model_dump(exclude={"id", "revision_id"})
+
+
+def transition_refs(path: Path) -> Tuple[Set[str], Set[str], Set[str]]:
+    """
+    Connector shared_ids, connector_ids and floor_ids at the boundaries where a path changes floor.
+    """
+    shared_ids: Set[str] = set()
+    connector_ids: Set[str] = set()
+    floor_ids: Set[str] = set()
+    if not path.is_multifloor:
+        return shared_ids, connector_ids, floor_ids
+
+    segments = sorted(path.floor_segments or [], key=lambda s: getattr(s, "sequence", 0))
+    for seg_a, seg_b in zip(segments, segments[1:]):
+        if seg_a.floor_id == seg_b.floor_id:
+            continue
+        a_points = [p for p in (seg_a.points or []) if p.kind == NodeKind.VERTICAL_CONNECTOR]
+        b_points = [p for p in (seg_b.points or []) if p.kind == NodeKind.VERTICAL_CONNECTOR]
+        a_shared = {p.shared_id for p in a_points if p.shared_id}
+        b_shared = {p.shared_id for p in b_points if p.shared_id}
+        # Prefer the shaft both floors agree on
+        shared_ids.update((a_shared & b_shared) or a_shared or b_shared)
+        connector_ids.update(p.ref_id for p in a_points + b_points if p.ref_id)
+        floor_ids.update((seg_a.floor_id, seg_b.floor_id))
+    return shared_ids, connector_ids, floor_ids
+
+
+async def expand_paths(paths: List[Path]) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve the start/end locations, floors and floor-transition connectors of many paths at once:
+    one $in query per collection, run concurrently. Returns expansions keyed by path_id.
+    """
+    transitions = {path.path_id: transition_refs(path) for path in paths}
+    location_ids = list({pid for path in paths for pid in (path.start_point_id, path.end_point_id) if pid})
+    floor_ids = list({seg.floor_id for path in paths for seg in (path.floor_segments or [])})
+    shared_ids = list({sid for refs in transitions.values() for sid in refs[0]})
+    connector_ids = list({cid for refs in transitions.values() for cid in refs[1]})
+    transition_floors = list({fid for refs in transitions.values() for fid in refs[2]})
+
+    async def fetch_locations():
+        if not location_ids:
+            return []
+        return await Location.find({"location_id": {"$in": location_ids}, "status": "active"}).to_list()
+
+    async def fetch_floors():
+        if not floor_ids:
+            return []
+        return await Floor.find({"floor_id": {"$in": floor_ids}, "status": "active"}).to_list()
+
+    async def fetch_connectors():
+        clauses = []
+        if connector_ids:
+            clauses.append({"connector_id": {"$in": connector_ids}})
+        if shared_ids:
+            clauses.append({"shared_id": {"$in": shared_ids}})
+        if not clauses:
+            return []
+        return await VerticalConnector.find({
+            "status": "active",
+            "$or": clauses,
+            "floor_id": {"$in": transition_floors},
+        }).to_list()
+
+    locations, floors, connectors = await asyncio.gather(fetch_locations(), fetch_floors(), fetch_connectors())
+    locations_by_id = {loc.location_id: dump_document(loc) for loc in locations}
+    floors_by_id = {floor.floor_id: dump_document(floor) for floor in floors}
+
+    expansions: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        path_shared, path_connectors, path_floors = transitions[path.path_id]
+        seen: Set[str] = set()
+        vertical_connectors = []
+        for conn in connectors:
+            if conn.connector_id in seen or conn.floor_id not in path_floors:
+                continue
+            if conn.connector_id in path_connectors or conn.shared_id in path_shared:
+                vertical_connectors.append(dump_document(conn))
+                seen.add(conn.connector_id)
+
+        path_floor_ids = dict.fromkeys(seg.floor_id for seg in (path.floor_segments or []))
+        expansions[path.path_id] = {
+            "start_point": locations_by_id.get(path.start_point_id),
+            "end_point": locations_by_id.get(path.end_point_id),
+            "floors_details": [floors_by_id[fid] for fid in path_floor_ids if fid in floors_by_id],
+            "vertical_connectors": vertical_connectors,
+        }
+    return expansions
@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional
+from array import array
+from collections import defaultdict
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import LocationType, NodeKind
+from src.services.navigation.graph_cache import BuildingGraph
+from src.utility.mapStateModified import MapChange, PathPublished, register_map_listener
+
+logger = logging.getLogger(__name__)
+
+
+# Locations routes are precomputed from
+ROUTE_SOURCE_CATEGORIES = {LocationType.KIOSK.value, LocationType.ENTRANCE.value}
+
+
+class RouteTable:
+    """
+    Shortest-path trees of one building, one predecessor array per kiosk/entrance source.
+    Arrays are indexed by position in `node_ids`; -1 marks the source itself or an unreachable node.
+    """
+
+    def __init__(self, graph: BuildingGraph, version: int):
+        self.graph = graph
+        self.building_id = graph.building_id
+        self.version = version
+        self.node_ids: List[str] = list(graph.nodes)
+        self.index: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.predecessors: Dict[str, array] = {}
+        self.costs: Dict[str, array] = {}
+        self.built_at = time.time()
+
+    def add_source(self, source_id: str, costs: Dict[str, float], previous: Dict[str, str]) -> None:
+        pred = array("i", [-1]) * len(self.node_ids)
+        cost = array("d", [-1.0]) * len(self.node_ids)
+        for node_id, c in costs.items():
+            cost[self.index[node_id]] = c
+        for node_id, prev_id in previous.items():
+            pred[self.index[node_id]] = self.index[prev_id]
+        self.predecessors[source_id] = pred
+        self.costs[source_id] = cost
+
+    def has_source(self, source_id: str) -> bool:
+        return source_id in self.predecessors
+
+    def reconstruct(self, source_id: str, destination_id: str) -> Optional[List[str]]:
+        pred = self.predecessors.get(source_id)
+        target = self.index.get(destination_id)
+        if pred is None or target is None or self.costs[source_id][target] < 0:
+            return None
+
+        source = self.index[source_id]
+        node_ids = [destination_id]
+        current = target
+        while current != source:
+            current = pred[current]
+            node_ids.append(self.node_ids[current])
+        node_ids.reverse()
+        return node_ids
+
+    def cost(self, source_id: str, destination_id: str) -> Optional[float]:
+        costs = self.costs.get(source_id)
+        target = self.index.get(destination_id)
+        if costs is None or target is None or costs[target] < 0:
+            return None
+        return costs[target]
+
+
+class RouteTableCache:
+    """
+    Versioned store of RouteTable per building. Any map write bumps the building version,
+    and a table is only served while its version and source graph are current.
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, RouteTable] = {}
+        self._versions: Dict[str, int] = defaultdict(int)
+
+    def version(self, building_id: str) -> int:
+        return self._versions[building_id]
+
+    def get(self, graph: BuildingGraph) -> Optional[RouteTable]:
+        table = self._tables.get(graph.building_id)
+        if table is None or table.graph is not graph or table.version != self._versions[graph.building_id]:
+            return None
+        return table
+
+    def store(self, table: RouteTable) -> bool:
+        if table.version != self._versions[table.building_id]:
+            return False
+        self._tables[table.building_id] = table
+        return True
+
+    def invalidate(self, building_id: str) -> None:
+        self._versions[building_id] += 1
+        self._tables.pop(building_id, None)
+
+    def on_map_change(self, change: MapChange) -> None:
+        # Handled by on_paths_published, which rebuilds the table right after invalidating it
+        if isinstance(change, PathPublished) and change.building_id:
+            return
+        if change.building_id:
+            self.invalidate(change.building_id)
+        for floor_id in change.floor_ids:
+            for table in list(self._tables.values()):
+                if floor_id in table.graph.floor_numbers:
+                    self.invalidate(table.building_id)
+
+
+def route_sources(graph: BuildingGraph) -> List[str]:
+    return [
+        n.node_id for n in graph.nodes.values()
+        if n.kind == NodeKind.LOCATION.value and n.category in ROUTE_SOURCE_CATEGORIES
+    ]
+
+
+# Create global instance
+route_table_cache = RouteTableCache()
+register_map_listener(route_table_cache.on_map_change)
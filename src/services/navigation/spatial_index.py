@@ -0,0 +1,319 @@
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from collections import defaultdict
+import asyncio
+import math
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Location, Floor, VerticalConnector, NodeKind, ShapeType
+)
+from src.utility.mapStateModified import MapChange, register_map_listener
+
+logger = logging.getLogger(__name__)
+
+
+class SpatialItem(NamedTuple):
+    item_id: str
+    kind: str
+    floor_id: str
+    name: str
+    shape: str
+    x: float
+    y: float
+    width: Optional[float] = None
+    height: Optional[float] = None
+    radius: Optional[float] = None
+    category: Optional[str] = None
+    connector_type: Optional[str] = None
+    is_published: bool = True
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        # x/y is the shape centre for both circles and rectangles
+        if self.shape == ShapeType.RECTANGLE.value:
+            half_w, half_h = (self.width or 0.0) / 2, (self.height or 0.0) / 2
+        else:
+            half_w = half_h = self.radius or 0.0
+        return self.x - half_w, self.y - half_h, self.x + half_w, self.y + half_h
+
+    def distance_to(self, x: float, y: float) -> float:
+        """
+        Distance from (x, y) to the shape outline, 0 when the point is inside it.
+        """
+        if self.shape == ShapeType.RECTANGLE.value:
+            min_x, min_y, max_x, max_y = self.bounds
+            return math.hypot(max(min_x - x, 0.0, x - max_x), max(min_y - y, 0.0, y - max_y))
+        return max(math.hypot(x - self.x, y - self.y) - (self.radius or 0.0), 0.0)
+
+    def intersects(self, min_x: float, min_y: float, max_x: float, max_y: float) -> bool:
+        if self.shape == ShapeType.RECTANGLE.value:
+            a_min_x, a_min_y, a_max_x, a_max_y = self.bounds
+            return a_min_x <= max_x and a_max_x >= min_x and a_min_y <= max_y and a_max_y >= min_y
+        # Circle against box: distance from the centre to the clamped point
+        cx = min(max(self.x, min_x), max_x)
+        cy = min(max(self.y, min_y), max_y)
+        return math.hypot(self.x - cx, self.y - cy) <= (self.radius or 0.0)
+
+
+def location_item(loc: Location) -> SpatialItem:
+    return SpatialItem(
+        item_id=loc.location_id,
+        kind=NodeKind.LOCATION.value,
+        floor_id=loc.floor_id,
+        name=loc.name,
+        shape=loc.shape.value,
+        x=loc.x,
+        y=loc.y,
+        width=loc.width,
+        height=loc.height,
+        radius=loc.radius,
+        category=loc.category.value,
+        is_published=loc.is_published,
+    )
+
+
+def connector_item(conn: VerticalConnector) -> SpatialItem:
+    return SpatialItem(
+        item_id=conn.connector_id,
+        kind=NodeKind.VERTICAL_CONNECTOR.value,
+        floor_id=conn.floor_id,
+        name=conn.name,
+        shape=conn.shape.value,
+        x=conn.x,
+        y=conn.y,
+        width=conn.width,
+        height=conn.height,
+        radius=conn.radius,
+        connector_type=conn.connector_type.value,
+        is_published=conn.is_published,
+    )
+
+
+class FloorSpatialIndex:
+    """
+    Uniform grid over the bounding boxes of one floor's locations and connectors.
+    An item is registered in every cell its bounds overlap, so box and radius queries only
+    test items from the cells they cover and nearest-k grows ring by ring from the query cell.
+    """
+
+    def __init__(self, floor_id: str, items: Iterable[SpatialItem] = (), cell_size: Optional[float] = None):
+        self.floor_id = floor_id
+        self.items: Dict[str, SpatialItem] = {}
+        self.cells: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+        self._item_cells: Dict[str, List[Tuple[int, int]]] = {}
+        items = list(items)
+        self.cell_size = cell_size or self._pick_cell_size(items)
+        for item in items:
+            self.insert(item)
+
+    @staticmethod
+    def _pick_cell_size(items: List[SpatialItem]) -> float:
+        # Aim for roughly one item per cell over the floor's current extent
+        if len(items) < 2:
+            return 10.0
+        bounds = [item.bounds for item in items]
+        extent = max(
+            max(b[2] for b in bounds) - min(b[0] for b in bounds),
+            max(b[3] for b in bounds) - min(b[1] for b in bounds),
+        )
+        return max(extent / math.sqrt(len(items)), 1e-6) if extent > 0 else 10.0
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def _cells_for_box(self, min_x: float, min_y: float, max_x: float, max_y: float):
+        low_x, low_y = self._cell(min_x, min_y)
+        high_x, high_y = self._cell(max_x, max_y)
+        for cx in range(low_x, high_x + 1):
+            for cy in range(low_y, high_y + 1):
+                yield cx, cy
+
+    def insert(self, item: SpatialItem) -> None:
+        self.remove(item.item_id)
+        cells = list(self._cells_for_box(*item.bounds))
+        for cell in cells:
+            self.cells[cell].add(item.item_id)
+        self.items[item.item_id] = item
+        self._item_cells[item.item_id] = cells
+
+    def remove(self, item_id: str) -> bool:
+        cells = self._item_cells.pop(item_id, None)
+        if cells is None:
+            return False
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.discard(item_id)
+                if not bucket:
+                    del self.cells[cell]
+        del self.items[item_id]
+        return True
+
+    def _candidates(self, cells: Iterable[Tuple[int, int]]) -> Set[str]:
+        found: Set[str] = set()
+        for cell in cells:
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def _candidates_in_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Set[str]:
+        low_x, low_y = self._cell(min_x, min_y)
+        high_x, high_y = self._cell(max_x, max_y)
+        # A box wider than the populated grid is cheaper to answer from the occupied cells
+        if (high_x - low_x + 1) * (high_y - low_y + 1) > len(self.cells):
+            return self._candidates(
+                cell for cell in self.cells
+                if low_x <= cell[0] <= high_x and low_y <= cell[1] <= high_y
+            )
+        return self._candidates(self._cells_for_box(min_x, min_y, max_x, max_y))
+
+    def within_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[SpatialItem]:
+        if max_x < min_x or max_y < min_y:
+            return []
+        return [
+            self.items[item_id]
+            for item_id in self._candidates_in_box(min_x, min_y, max_x, max_y)
+            if self.items[item_id].intersects(min_x, min_y, max_x, max_y)
+        ]
+
+    def within_radius(self, x: float, y: float, radius: float) -> List[Tuple[SpatialItem, float]]:
+        """
+        Items whose outline lies within `radius` of (x, y), nearest first. Radius 0 is a hit test.
+        """
+        matches = []
+        for item_id in self._candidates_in_box(x - radius, y - radius, x + radius, y + radius):
+            item = self.items[item_id]
+            distance = item.distance_to(x, y)
+            if distance <= radius:
+                matches.append((item, distance))
+        matches.sort(key=lambda m: m[1])
+        return matches
+
+    def nearest(
+        self, x: float, y: float, k: int = 1, accept: Optional[Callable[[SpatialItem], bool]] = None
+    ) -> List[Tuple[SpatialItem, float]]:
+        if k <= 0 or not self.items:
+            return []
+
+        origin_x, origin_y = self._cell(x, y)
+        xs = [cx for cx, _ in self.cells]
+        ys = [cy for _, cy in self.cells]
+        max_ring = max(
+            abs(origin_x - min(xs)), abs(origin_x - max(xs)),
+            abs(origin_y - min(ys)), abs(origin_y - max(ys)),
+        )
+
+        seen: Set[str] = set()
+        matches: List[Tuple[SpatialItem, float]] = []
+        for ring in range(max_ring + 1):
+            if ring == 0:
+                ring_cells = [(origin_x, origin_y)]
+            else:
+                ring_cells = [
+                    (origin_x + dx, origin_y + dy)
+                    for dx in range(-ring, ring + 1)
+                    for dy in range(-ring, ring + 1)
+                    if max(abs(dx), abs(dy)) == ring
+                ]
+            for item_id in self._candidates(ring_cells) - seen:
+                seen.add(item_id)
+                item = self.items[item_id]
+                if accept is None or accept(item):
+                    matches.append((item, item.distance_to(x, y)))
+
+            # Anything outside the rings visited so far is at least ring * cell_size away
+            if len(matches) >= k:
+                matches.sort(key=lambda m: m[1])
+                if matches[k - 1][1] <= ring * self.cell_size:
+                    break
+
+        matches.sort(key=lambda m: m[1])
+        return matches[:k]
+
+
+class SpatialIndexCache:
+    """
+    Per-floor spatial indexes loaded on first use and kept current from mapStateModify:
+    a single location/connector write updates its entry in place, wider changes drop the floor.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[str, FloorSpatialIndex] = {}
+        self._generation: Dict[str, int] = defaultdict(int)
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def get_floor_index(self, floor_id: str) -> Optional[FloorSpatialIndex]:
+        index = self._indexes.get(floor_id)
+        if index is not None:
+            return index
+
+        async with self._locks[floor_id]:
+            index = self._indexes.get(floor_id)
+            if index is not None:
+                return index
+
+            generation = self._generation[floor_id]
+            floor = await Floor.find_one({"floor_id": floor_id, "status": "active"})
+            if not floor:
+                return None
+
+            locations, connectors = await asyncio.gather(
+                Location.find({"floor_id": floor_id, "status": "active"}).to_list(),
+                VerticalConnector.find({"floor_id": floor_id, "status": "active"}).to_list(),
+            )
+            index = FloorSpatialIndex(
+                floor_id,
+                [location_item(loc) for loc in locations] + [connector_item(conn) for conn in connectors],
+            )
+
+            # Drop the result if a write landed while we were reading
+            if generation == self._generation[floor_id]:
+                self._indexes[floor_id] = index
+            logger.info(f"Spatial index built for floor {floor_id}: {len(index.items)} items")
+            return index
+
+    def invalidate_floor(self, floor_id: str) -> None:
+        self._generation[floor_id] += 1
+        self._indexes.pop(floor_id, None)
+
+    def clear(self) -> None:
+        for floor_id in list(self._indexes):
+            self.invalidate_floor(floor_id)
+
+    async def _refresh_item(self, entity: str, entity_id: str, floor_ids: List[str]) -> None:
+        if entity == "location":
+            doc = await Location.find_one({"location_id": entity_id, "status": "active"})
+            item = location_item(doc) if doc else None
+        else:
+            doc = await VerticalConnector.find_one({"connector_id": entity_id, "status": "active"})
+            item = connector_item(doc) if doc else None
+
+        # Remove from every floor it may have left, then place it where it is now
+        for floor_id in set(floor_ids) | ({item.floor_id} if item else set()):
+            index = self._indexes.get(floor_id)
+            if index is None:
+                continue
+            index.remove(entity_id)
+            if item is not None and item.floor_id == floor_id:
+                index.insert(item)
+
+    async def on_map_change(self, change: MapChange) -> None:
+        if change.entity not in ("location", "vertical_connector", "floor", "building"):
+            return
+
+        if change.entity in ("location", "vertical_connector") and change.entity_id:
+            # In-flight loads could miss this write, so make them discard their result
+            for floor_id in change.floor_ids:
+                if floor_id not in self._indexes:
+                    self._generation[floor_id] += 1
+            await self._refresh_item(change.entity, change.entity_id, change.floor_ids)
+            return
+
+        for floor_id in change.floor_ids:
+            self.invalidate_floor(floor_id)
+
+
+# Create global instance
+spatial_index_cache = SpatialIndexCache()
+register_map_listener(spatial_index_cache.on_map_change)
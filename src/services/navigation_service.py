@@ -1,9 +1,15 @@
 from typing import List, Dict, Any, Optional, Tuple
 from src.datamodel.database.domain.DigitalSignage import (
-    Location, Floor, VerticalConnector, Path, NavigationRequest, MultiFloorRoute, PathPoint
+    Location, Floor, VerticalConnector, Path, NavigationRequest, MultiFloorRoute, PathPoint, NodeKind
 )
+from src.services.navigation.graph_cache import navigation_graph_cache, BuildingGraph, GraphNode
+from src.services.navigation.route_table import route_table_cache, RouteTable, route_sources
+from src.services.navigation import geometry
+from src.services.events.domain_events import domain_events
+from src.utility.mapStateModified import PathPublished
 import heapq
 import math
+import time
 from collections import defaultdict
 import logging
 
@@ -11,375 +17,292 @@ logger = logging.getLogger(__name__)
 
 
 class NavigationService:
+    # Walking speed used for both edge costs and time estimates (minutes per coordinate unit)
+    WALK_MINUTES_PER_UNIT = 0.5
+    # Upper bound on A* node expansions for a single query
+    MAX_EXPANSIONS = 50000
+
     def __init__(self):
-        self.graph = defaultdict(list)
-        self.vertical_connectors_map = defaultdict(list)
+        self.graph_cache = navigation_graph_cache
+        self.route_tables = route_table_cache
     
     async def find_multi_floor_route(self, request: NavigationRequest) -> MultiFloorRoute:
         """
         Find route between locations that may span multiple floors
         """
         try:
-            # Get source and destination locations
-            source_location = await Location.find_one(Location.location_id == request.source_location_id)
-            destination_location = await Location.find_one(Location.location_id == request.destination_location_id)
+            # Resolve the building graph once; everything below runs in memory
+            graph = await self.graph_cache.get_node_graph(request.source_location_id)
+            source_location = graph.nodes.get(request.source_location_id) if graph else None
+            destination_location = graph.nodes.get(request.destination_location_id) if graph else None
             
             if not source_location or not destination_location:
                 raise ValueError("Source or destination location not found")
             
-            # Check if same floor
-            if source_location.floor_id == destination_location.floor_id:
-                return await self._find_single_floor_route(source_location, destination_location)
-            
-            # Multi-floor routing
-            return await self._find_multi_floor_route(source_location, destination_location, request.preferred_connector_type)
+            node_ids = None
+            table = self.route_tables.get(graph)
+            if table and not request.preferred_connector_type and table.has_source(source_location.node_id):
+                # Kiosk/entrance sources are answered from the precomputed tree
+                node_ids = table.reconstruct(source_location.node_id, destination_location.node_id)
+            else:
+                node_ids = self._search_route(graph, source_location, destination_location, request.preferred_connector_type)
+            if node_ids is None:
+                raise ValueError("No route found between source and destination")
+            
+            return self._build_route(graph, node_ids)
         
         except Exception as e:
             logger.error(f"Error finding multi-floor route: {str(e)}")
             raise
     
-    async def _find_multi_floor_route(
-        self, 
-        source: Location, 
-        destination: Location, 
-        preferred_connector: Optional[str] = None
-    ) -> MultiFloorRoute:
-        """
-        Find route spanning multiple floors using vertical connectors
-        """
-        route_segments = []
-        vertical_transitions = []
-        
-        try:
-            # Step 1: Find path from source to vertical connector on source floor
-            source_connectors = await self._get_floor_connectors(source.floor_id)
-            best_source_connector = await self._find_nearest_connector(source, source_connectors, preferred_connector)
-            
-            if not best_source_connector:
-                raise ValueError("No suitable vertical connector found on source floor")
-            
-            # Step 2: Find corresponding connector on destination floor
-            dest_connectors = await self._get_connectors_by_shared_id(
-                best_source_connector.shared_id, 
-                destination.floor_id
-            )
-            
-            if not dest_connectors:
-                raise ValueError("No corresponding vertical connector found on destination floor")
-            
-            dest_connector = dest_connectors[0]
-            
-            # Step 3: Build route segments
-            # Segment 1: Source to source connector
-            source_to_connector = await self._find_path_on_floor(
-                source.floor_id, 
-                source.location_id, 
-                best_source_connector.connector_id
-            )
-            
-            if source_to_connector:
-                route_segments.append({
-                    "floor_id": source.floor_id,
-                    "segment_type": "horizontal",
-                    "path": source_to_connector,
-                    "instructions": f"Walk from {source.name} to {best_source_connector.name}",
-                    "distance": self._calculate_path_distance(source_to_connector.get("points", []))
-                })
-            
-            # Vertical transition
-            vertical_transitions.append({
-                "connector_type": best_source_connector.connector_type,
-                "connector_name": best_source_connector.name,
-                "from_floor": source.floor_id,
-                "to_floor": destination.floor_id,
-                "shared_id": best_source_connector.shared_id,
-                "instructions": f"Take {best_source_connector.connector_type} from floor {source.floor_id} to floor {destination.floor_id}",
-                "estimated_time": self._get_connector_time(best_source_connector.connector_type)
-            })
-            
-            # Segment 2: Destination connector to destination
-            connector_to_dest = await self._find_path_on_floor(
-                destination.floor_id,
-                dest_connector.connector_id,
-                destination.location_id
-            )
-            
-            if connector_to_dest:
-                route_segments.append({
-                    "floor_id": destination.floor_id,
-                    "segment_type": "horizontal", 
-                    "path": connector_to_dest,
-                    "instructions": f"Walk from {dest_connector.name} to {destination.name}",
-                    "distance": self._calculate_path_distance(connector_to_dest.get("points", []))
-                })
-            
-            # Calculate total estimated time
-            total_time = sum([segment.get("distance", 0) * 0.5 for segment in route_segments])  # 0.5 min per unit
-            total_time += sum([vt.get("estimated_time", 0) for vt in vertical_transitions])
-            
-            return MultiFloorRoute(
-                total_floors=len(set([source.floor_id, destination.floor_id])),
-                route_segments=route_segments,
-                vertical_transitions=vertical_transitions,
-                estimated_time=int(total_time)
-            )
-            
-        except Exception as e:
-            logger.error(f"Error in multi-floor routing: {str(e)}")
-            raise
-    
-    async def _find_single_floor_route(self, source: Location, destination: Location) -> MultiFloorRoute:
-        """
-        Find route on single floor
-        """
-        try:
-            path = await self._find_path_on_floor(
-                source.floor_id,
-                source.location_id,
-                destination.location_id
-            )
-            
-            route_segments = []
-            if path:
-                route_segments.append({
-                    "floor_id": source.floor_id,
-                    "segment_type": "horizontal",
-                    "path": path,
-                    "instructions": f"Walk from {source.name} to {destination.name}",
-                    "distance": self._calculate_path_distance(path.get("points", []))
-                })
-            
-            total_time = sum([segment.get("distance", 0) * 0.5 for segment in route_segments])
-            
-            return MultiFloorRoute(
-                total_floors=1,
-                route_segments=route_segments,
-                vertical_transitions=[],
-                estimated_time=int(total_time)
-            )
-            
-        except Exception as e:
-            logger.error(f"Error in single floor routing: {str(e)}")
-            raise
+    async def find_routes_to_many(
+        self,
+        source_location_id: str,
+        destination_location_ids: List[str],
+        preferred_connector_type: Optional[str] = None
+    ) -> Dict[str, Optional[MultiFloorRoute]]:
+        """
+        Route from one source to many destinations using a single Dijkstra expansion
+        (or the precomputed table for kiosk/entrance sources). Unreachable destinations map to None.
+        """
+        graph = await self.graph_cache.get_node_graph(source_location_id)
+        source = graph.nodes.get(source_location_id) if graph else None
+        if not source:
+            raise ValueError("Source location not found")
 
+        targets = {d for d in destination_location_ids if d in graph.nodes}
+        table = self.route_tables.get(graph)
+        if table and not preferred_connector_type and table.has_source(source.node_id):
+            reconstruct = lambda d: table.reconstruct(source.node_id, d)
+        else:
+            connector_type = preferred_connector_type.lower() if preferred_connector_type else None
+            _, previous = self._shortest_path_tree(graph, source.node_id, connector_type, targets)
+            fallback: Dict[str, str] = {}
+            if connector_type and targets - set(previous) - {source.node_id}:
+                # Fall back to any connector for destinations the preferred type cannot reach
+                _, fallback = self._shortest_path_tree(graph, source.node_id, None, targets - set(previous))
+            reconstruct = lambda d: (
+                self._reconstruct(previous, source.node_id, d) or self._reconstruct(fallback, source.node_id, d)
+            )
 
-    async def _get_floor_connectors(self, floor_id: str) -> List[VerticalConnector]:
-        """
-        Get all vertical connectors on a specific floor
-        """
-        try:
-            connectors = await VerticalConnector.find(
-                VerticalConnector.floor_id == floor_id,
-                VerticalConnector.status == "active"
-            ).to_list()
-            return connectors
-        except Exception as e:
-            logger.error(f"Error getting floor connectors: {str(e)}")
-            return []
+        routes: Dict[str, Optional[MultiFloorRoute]] = {}
+        for destination_id in destination_location_ids:
+            node_ids = reconstruct(destination_id) if destination_id in targets else None
+            routes[destination_id] = self._build_route(graph, node_ids) if node_ids else None
+        return routes
     
-    async def _get_connectors_by_shared_id(self, shared_id: str, floor_id: str) -> List[VerticalConnector]:
-        """
-        Get connectors with same shared_id on specific floor
-        """
-        try:
-            connectors = await VerticalConnector.find(
-                VerticalConnector.shared_id == shared_id,
-                VerticalConnector.floor_id == floor_id,
-                VerticalConnector.status == "active"
-            ).to_list()
-            return connectors
-        except Exception as e:
-            logger.error(f"Error getting connectors by shared ID: {str(e)}")
-            return []
-    
-    async def _find_nearest_connector(
-        self, 
-        location: Location, 
-        connectors: List[VerticalConnector],
-        preferred_type: Optional[str] = None
-    ) -> Optional[VerticalConnector]:
-        """
-        Find nearest vertical connector to a location
-        """
-        if not connectors:
+    def _reconstruct(self, previous: Dict[str, str], source_id: str, destination_id: str) -> Optional[List[str]]:
+        if destination_id != source_id and destination_id not in previous:
             return None
-        
-        # Filter by preferred type if specified
-        if preferred_type:
-            filtered_connectors = [c for c in connectors if c.connector_type == preferred_type]
-            if filtered_connectors:
-                connectors = filtered_connectors
-        
-        # Calculate distances and find nearest
-        nearest_connector = None
-        min_distance = float('inf')
-        
-        for connector in connectors:
-            distance = self._calculate_euclidean_distance(
-                location.x, location.y,
-                connector.x, connector.y
-            )
-            
-            if distance < min_distance:
-                min_distance = distance
-                nearest_connector = connector
-        
-        return nearest_connector
+        node_ids = [destination_id]
+        while node_ids[-1] != source_id:
+            node_ids.append(previous[node_ids[-1]])
+        node_ids.reverse()
+        return node_ids
     
-    async def _find_path_on_floor(self, floor_id: str, source_id: str, destination_id: str) -> Optional[Dict[str, Any]]:
+    def _search_route(
+        self,
+        graph: BuildingGraph,
+        source: GraphNode,
+        destination: GraphNode,
+        preferred_connector: Optional[str] = None
+    ) -> Optional[List[str]]:
         """
-        Find path between two points on the same floor
+        Search the whole building at once; a preferred connector type is tried first, then any connector
         """
-        try:
-            # Look for existing path
-            path = await Path.find_one({
-                "floor_id": floor_id,
-                "$or": [
-                    {"source_tag_id": source_id, "destination_tag_id": destination_id},
-                    {"source_tag_id": destination_id, "destination_tag_id": source_id}
-                ],
-                "status": "active",
-                "is_published": True
-            })
-            
-            if path:
-                return {
-                    "path_id": path.path_id,
-                    "name": path.name,
-                    "points": [{"x": p.x, "y": p.y} for p in path.points],
-                    "color": path.color,
-                    "shape": path.shape,
-                    "width": path.width,
-                    "height": path.height,
-                    "radius": path.radius
-                }
-            
-            # If no direct path found, try to find indirect path through graph traversal
-            return await self._find_indirect_path(floor_id, source_id, destination_id)
-            
-        except Exception as e:
-            logger.error(f"Error finding path on floor: {str(e)}")
-            return None
+        if preferred_connector:
+            node_ids = self._a_star(graph, source, destination, preferred_connector.lower())
+            if node_ids is not None:
+                return node_ids
+        return self._a_star(graph, source, destination)
     
-    async def _find_indirect_path(self, floor_id: str, source_id: str, destination_id: str) -> Optional[Dict[str, Any]]:
-        """
-        Find indirect path using graph traversal (Dijkstra's algorithm)
-        """
-        try:
-            # Build graph for the floor
-            graph = await self._build_floor_graph(floor_id)
-            
-            if source_id not in graph or destination_id not in graph:
+    def _a_star(
+        self,
+        graph: BuildingGraph,
+        source: GraphNode,
+        destination: GraphNode,
+        connector_type: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """
+        A* over horizontal path edges and vertical shared_id links, with costs in minutes.
+
+        The heuristic charges every remaining floor at the cheapest connector time and the remaining
+        straight-line distance at the cheapest displacement rate; since linked connectors may be offset
+        by up to `max_connector_shift`, each floor hop can cover that much distance for free.
+        """
+        walk = self.WALK_MINUTES_PER_UNIT
+        min_hop = min((self._get_connector_time(t) for t in graph.connector_types), default=0)
+        shift = graph.max_connector_shift
+        rate = min(walk, min_hop / shift) if shift > 0 else walk
+        target_rank = graph.floor_rank.get(destination.floor_id, 0)
+
+        def heuristic(node: GraphNode) -> float:
+            floors = abs(graph.floor_rank.get(node.floor_id, 0) - target_rank)
+            remaining = math.hypot(destination.x - node.x, destination.y - node.y) - floors * shift
+            return floors * min_hop + max(0.0, remaining) * rate
+
+        costs = {source.node_id: 0.0}
+        previous: Dict[str, str] = {}
+        pq = [(heuristic(source), 0.0, source.node_id)]
+        closed = set()
+        expansions = 0
+
+        while pq:
+            _, cost, current = heapq.heappop(pq)
+            if current in closed:
+                continue
+            if current == destination.node_id:
+                break
+
+            closed.add(current)
+            expansions += 1
+            if expansions > self.MAX_EXPANSIONS:
+                logger.warning(f"A* expansion limit reached in building {graph.building_id}")
                 return None
-            
-            # Use Dijkstra's algorithm
-            distances = {node: float('inf') for node in graph}
-            distances[source_id] = 0
-            previous = {}
-            pq = [(0, source_id)]
-            visited = set()
-            
-            while pq:
-                current_distance, current_node = heapq.heappop(pq)
-                
-                if current_node in visited:
+
+            for neighbor, weight in self._neighbors(graph, current, connector_type):
+                if neighbor in closed:
                     continue
-                
-                visited.add(current_node)
-                
-                if current_node == destination_id:
+                new_cost = cost + weight
+                if new_cost < costs.get(neighbor, math.inf):
+                    costs[neighbor] = new_cost
+                    previous[neighbor] = current
+                    heapq.heappush(pq, (new_cost + heuristic(graph.nodes[neighbor]), new_cost, neighbor))
+
+        return self._reconstruct(previous, source.node_id, destination.node_id)
+    
+    def _neighbors(self, graph: BuildingGraph, node_id: str, connector_type: Optional[str] = None):
+        """
+        Yield (neighbor, cost in minutes) over walking edges and, for connectors, vertical links
+        """
+        for neighbor, distance in graph.adjacency.get(node_id, {}).items():
+            yield neighbor, distance * self.WALK_MINUTES_PER_UNIT
+        node = graph.nodes[node_id]
+        if node.connector_type and (connector_type is None or node.connector_type == connector_type):
+            for neighbor in graph.vertical.get(node_id, []):
+                yield neighbor, self._get_vertical_time(graph, node, graph.nodes[neighbor])
+    
+    def _shortest_path_tree(
+        self,
+        graph: BuildingGraph,
+        source_id: str,
+        connector_type: Optional[str] = None,
+        targets: Optional[set] = None
+    ) -> Tuple[Dict[str, float], Dict[str, str]]:
+        """
+        Dijkstra from one source over the whole building; returns settled costs and predecessors.
+        When targets are given the expansion stops as soon as all of them are settled.
+        """
+        costs = {source_id: 0.0}
+        previous: Dict[str, str] = {}
+        pq = [(0.0, source_id)]
+        closed = set()
+        pending = set(targets) if targets else None
+
+        while pq:
+            cost, current = heapq.heappop(pq)
+            if current in closed:
+                continue
+            closed.add(current)
+            if pending is not None:
+                pending.discard(current)
+                if not pending:
                     break
-                
-                for neighbor, weight in graph[current_node]:
-                    distance = current_distance + weight
-                    
-                    if distance < distances[neighbor]:
-                        distances[neighbor] = distance
-                        previous[neighbor] = current_node
-                        heapq.heappush(pq, (distance, neighbor))
-            
-            # Reconstruct path
-            if destination_id not in previous and destination_id != source_id:
-                return None
-            
-            path_nodes = []
-            current = destination_id
-            while current is not None:
-                path_nodes.append(current)
-                current = previous.get(current)
-            
-            path_nodes.reverse()
-            
-            # Convert to coordinate points
-            points = await self._convert_nodes_to_points(path_nodes)
-            
-            return {
-                "path_id": f"generated_{source_id}_{destination_id}",
-                "name": f"Route to destination",
-                "points": points,
-                "color": "#3b82f6",
-                "shape": "circle",
-                "radius": 0.01
-            }
-            
-        except Exception as e:
-            logger.error(f"Error finding indirect path: {str(e)}")
-            return None
 
+            for neighbor, weight in self._neighbors(graph, current, connector_type):
+                new_cost = cost + weight
+                if neighbor not in closed and new_cost < costs.get(neighbor, math.inf):
+                    costs[neighbor] = new_cost
+                    previous[neighbor] = current
+                    heapq.heappush(pq, (new_cost, neighbor))
 
-    async def _build_floor_graph(self, floor_id: str) -> Dict[str, List[Tuple[str, float]]]:
+        return costs, previous
+    
+    async def precompute_route_table(self, building_id: str) -> RouteTable:
         """
-        Build graph representation of floor with locations and connectors
+        Build shortest-path trees from every kiosk and entrance location of a building
         """
-        graph = defaultdict(list)
-        
-        try:
-            # Get all paths on the floor
-            paths = await Path.find(
-                Path.floor_id == floor_id,
-                Path.status == "active",
-                Path.is_published == True
-            ).to_list()
-            
-            for path in paths:
-                if path.source_tag_id and path.destination_tag_id:
-                    # Calculate weight based on path distance
-                    weight = self._calculate_path_distance([{"x": p.x, "y": p.y} for p in path.points])
-                    
-                    # Add bidirectional edges
-                    graph[path.source_tag_id].append((path.destination_tag_id, weight))
-                    graph[path.destination_tag_id].append((path.source_tag_id, weight))
-            
-            return dict(graph)
-            
-        except Exception as e:
-            logger.error(f"Error building floor graph: {str(e)}")
-            return {}
+        version = self.route_tables.version(building_id)
+        graph = await self.graph_cache.get_building_graph(building_id)
+
+        start = time.time()
+        table = RouteTable(graph, version)
+        for source_id in route_sources(graph):
+            costs, previous = self._shortest_path_tree(graph, source_id)
+            table.add_source(source_id, costs, previous)
+
+        stored = self.route_tables.store(table)
+        logger.info(
+            f"Route table for building {building_id} v{version}: {len(table.predecessors)} sources, "
+            f"{len(table.node_ids)} nodes in {time.time() - start:.4f}s (stored={stored})"
+        )
+        return table
     
-    async def _convert_nodes_to_points(self, node_ids: List[str]) -> List[Dict[str, float]]:
+    def _build_route(self, graph: BuildingGraph, node_ids: List[str]) -> MultiFloorRoute:
         """
-        Convert node IDs to coordinate points
+        Split a node sequence into per-floor walking segments and vertical transitions
         """
-        points = []
-        
-        try:
-            for node_id in node_ids:
-                # Try to find as location first
-                location = await Location.find_one(Location.location_id == node_id)
-                if location:
-                    points.append({"x": location.x, "y": location.y})
+        route_segments = []
+        vertical_transitions = []
+
+        legs: List[List[GraphNode]] = [[graph.nodes[node_ids[0]]]]
+        for node_id in node_ids[1:]:
+            node = graph.nodes[node_id]
+            if node.floor_id == legs[-1][-1].floor_id:
+                legs[-1].append(node)
+            else:
+                legs.append([node])
+
+        for index, leg in enumerate(legs):
+            if len(leg) > 1:
+                points = [{"x": n.x, "y": n.y} for n in leg]
+                route_segments.append({
+                    "floor_id": leg[0].floor_id,
+                    "segment_type": "horizontal",
+                    "path": {
+                        "path_id": f"generated_{leg[0].node_id}_{leg[-1].node_id}",
+                        "name": "Route to destination",
+                        "node_ids": [n.node_id for n in leg],
+                        "points": points,
+                        "color": "#3b82f6",
+                        "shape": "circle",
+                        "radius": 0.01
+                    },
+                    "instructions": f"Walk from {leg[0].name or leg[0].kind} to {leg[-1].name or leg[-1].kind}",
+                    "distance": self._calculate_path_distance(points)
+                })
+
+            if index + 1 < len(legs):
+                connector = leg[-1]
+                arrival = legs[index + 1][0]
+                # Consecutive hops in one shaft are a single ride
+                if vertical_transitions and vertical_transitions[-1]["to_floor"] == connector.floor_id and len(leg) == 1:
+                    vertical_transitions[-1]["to_floor"] = arrival.floor_id
+                    vertical_transitions[-1]["estimated_time"] += self._get_vertical_time(graph, connector, arrival)
+                    vertical_transitions[-1]["instructions"] = (
+                        f"Take {connector.connector_type} from floor {vertical_transitions[-1]['from_floor']} to floor {arrival.floor_id}"
+                    )
                     continue
-                
-                # Try to find as vertical connector
-                connector = await VerticalConnector.find_one(VerticalConnector.connector_id == node_id)
-                if connector:
-                    points.append({"x": connector.x, "y": connector.y})
-            
-            return points
-            
-        except Exception as e:
-            logger.error(f"Error converting nodes to points: {str(e)}")
-            return []
+                vertical_transitions.append({
+                    "connector_type": connector.connector_type,
+                    "connector_name": connector.name,
+                    "from_floor": connector.floor_id,
+                    "to_floor": arrival.floor_id,
+                    "shared_id": connector.shared_id,
+                    "instructions": f"Take {connector.connector_type} from floor {connector.floor_id} to floor {arrival.floor_id}",
+                    "estimated_time": self._get_vertical_time(graph, connector, arrival)
+                })
+
+        # Calculate total estimated time
+        total_time = sum([segment.get("distance", 0) * self.WALK_MINUTES_PER_UNIT for segment in route_segments])
+        total_time += sum([vt.get("estimated_time", 0) for vt in vertical_transitions])
+
+        return MultiFloorRoute(
+            total_floors=len({leg[0].floor_id for leg in legs}),
+            route_segments=route_segments,
+            vertical_transitions=vertical_transitions,
+            estimated_time=int(total_time)
+        )
     
     def _calculate_euclidean_distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
         """
@@ -391,18 +314,7 @@ class NavigationService:
         """
         Calculate total distance of a path
         """
-        if len(points) < 2:
-            return 0.0
-        
-        total_distance = 0.0
-        for i in range(1, len(points)):
-            distance = self._calculate_euclidean_distance(
-                points[i-1]["x"], points[i-1]["y"],
-                points[i]["x"], points[i]["y"]
-            )
-            total_distance += distance
-        
-        return total_distance
+        return geometry.polyline_length(points)
     
     def _get_connector_time(self, connector_type: str) -> int:
         """
@@ -416,6 +328,13 @@ class NavigationService:
         }
         return time_map.get(connector_type.lower(), 2)
     
+    def _get_vertical_time(self, graph: BuildingGraph, origin: GraphNode, arrival: GraphNode) -> int:
+        """
+        Time to ride a connector between two floors; a shaft that skips floors is charged per floor passed
+        """
+        floors = abs(graph.floor_rank.get(arrival.floor_id, 0) - graph.floor_rank.get(origin.floor_id, 0))
+        return self._get_connector_time(origin.connector_type) * max(1, floors)
+    
     async def get_floor_locations(self, floor_id: str) -> List[Dict[str, Any]]:
         """
         Get all locations on a specific floor
@@ -476,28 +395,26 @@ class NavigationService:
     
     async def get_floor_paths(self, floor_id: str) -> List[Dict[str, Any]]:
         """
-        Get all paths on a specific floor
+        Get all published paths touching a specific floor, with the segment(s) drawn on that floor
         """
         try:
-            paths = await Path.find(
-                Path.floor_id == floor_id,
-                Path.status == "active",
-                Path.is_published == True
-            ).to_list()
+            paths = await Path.find({
+                "floors": floor_id,
+                "status": "active",
+                "is_published": True
+            }).to_list()
             
             return [
                 {
                     "path_id": path.path_id,
                     "name": path.name,
-                    "source_tag_id": path.source_tag_id,
-                    "destination_tag_id": path.destination_tag_id,
-                    "points": [{"x": p.x, "y": p.y} for p in path.points],
-                    "color": path.color,
-                    "shape": path.shape,
-                    "width": path.width,
-                    "height": path.height,
-                    "radius": path.radius,
-                    "description": path.description
+                    "start_point_id": path.start_point_id,
+                    "end_point_id": path.end_point_id,
+                    "is_multifloor": path.is_multifloor,
+                    "floor_segments": [
+                        seg.model_dump() for seg in path.floor_segments if seg.floor_id == floor_id
+                    ],
+                    "tags": path.tags
                 }
                 for path in paths
             ]
@@ -517,22 +434,14 @@ class NavigationService:
         }
         
         try:
-            # Check if source location exists
-            source_location = await Location.find_one(
-                Location.location_id == request.source_location_id,
-                Location.status == "active"
-            )
+            graph = await self.graph_cache.get_node_graph(request.source_location_id)
+            source_location = graph.nodes.get(request.source_location_id) if graph else None
+            destination_location = graph.nodes.get(request.destination_location_id) if graph else None
             
             if not source_location:
                 validation_result["is_valid"] = False
                 validation_result["errors"].append("Source location not found or inactive")
             
-            # Check if destination location exists
-            destination_location = await Location.find_one(
-                Location.location_id == request.destination_location_id,
-                Location.status == "active"
-            )
-            
             if not destination_location:
                 validation_result["is_valid"] = False
                 validation_result["errors"].append("Destination location not found or inactive")
@@ -548,8 +457,9 @@ class NavigationService:
             # Check if locations are on different floors and connectors exist
             if source_location and destination_location:
                 if source_location.floor_id != destination_location.floor_id:
-                    source_connectors = await self._get_floor_connectors(source_location.floor_id)
-                    dest_connectors = await self._get_floor_connectors(destination_location.floor_id)
+                    kind = NodeKind.VERTICAL_CONNECTOR.value
+                    source_connectors = graph.floor_nodes(source_location.floor_id, kind)
+                    dest_connectors = graph.floor_nodes(destination_location.floor_id, kind)
                     
                     if not source_connectors:
                         validation_result["is_valid"] = False
@@ -558,15 +468,20 @@ class NavigationService:
                     if not dest_connectors:
                         validation_result["is_valid"] = False
                         validation_result["errors"].append("No vertical connectors found on destination floor")
-                    
-                    # Check if there are matching connectors between floors
-                    if source_connectors and dest_connectors:
-                        source_shared_ids = {c.shared_id for c in source_connectors}
-                        dest_shared_ids = {c.shared_id for c in dest_connectors}
-                        
-                        if not source_shared_ids.intersection(dest_shared_ids):
-                            validation_result["is_valid"] = False
-                            validation_result["errors"].append("No connecting vertical connectors found between floors")
+                
+                if validation_result["is_valid"] and self._search_route(
+                    graph, source_location, destination_location, request.preferred_connector_type
+                ) is None:
+                    validation_result["is_valid"] = False
+                    validation_result["errors"].append("No published route connects source and destination")
+                    nearest = graph.nearest_connectors(
+                        source_location.floor_id, source_location.x, source_location.y,
+                        connector_type=request.preferred_connector_type
+                    )
+                    if nearest:
+                        validation_result["warnings"].append(
+                            f"Nearest {nearest[0].connector_type} to source is '{nearest[0].name}' ({nearest[0].node_id})"
+                        )
             
             return validation_result
             
@@ -581,3 +496,15 @@ class NavigationService:
 
 # Create global instance
 navigation_service = NavigationService()
+
+
+async def on_paths_published(events: List[PathPublished]) -> None:
+    # Publishing changes the walkable graph; rebuild kiosk routes once per building in the batch
+    for building_id in dict.fromkeys(event.building_id for event in events if event.building_id):
+        # The graph and route table listeners skip PathPublished, so invalidate-then-rebuild stays ordered
+        navigation_service.graph_cache.invalidate_building(building_id)
+        navigation_service.route_tables.invalidate(building_id)
+        await navigation_service.precompute_route_table(building_id)
+
+
+domain_events.subscribe((PathPublished,), on_paths_published)
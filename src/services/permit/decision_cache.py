@@ -0,0 +1,128 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from collections import OrderedDict, defaultdict
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Decisions are reused for this long; role changes made through PermitService invalidate sooner
+DECISION_TTL_SECONDS = 60
+
+# Most decisions kept; least recently used are evicted first
+MAX_CACHED_DECISIONS = 10000
+
+# (user, action, resource, tenant)
+DecisionKey = Tuple[str, str, str, str]
+
+
+class DecisionEntry:
+    __slots__ = ("allowed", "expires_at", "user_generation", "tenant_generation")
+
+    def __init__(self, allowed: bool, expires_at: float, user_generation: int, tenant_generation: int):
+        self.allowed = allowed
+        self.expires_at = expires_at
+        self.user_generation = user_generation
+        self.tenant_generation = tenant_generation
+
+
+class PermissionDecisionCache:
+    """
+    Local cache of PDP allow/deny decisions keyed by (user, action, resource, tenant).
+    Invalidating a user or tenant bumps its generation, so every decision made before is
+    ignored without scanning the cache; a check in flight during the bump is not stored.
+    """
+
+    def __init__(self, ttl: float = DECISION_TTL_SECONDS, max_entries: int = MAX_CACHED_DECISIONS):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[DecisionKey, DecisionEntry]" = OrderedDict()
+        self._user_generation: Dict[str, int] = defaultdict(int)
+        self._tenant_generation: Dict[str, int] = defaultdict(int)
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _lookup(self, key: DecisionKey) -> Optional[bool]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        user, _, _, tenant = key
+        if (
+            entry.expires_at <= time.monotonic()
+            or entry.user_generation != self._user_generation[user]
+            or entry.tenant_generation != self._tenant_generation[tenant]
+        ):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.allowed
+
+    def _store(self, key: DecisionKey, allowed: bool, user_generation: int, tenant_generation: int) -> None:
+        self._entries[key] = DecisionEntry(allowed, time.monotonic() + self.ttl, user_generation, tenant_generation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_check(
+        self,
+        user: str,
+        action: str,
+        resource: str,
+        tenant: str,
+        check: Callable[[], Awaitable[Any]],
+    ) -> bool:
+        key = (user, action, resource, tenant)
+        allowed = self._lookup(key)
+        if allowed is not None:
+            self.hits += 1
+            return allowed
+
+        self.misses += 1
+        epoch = self._epoch
+        user_generation = self._user_generation[user]
+        tenant_generation = self._tenant_generation[tenant]
+        allowed = bool(await check())
+
+        # Drop the decision if roles changed while the PDP was answering
+        if (
+            epoch == self._epoch
+            and user_generation == self._user_generation[user]
+            and tenant_generation == self._tenant_generation[tenant]
+        ):
+            self._store(key, allowed, user_generation, tenant_generation)
+        return allowed
+
+    def invalidate_user(self, user: str) -> None:
+        self._user_generation[user] += 1
+        self.invalidations += 1
+
+    def invalidate_tenant(self, tenant: str) -> None:
+        self._tenant_generation[tenant] += 1
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Forget every decision, e.g. after a role's permissions change"""
+        self._epoch += 1
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# Create global instance
+permission_decisions = PermissionDecisionCache()
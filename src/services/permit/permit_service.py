@@ -13,6 +13,8 @@ from permit import (
 )
 
 from src.datamodel.datavalidation.user import UserDetails
+from src.services.permit.decision_cache import permission_decisions
+from src.services.permit.policy_engine import policy_engine
 import uuid
 import random
 import re
@@ -26,8 +28,9 @@ def get_random_6_digit():
 logger = logging.getLogger(__name__)
 
 class PermitService:
-    def __init__(self):
-        self.permit = Permit(
+    def __init__(self, permit: Optional[Permit] = None):
+        # Tests can pass a fake exposing the same check() and api as the Permit client
+        self.permit = permit or Permit(
             pdp=PERMIT_PDP,
             token=PERMIT_API_KEY,
         )
@@ -95,6 +98,8 @@ class PermitService:
         try:
             # Delete the tenant using the Permit.io client
             await self.permit_client.tenants.delete(tenant_key)
+            permission_decisions.invalidate_tenant(tenant_key)
+            policy_engine.invalidate()
             return True
         except PermitApiError as e:
             logger.error(f"Error deleting organization from Permit.io: {e}")
@@ -128,6 +133,8 @@ class PermitService:
             await self.permit_client.users.assign_role(
                 {"user": user.email, "role": user.role, "tenant": tenant.key}
             )
+            permission_decisions.invalidate_user(user.email)
+            policy_engine.invalidate()
 
             return tenant
 
@@ -200,6 +207,8 @@ class PermitService:
             await self.permit_client.users.assign_role(
                 {"user": user.email, "role": role, "tenant": org_key}
             )
+            permission_decisions.invalidate_user(user.email)
+            policy_engine.invalidate()
 
             return new_user
 
@@ -221,6 +230,8 @@ class PermitService:
             await self.permit_client.users.unassign_role(
                 {"user": user_key, "role": role, "tenant": org_key}
             )
+            permission_decisions.invalidate_user(user_key)
+            policy_engine.invalidate()
 
         except PermitApiError as e:
             logger.error(msg=e, stack_info=True)
@@ -236,6 +247,8 @@ class PermitService:
             await self.permit_client.users.assign_role(
                 {"user": user_key, "role": role, "tenant": org_key}
             )
+            permission_decisions.invalidate_user(user_key)
+            policy_engine.invalidate()
 
         except PermitApiError as e:
             logger.error(msg=e, stack_info=True)
@@ -281,6 +294,8 @@ class PermitService:
             await self.permit_client.users.assign_role(
                 {"user": user.email, "role": role, "tenant": new_tenant.key}
             )
+            permission_decisions.invalidate_user(user.email)
+            policy_engine.invalidate()
 
             return new_tenant
             
@@ -319,6 +334,8 @@ class PermitService:
                 "role": role,
                 "tenant": org_key
             })
+            permission_decisions.invalidate_user(user_id)
+            policy_engine.invalidate()
 
             logger.info(f"Updated permissions for user {user_id} to {role} in organization {org_key}")
             
@@ -345,10 +362,17 @@ class PermitService:
 
     async def check_permission(self, user_id: str, action: str, resource: str, org_id: str):
         try:
-            return await self.permit.check(
-                {"key": user_id},
+            # Repeated checks are answered locally; the PDP is only asked on a miss
+            return await permission_decisions.get_or_check(
+                user_id,
                 action,
-                {"type": resource, "tenant": org_id}
+                resource,
+                org_id,
+                lambda: self.permit.check(
+                    {"key": user_id},
+                    action,
+                    {"type": resource, "tenant": org_id}
+                ),
             )
         except Exception as e:
             raise HTTPException(
@@ -398,6 +422,9 @@ async def create_role_with_assign_permission(self, role_key: str, name: str, des
                             "resource": permission['resource']
                         }]
                     )
+            # Everyone holding the role may now be allowed more
+            permission_decisions.clear()
+            policy_engine.invalidate()
         
         logger.info(f"Created role: {role_key} with name: {name}")
         return role
@@ -0,0 +1,228 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+from collections import OrderedDict
+import asyncio
+import time
+import logging
+
+from sqlalchemy import select
+
+from src.datamodel.database.userauth.AuthenticationTables import (
+    User, Role, UserEntityRoleMap, Permission, PermissionRoleMap
+)
+
+logger = logging.getLogger(__name__)
+
+
+# The role -> permission matrix is reloaded after this long; role changes made through PermitService reload sooner
+POLICY_REFRESH_SECONDS = 300
+
+# A user's roles in an organization are reused for this long
+USER_ROLES_TTL_SECONDS = 60
+
+# Most (user, organization) role sets kept; least recently used are evicted first
+MAX_CACHED_USER_ROLES = 10000
+
+# Permission names are "<resource>:<action>", matching the resource and action checked in Permit.io
+PERMISSION_SEPARATOR = ":"
+
+# (user_uuid, entity_uuid)
+UserRolesKey = Tuple[str, str]
+
+
+def _session_factory():
+    # Imported here so loading this module does not open the Postgres engine
+    from src.core.database.dbs.postgresql.connect import AsyncSessionLocal
+    return AsyncSessionLocal()
+
+
+def permission_key(permission_name: str) -> Optional[Tuple[str, str]]:
+    resource, sep, action = (permission_name or "").strip().lower().partition(PERMISSION_SEPARATOR)
+    if not sep or not resource or not action:
+        return None
+    return resource, action
+
+
+class PolicySnapshot:
+    """
+    The role -> permission matrix as one bit per permission: a role is an int whose set bits
+    are its permissions, so a user's roles combine with | and a check is a single &.
+    """
+    __slots__ = ("bits", "role_masks", "loaded_at")
+
+    def __init__(self, bits: Dict[Tuple[str, str], int], role_masks: Dict[int, int], loaded_at: float):
+        self.bits = bits
+        self.role_masks = role_masks
+        self.loaded_at = loaded_at
+
+    def mask_of(self, role_ids) -> int:
+        mask = 0
+        for role_id in role_ids:
+            mask |= self.role_masks.get(role_id, 0)
+        return mask
+
+    def allows(self, mask: int, resource: str, action: str) -> bool:
+        bit = self.bits.get((resource.lower(), action.lower()))
+        return bit is not None and bool(mask >> bit & 1)
+
+
+class UserRolesEntry:
+    __slots__ = ("role_ids", "expires_at", "generation")
+
+    def __init__(self, role_ids: Tuple[int, ...], expires_at: float, generation: int):
+        self.role_ids = role_ids
+        self.expires_at = expires_at
+        self.generation = generation
+
+
+class PolicyEngine:
+    """
+    In-process evaluation of role-based permissions from the roles mirrored in Postgres
+    (Role, Permission, PermissionRoleMap, UserEntityRoleMap), so checks need no call to the PDP.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] = _session_factory,
+        refresh_seconds: float = POLICY_REFRESH_SECONDS,
+        user_roles_ttl: float = USER_ROLES_TTL_SECONDS,
+        max_user_roles: int = MAX_CACHED_USER_ROLES,
+    ):
+        self.session_factory = session_factory
+        self.refresh_seconds = refresh_seconds
+        self.user_roles_ttl = user_roles_ttl
+        self.max_user_roles = max_user_roles
+        self._snapshot: Optional[PolicySnapshot] = None
+        self._stale = True
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._user_roles: "OrderedDict[UserRolesKey, UserRolesEntry]" = OrderedDict()
+        self._consistency_tasks: Set[asyncio.Task] = set()
+        self.checks = 0
+        self.reloads = 0
+        self.reload_failures = 0
+        self.consistency_checks = 0
+        self.mismatches = 0
+
+    async def _load_snapshot(self) -> PolicySnapshot:
+        async with self.session_factory() as db:
+            permissions = (await db.execute(
+                select(Permission.permission_id, Permission.permission_name).where(Permission.is_active == True)
+            )).all()
+            grants = (await db.execute(
+                select(PermissionRoleMap.role_id, PermissionRoleMap.permission_id)
+                .join(Role, Role.role_id == PermissionRoleMap.role_id)
+                .where(Role.is_active == True)
+            )).all()
+
+        bits: Dict[Tuple[str, str], int] = {}
+        bit_of_permission: Dict[int, int] = {}
+        for permission_id, permission_name in permissions:
+            key = permission_key(permission_name)
+            if key is None:
+                logger.warning(f"Permission {permission_id} '{permission_name}' is not '<resource>{PERMISSION_SEPARATOR}<action>'; ignored by the policy engine")
+                continue
+            bit_of_permission[permission_id] = bits.setdefault(key, len(bits))
+
+        role_masks: Dict[int, int] = {}
+        for role_id, permission_id in grants:
+            bit = bit_of_permission.get(permission_id)
+            if bit is not None:
+                role_masks[role_id] = role_masks.get(role_id, 0) | 1 << bit
+        return PolicySnapshot(bits, role_masks, time.monotonic())
+
+    async def snapshot(self) -> PolicySnapshot:
+        """The current matrix, reloaded when stale. A failed reload keeps serving the previous one."""
+        if self._snapshot is not None and not self._stale and time.monotonic() - self._snapshot.loaded_at < self.refresh_seconds:
+            return self._snapshot
+        async with self._lock:
+            if self._snapshot is not None and not self._stale and time.monotonic() - self._snapshot.loaded_at < self.refresh_seconds:
+                return self._snapshot
+            self._stale = False
+            try:
+                self._snapshot = await self._load_snapshot()
+                self.reloads += 1
+            except Exception as e:
+                self.reload_failures += 1
+                if self._snapshot is None:
+                    self._stale = True
+                    raise
+                logger.error(f"Policy reload failed, keeping the matrix loaded {int(time.monotonic() - self._snapshot.loaded_at)}s ago: {str(e)}")
+            return self._snapshot
+
+    async def _roles_of(self, user_uuid: str, entity_uuid: str) -> Tuple[int, ...]:
+        key = (user_uuid, entity_uuid)
+        entry = self._user_roles.get(key)
+        if entry is not None and entry.expires_at > time.monotonic() and entry.generation == self._generation:
+            self._user_roles.move_to_end(key)
+            return entry.role_ids
+
+        generation = self._generation
+        async with self.session_factory() as db:
+            role_ids = tuple((await db.execute(
+                select(UserEntityRoleMap.role_id)
+                .join(User, User.user_uuid == UserEntityRoleMap.user_uuid)
+                .where(
+                    UserEntityRoleMap.user_uuid == user_uuid,
+                    UserEntityRoleMap.entity_uuid == entity_uuid,
+                    User.is_active == True,
+                )
+            )).scalars().all())
+
+        # Drop the result if roles changed while it was being read
+        if generation == self._generation:
+            self._user_roles[key] = UserRolesEntry(role_ids, time.monotonic() + self.user_roles_ttl, generation)
+            self._user_roles.move_to_end(key)
+            while len(self._user_roles) > self.max_user_roles:
+                self._user_roles.popitem(last=False)
+        return role_ids
+
+    async def allows(self, user_uuid: str, entity_uuid: str, resource: str, action: str) -> bool:
+        if not user_uuid or not entity_uuid:
+            return False
+        self.checks += 1
+        snapshot = await self.snapshot()
+        role_ids = await self._roles_of(user_uuid, entity_uuid)
+        return snapshot.allows(snapshot.mask_of(role_ids), resource, action)
+
+    def check_consistency(self, allowed: bool, remote_check: Callable[[], Awaitable[Any]], description: str) -> None:
+        """Ask the PDP in the background and log when it disagrees with a local decision"""
+
+        async def compare():
+            try:
+                remote_allowed = bool(await remote_check())
+            except Exception as e:
+                logger.warning(f"Policy consistency check failed for {description}: {str(e)}")
+                return
+            self.consistency_checks += 1
+            if remote_allowed != allowed:
+                self.mismatches += 1
+                logger.warning(f"Policy mismatch for {description}: local={allowed} permit={remote_allowed}")
+
+        task = asyncio.create_task(compare())
+        self._consistency_tasks.add(task)
+        task.add_done_callback(self._consistency_tasks.discard)
+
+    def invalidate(self) -> None:
+        """Reload the matrix and every user's roles on their next check"""
+        self._stale = True
+        self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "loaded": snapshot is not None,
+            "age_seconds": round(time.monotonic() - snapshot.loaded_at, 1) if snapshot else None,
+            "refresh_seconds": self.refresh_seconds,
+            "permissions": len(snapshot.bits) if snapshot else 0,
+            "roles": len(snapshot.role_masks) if snapshot else 0,
+            "cached_user_roles": len(self._user_roles),
+            "checks": self.checks,
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+            "consistency_checks": self.consistency_checks,
+            "mismatches": self.mismatches,
+        }
+
+
+# Create global instance
+policy_engine = PolicyEngine()
@@ -0,0 +1,134 @@
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+from abc import ABC, abstractmethod
+from collections import defaultdict
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Messages buffered per subscriber; a subscriber that falls further behind is told to resync
+SUBSCRIBER_QUEUE_SIZE = 100
+
+Deliver = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+def building_topic(building_id: str) -> str:
+    return f"building:{building_id}"
+
+
+def events_topic(entity_uuid: str) -> str:
+    # Events (announcements) are not tied to a building, so they are published per organization
+    return f"events:{entity_uuid}"
+
+
+class MapBroker(ABC):
+    """
+    Carries published messages to every process holding subscribers. start() is given the
+    hub's deliver callback; a broker backed by Redis, NATS, ... forwards what it receives to it.
+    """
+
+    @abstractmethod
+    async def start(self, deliver: Deliver) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+
+class LocalBroker(MapBroker):
+    """Delivers straight back into this process; enough for a single worker"""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        if self._deliver is not None:
+            await self._deliver(topic, message)
+
+
+class Subscription:
+    """Messages for a set of topics, read with get(); close() when the client goes away"""
+
+    def __init__(self, hub: "ChangeHub", topics: List[str]):
+        self.hub = hub
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def push(self, topic: str, message: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Drop the backlog; the client catches up through the sync endpoint instead
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "overflow", "topic": topic})
+
+    async def get(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.hub.unsubscribe(self)
+
+
+class ChangeHub:
+    """
+    In-process pub/sub for map and event change notifications. Publishing goes through the
+    broker so that subscribers connected to other processes receive it too.
+    """
+
+    def __init__(self, broker: Optional[MapBroker] = None):
+        self._broker: MapBroker = broker or LocalBroker()
+        self._started = False
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+
+    async def set_broker(self, broker: MapBroker) -> None:
+        if self._started:
+            await self._broker.stop()
+            self._started = False
+        self._broker = broker
+
+    async def _ensure_started(self) -> None:
+        if not self._started:
+            await self._broker.start(self.deliver)
+            self._started = True
+
+    def subscribe(self, topics: Iterable[str]) -> Subscription:
+        subscription = Subscription(self, list(dict.fromkeys(topics)))
+        for topic in subscription.topics:
+            self._subscriptions[topic].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        for topic in subscription.topics:
+            subscribers = self._subscriptions.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[topic]
+
+    def subscriber_count(self, topic: str) -> int:
+        return len(self._subscriptions.get(topic, ()))
+
+    async def deliver(self, topic: str, message: Dict[str, Any]) -> None:
+        for subscription in list(self._subscriptions.get(topic, ())):
+            subscription.push(topic, message)
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        """Publish a change notification; failures are logged and never fail the write"""
+        try:
+            await self._ensure_started()
+            await self._broker.publish(topic, message)
+        except Exception as e:
+            logger.error(f"Failed to publish change notification on {topic}: {str(e)}")
+
+
+# Create global instance
+change_hub = ChangeHub()
@@ -0,0 +1,463 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from bisect import bisect_left
+from collections import defaultdict
+import asyncio
+import heapq
+import re
+import time
+import logging
+
+from fuzzywuzzy import fuzz
+
+from src.datamodel.database.domain.DigitalSignage import Location, Floor
+from src.utility.mapStateModified import MapChange, register_map_listener
+
+logger = logging.getLogger(__name__)
+
+
+# Relevance weight of a match per field, highest wins when a term appears in several fields
+FIELD_WEIGHTS = {"name": 3.0, "category": 2.0, "description": 0.5}
+
+# Score of a query term against an indexed term, by kind of match
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+SUBSTRING_SCORE = 0.7
+FUZZY_SCORE = 0.6
+FUZZY_MIN_RATIO = 75
+
+# Locations on floors that are not assigned to a building
+UNASSIGNED = ""
+
+# Autocomplete prefixes up to this length keep their top-k results between writes
+AUTOCOMPLETE_CACHED_PREFIX = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class Suggestion(NamedTuple):
+    label: str
+    kind: str
+    weight: float
+    location_id: Optional[str] = None
+    floor_id: Optional[str] = None
+    category: Optional[str] = None
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def _grams(token: str) -> Set[str]:
+    # Padded so short terms still get grams and word starts/ends count
+    token = f"^{token}$"
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def _suggestion_keys(label: str) -> List[str]:
+    # Every word start is a key, so "cof" finds "Starbucks Coffee"
+    tokens = tokenize(label)
+    return [" ".join(tokens[i:]) for i in range(len(tokens))]
+
+
+def _popularity(location: Location) -> float:
+    value = (location.metadata or {}).get("popularity", 0)
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def _field_values(location: Location) -> Dict[str, str]:
+    category = location.category.value if hasattr(location.category, "value") else location.category
+    return {"name": location.name or "", "category": category or "", "description": location.description or ""}
+
+
+class BuildingSearchIndex:
+    """
+    Inverted index of one building's locations (term -> location -> best field weight) plus a
+    trigram index over the term vocabulary for substring and typo-tolerant matches.
+    """
+
+    def __init__(self, building_id: str, locations: Iterable[Location] = ()):
+        self.building_id = building_id
+        self.docs: Dict[str, Location] = {}
+        self.postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self.grams: Dict[str, Set[str]] = defaultdict(set)
+        self.exact: Dict[str, Set[str]] = defaultdict(set)
+        self._doc_terms: Dict[str, Set[str]] = {}
+        self._doc_exact: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._suggestion_keys: List[str] = []
+        self._suggestion_entries: List[int] = []
+        self._suggestions: List[Suggestion] = []
+        self._suggestions_dirty = True
+        self._top_cache: Dict[Tuple[str, int, Optional[str]], List[Suggestion]] = {}
+        for location in locations:
+            self.add(location)
+
+    def add(self, location: Location) -> None:
+        self.remove(location.location_id)
+        doc_id = location.location_id
+        fields = _field_values(location)
+
+        terms: Dict[str, float] = {}
+        for field, text in fields.items():
+            for term in tokenize(text):
+                terms[term] = max(terms.get(term, 0.0), FIELD_WEIGHTS[field])
+        for term, weight in terms.items():
+            if term not in self.postings:
+                self._vocabulary_dirty = True
+                for gram in _grams(term):
+                    self.grams[gram].add(term)
+            self.postings[term][doc_id] = weight
+
+        exact_values = {text.strip().lower() for text in fields.values() if text}
+        for value in exact_values:
+            self.exact[value].add(doc_id)
+
+        self.docs[doc_id] = location
+        self._suggestions_dirty = True
+        self._doc_terms[doc_id] = set(terms)
+        self._doc_exact[doc_id] = exact_values
+
+    def remove(self, doc_id: str) -> bool:
+        if doc_id not in self.docs:
+            return False
+        for term in self._doc_terms.pop(doc_id):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[term]
+                self._vocabulary_dirty = True
+                for gram in _grams(term):
+                    self.grams[gram].discard(term)
+                    if not self.grams[gram]:
+                        del self.grams[gram]
+        for value in self._doc_exact.pop(doc_id):
+            self.exact[value].discard(doc_id)
+            if not self.exact[value]:
+                del self.exact[value]
+        del self.docs[doc_id]
+        self._suggestions_dirty = True
+        return True
+
+    def _prefixed(self, prefix: str) -> List[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_dirty = False
+        matches = []
+        for i in range(bisect_left(self._vocabulary, prefix), len(self._vocabulary)):
+            term = self._vocabulary[i]
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
+
+    def _build_suggestions(self) -> None:
+        """
+        Sorted key array over published active location names and category labels.
+        Names weigh their metadata "popularity"; categories weigh how many locations use them.
+        """
+        suggestions: List[Suggestion] = []
+        categories: Dict[str, int] = defaultdict(int)
+        for location in self.docs.values():
+            if location.status != "active" or not location.is_published:
+                continue
+            category = _field_values(location)["category"]
+            categories[category] += 1
+            suggestions.append(Suggestion(
+                label=location.name,
+                kind="location",
+                weight=_popularity(location),
+                location_id=location.location_id,
+                floor_id=location.floor_id,
+                category=category,
+            ))
+        for category, count in categories.items():
+            suggestions.append(Suggestion(
+                label=category.replace("_", " ").title(), kind="category", weight=float(count), category=category
+            ))
+
+        pairs = sorted(
+            (key, i) for i, suggestion in enumerate(suggestions) for key in _suggestion_keys(suggestion.label)
+        )
+        self._suggestions = suggestions
+        self._suggestion_keys = [key for key, _ in pairs]
+        self._suggestion_entries = [i for _, i in pairs]
+        self._top_cache = {}
+        self._suggestions_dirty = False
+
+    def autocomplete(self, prefix: str, k: int = 10, floor_id: Optional[str] = None) -> List[Suggestion]:
+        if self._suggestions_dirty:
+            self._build_suggestions()
+        prefix = " ".join(tokenize(prefix))
+        if not prefix:
+            return []
+
+        cache_key = (prefix, k, floor_id)
+        cached = self._top_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        low = bisect_left(self._suggestion_keys, prefix)
+        high = bisect_left(self._suggestion_keys, prefix + "\uffff", low)
+        candidates = {
+            self._suggestions[i] for i in self._suggestion_entries[low:high]
+        }
+        if floor_id:
+            candidates = {c for c in candidates if c.floor_id in (None, floor_id)}
+        top = heapq.nlargest(k, candidates, key=lambda c: (c.weight, -len(c.label), c.label))
+
+        if len(prefix) <= AUTOCOMPLETE_CACHED_PREFIX:
+            self._top_cache[cache_key] = top
+        return top
+
+    def expand(self, token: str) -> Dict[str, float]:
+        """
+        Indexed terms matching one query token, with their match score.
+        """
+        matches: Dict[str, float] = {}
+        if token in self.postings:
+            matches[token] = EXACT_SCORE
+        for term in self._prefixed(token):
+            matches.setdefault(term, PREFIX_SCORE)
+
+        if len(token) >= 3:
+            # Terms sharing enough trigrams with the token are checked for substring or typo matches
+            query_grams = _grams(token)
+            overlap: Dict[str, int] = defaultdict(int)
+            for gram in query_grams:
+                for term in self.grams.get(gram, ()):
+                    overlap[term] += 1
+            threshold = max(1, len(query_grams) // 3)
+            for term, shared in overlap.items():
+                if term in matches or shared < threshold:
+                    continue
+                if token in term:
+                    matches[term] = SUBSTRING_SCORE
+                    continue
+                ratio = fuzz.ratio(token, term)
+                if ratio >= FUZZY_MIN_RATIO:
+                    matches[term] = FUZZY_SCORE * ratio / 100
+        return matches
+
+    def search(self, query: str, exact_match: bool = False) -> Dict[str, float]:
+        """
+        Score every location matching the query. Each query token must match some field,
+        exactly, as a prefix, as a substring or within typo distance.
+        """
+        normalized = query.strip().lower()
+        if exact_match:
+            return {doc_id: EXACT_SCORE for doc_id in self.exact.get(normalized, ())}
+
+        tokens = list(dict.fromkeys(tokenize(normalized)))
+        if not tokens:
+            return {}
+
+        scores: Optional[Dict[str, float]] = None
+        for token in tokens:
+            token_scores: Dict[str, float] = {}
+            for term, match in self.expand(token).items():
+                for doc_id, weight in self.postings[term].items():
+                    score = match * weight
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: s + token_scores[doc_id] for doc_id, s in scores.items() if doc_id in token_scores}
+            if not scores:
+                return {}
+
+        results = {}
+        for doc_id, score in scores.items():
+            score /= len(tokens)
+            name = (self.docs[doc_id].name or "").lower()
+            # Whole-phrase bonus keeps "starts with the query" ahead of scattered token matches
+            if name.startswith(normalized):
+                score += 1.0
+            elif normalized in name:
+                score += 0.5
+            results[doc_id] = round(score, 4)
+        return results
+
+
+class LocationSearchEngine:
+    """
+    Per-building BuildingSearchIndex objects, loaded on demand and kept current from mapStateModify.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[str, BuildingSearchIndex] = {}
+        self._floor_building: Dict[str, str] = {}
+        self._all_loaded = False
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    async def _building_for_floor(self, floor_id: str) -> Optional[str]:
+        building_id = self._floor_building.get(floor_id)
+        if building_id is None:
+            floor = await Floor.find_one({"floor_id": floor_id})
+            if not floor:
+                return None
+            building_id = floor.building_id or UNASSIGNED
+            self._floor_building[floor_id] = building_id
+        return building_id
+
+    async def _load(self, building_id: Optional[str]) -> Dict[str, BuildingSearchIndex]:
+        start = time.time()
+        generation = self._generation
+        if building_id is None:
+            floors, locations = await asyncio.gather(Floor.find_all().to_list(), Location.find_all().to_list())
+        else:
+            floors = await Floor.find({"building_id": building_id}).to_list()
+            locations = await Location.find({"floor_id": {"$in": [f.floor_id for f in floors]}}).to_list()
+
+        floor_building = {f.floor_id: f.building_id or UNASSIGNED for f in floors}
+        grouped: Dict[str, List[Location]] = defaultdict(list)
+        for location in locations:
+            grouped[floor_building.get(location.floor_id, UNASSIGNED)].append(location)
+        if building_id is not None:
+            grouped.setdefault(building_id, [])
+        indexes = {key: BuildingSearchIndex(key, docs) for key, docs in grouped.items()}
+        logger.info(f"Location search index loaded for {building_id or 'all buildings'}: {len(locations)} locations in {time.time() - start:.4f}s")
+
+        # Serve but don't keep the result if a write landed while we were reading
+        if generation == self._generation:
+            self._floor_building.update(floor_building)
+            self._indexes.update(indexes)
+            if building_id is None:
+                self._all_loaded = True
+        return indexes
+
+    async def get_indexes(self, building_id: Optional[str] = None) -> List[BuildingSearchIndex]:
+        if building_id is None and self._all_loaded:
+            return list(self._indexes.values())
+        if building_id is not None and building_id in self._indexes:
+            return [self._indexes[building_id]]
+
+        async with self._lock:
+            if building_id is None:
+                if self._all_loaded:
+                    return list(self._indexes.values())
+                return list((await self._load(None)).values())
+            index = self._indexes.get(building_id)
+            if index is None:
+                index = (await self._load(building_id)).get(building_id)
+            return [index] if index is not None else []
+
+    async def search(
+        self,
+        query: str,
+        building_id: Optional[str] = None,
+        floor_id: Optional[str] = None,
+        status_filter: Optional[str] = "active",
+        category: Optional[str] = None,
+        shape: Optional[str] = None,
+        exact_match: bool = False,
+    ) -> List[Tuple[Location, float]]:
+        """
+        Ranked (location, score) matches across the requested building, or all buildings.
+        """
+        if building_id is None and floor_id:
+            building_id = await self._building_for_floor(floor_id)
+            if building_id is None:
+                return []
+
+        category = category.lower() if category else None
+        matches: List[Tuple[Location, float]] = []
+        for index in await self.get_indexes(building_id):
+            for doc_id, score in index.search(query, exact_match).items():
+                location = index.docs[doc_id]
+                if floor_id and location.floor_id != floor_id:
+                    continue
+                if status_filter and status_filter != "all" and location.status != status_filter:
+                    continue
+                if category and category not in _field_values(location)["category"].lower():
+                    continue
+                if shape and getattr(location.shape, "value", location.shape) != shape:
+                    continue
+                matches.append((location, score))
+
+        matches.sort(key=lambda m: (-m[1], (m[0].name or "").lower()))
+        return matches
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        building_id: Optional[str] = None,
+        floor_id: Optional[str] = None,
+        k: int = 10,
+    ) -> List[Suggestion]:
+        """
+        Top-k name and category suggestions starting with `prefix` at any word.
+        """
+        if building_id is None and floor_id:
+            building_id = await self._building_for_floor(floor_id)
+            if building_id is None:
+                return []
+
+        suggestions: List[Suggestion] = []
+        for index in await self.get_indexes(building_id):
+            suggestions.extend(index.autocomplete(prefix, k, floor_id))
+        if building_id is None:
+            # Categories are counted per building, so merge them across buildings
+            merged: Dict[str, Suggestion] = {}
+            for suggestion in suggestions:
+                if suggestion.kind == "category" and suggestion.category in merged:
+                    current = merged[suggestion.category]
+                    merged[suggestion.category] = current._replace(weight=current.weight + suggestion.weight)
+                else:
+                    merged[suggestion.location_id or suggestion.category] = suggestion
+            suggestions = list(merged.values())
+        return heapq.nlargest(k, suggestions, key=lambda c: (c.weight, -len(c.label), c.label))
+
+    def invalidate_building(self, building_id: str) -> None:
+        self._generation += 1
+        self._all_loaded = False
+        self._indexes.pop(building_id, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._all_loaded = False
+        self._indexes.clear()
+        self._floor_building.clear()
+
+    async def _refresh_location(self, location_id: str) -> None:
+        for index in self._indexes.values():
+            index.remove(location_id)
+        location = await Location.find_one({"location_id": location_id})
+        if not location:
+            return
+        building_id = await self._building_for_floor(location.floor_id) or UNASSIGNED
+        index = self._indexes.get(building_id)
+        if index is None and self._all_loaded:
+            # A full load only indexes buildings that had locations, so this is the building's first
+            index = self._indexes[building_id] = BuildingSearchIndex(building_id)
+        if index is not None:
+            index.add(location)
+
+    async def on_map_change(self, change: MapChange) -> None:
+        if change.entity == "location" and change.entity_id:
+            self._generation += 1
+            await self._refresh_location(change.entity_id)
+            return
+
+        if change.entity not in ("location", "floor", "building"):
+            return
+
+        building_ids = {change.building_id} if change.building_id else set()
+        for floor_id in change.floor_ids:
+            building_ids.add(self._floor_building.get(floor_id, UNASSIGNED))
+            if change.entity in ("floor", "building"):
+                self._floor_building.pop(floor_id, None)
+        if change.entity in ("floor", "building"):
+            # A floor may have moved between buildings, so the unassigned bucket can change too
+            building_ids.add(UNASSIGNED)
+        for building_id in building_ids:
+            self.invalidate_building(building_id)
+
+
+# Create global instance
+location_search = LocationSearchEngine()
+register_map_listener(location_search.on_map_change)
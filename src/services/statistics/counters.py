@@ -0,0 +1,264 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import defaultdict
+from pymongo import ReturnDocument
+import asyncio
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Location, Floor, VerticalConnector, Path, MapCounters, CounterScope
+)
+from src.utility.mapStateModified import MapChange, register_map_listener
+
+logger = logging.getLogger(__name__)
+
+
+# A rebuild is retried this many times when increments keep landing while it counts
+REBUILD_ATTEMPTS = 3
+
+# An increment this soon after a rebuild may belong to a write the rebuild already counted;
+# the counters are rebuilt again on next read rather than risk counting it twice
+REBUILD_SETTLE_SECONDS = 2
+
+
+# What a document contributes to the counters: (floor_id, category, status) for locations,
+# (floor_id, status) for connectors and (building_id, floors, status) for paths
+LocationKey = Tuple[str, str, str]
+ConnectorKey = Tuple[str, str]
+PathKey = Tuple[Optional[str], Tuple[str, ...], str]
+
+
+def location_key(location: Optional[Location]) -> Optional[LocationKey]:
+    if location is None:
+        return None
+    category = location.category.value if hasattr(location.category, "value") else location.category
+    return location.floor_id, category, location.status
+
+
+def connector_key(connector: Optional[VerticalConnector]) -> Optional[ConnectorKey]:
+    if connector is None:
+        return None
+    return connector.floor_id, connector.status
+
+
+def path_key(path: Optional[Path]) -> Optional[PathKey]:
+    if path is None:
+        return None
+    return path.building_id, tuple(path.floors or []), path.status
+
+
+class MapCounterService:
+    """
+    Keeps one MapCounters document per building and per floor current with $inc from the write paths.
+    Callers pass the counter key of a document before and after their write; documents that have
+    never been counted (or were reset by a cascading change) are rebuilt from source on first read.
+    """
+
+    def __init__(self):
+        self._floor_building: Dict[str, Optional[str]] = {}
+
+    async def _building_of(self, floor_id: str) -> Optional[str]:
+        if floor_id not in self._floor_building:
+            floor = await Floor.find_one({"floor_id": floor_id})
+            self._floor_building[floor_id] = floor.building_id if floor else None
+        return self._floor_building[floor_id]
+
+    async def _apply(self, deltas: Dict[Tuple[str, str], Dict[str, int]]) -> None:
+        collection = MapCounters.get_motor_collection()
+        now = time.time()
+        updates = []
+        for (scope, scope_id), inc in deltas.items():
+            inc = {field: value for field, value in inc.items() if value}
+            if not inc or not scope_id:
+                continue
+            updates.append(collection.find_one_and_update(
+                {"scope": scope, "scope_id": scope_id},
+                {"$inc": {**inc, "seq": 1}, "$set": {"update_on": now}},
+                projection={"scope": 1, "scope_id": 1, "rebuilt_at": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            ))
+        if not updates:
+            return
+        try:
+            docs = await asyncio.gather(*updates)
+            unsettled = [doc for doc in docs if doc and (doc.get("rebuilt_at") or 0) > now - REBUILD_SETTLE_SECONDS]
+            if unsettled:
+                await self.reset(
+                    floor_ids=[doc["scope_id"] for doc in unsettled if doc["scope"] == CounterScope.FLOOR.value],
+                    building_ids=[doc["scope_id"] for doc in unsettled if doc["scope"] == CounterScope.BUILDING.value],
+                )
+        except Exception as e:
+            # Counters are derived data; a failed increment only forces a rebuild on next read
+            logger.error(f"Failed to update map counters: {str(e)}")
+            await self.reset(
+                floor_ids=[scope_id for scope, scope_id in deltas if scope == CounterScope.FLOOR.value],
+                building_ids=[scope_id for scope, scope_id in deltas if scope == CounterScope.BUILDING.value],
+            )
+
+    async def _floor_scopes(self, floor_id: str) -> List[Tuple[str, str]]:
+        scopes = [(CounterScope.FLOOR.value, floor_id)]
+        building_id = await self._building_of(floor_id)
+        if building_id:
+            scopes.append((CounterScope.BUILDING.value, building_id))
+        return scopes
+
+    async def location_changed(self, before: Optional[LocationKey], after: Optional[LocationKey]) -> None:
+        await self.locations_changed([(before, after)])
+
+    async def locations_changed(self, changes: Iterable[Tuple[Optional[LocationKey], Optional[LocationKey]]]) -> None:
+        """
+        Apply many location writes at once; all deltas are merged into one $inc per scope.
+        """
+        deltas: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for before, after in changes:
+            for key, sign in ((before, -1), (after, 1)):
+                if key is None:
+                    continue
+                floor_id, category, status = key
+                for scope in await self._floor_scopes(floor_id):
+                    deltas[scope][f"statuses.{status}"] += sign
+                    if status == "active":
+                        deltas[scope]["locations"] += sign
+                        deltas[scope][f"categories.{category}"] += sign
+        await self._apply(deltas)
+
+    async def connector_changed(self, before: Optional[ConnectorKey], after: Optional[ConnectorKey]) -> None:
+        await self.connectors_changed([(before, after)])
+
+    async def connectors_changed(self, changes: Iterable[Tuple[Optional[ConnectorKey], Optional[ConnectorKey]]]) -> None:
+        deltas: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for before, after in changes:
+            for key, sign in ((before, -1), (after, 1)):
+                if key is None or key[1] != "active":
+                    continue
+                for scope in await self._floor_scopes(key[0]):
+                    deltas[scope]["vertical_connectors"] += sign
+        await self._apply(deltas)
+
+    async def path_changed(self, before: Optional[PathKey], after: Optional[PathKey]) -> None:
+        await self.paths_changed([(before, after)])
+
+    async def paths_changed(self, changes: Iterable[Tuple[Optional[PathKey], Optional[PathKey]]]) -> None:
+        deltas: Dict[Tuple[str, str], Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        for before, after in changes:
+            for key, sign in ((before, -1), (after, 1)):
+                if key is None or key[2] != "active":
+                    continue
+                building_id, floors, _ = key
+                if building_id:
+                    deltas[(CounterScope.BUILDING.value, building_id)]["paths"] += sign
+                for floor_id in set(floors):
+                    deltas[(CounterScope.FLOOR.value, floor_id)]["paths"] += sign
+        await self._apply(deltas)
+
+    async def reset(self, floor_ids: Iterable[str] = (), building_ids: Iterable[str] = ()) -> None:
+        """
+        Mark counters for rebuild, for changes that touch too many documents to increment.
+        """
+        collection = MapCounters.get_motor_collection()
+        for scope, ids in ((CounterScope.FLOOR.value, floor_ids), (CounterScope.BUILDING.value, building_ids)):
+            ids = [i for i in dict.fromkeys(ids) if i]
+            if ids:
+                await collection.update_many(
+                    {"scope": scope, "scope_id": {"$in": ids}},
+                    {"$set": {"initialized": False, "update_on": time.time()}},
+                )
+
+    async def _count(self, scope: str, scope_id: str) -> MapCounters:
+        if scope == CounterScope.FLOOR.value:
+            floor_ids = [scope_id]
+            path_filter = {"floors": scope_id, "status": "active"}
+        else:
+            floors = await Floor.find({"building_id": scope_id}).to_list()
+            floor_ids = [f.floor_id for f in floors]
+            path_filter = {"building_id": scope_id, "status": "active"}
+
+        groups, connectors, paths = await asyncio.gather(
+            Location.aggregate([
+                {"$match": {"floor_id": {"$in": floor_ids}}},
+                {"$group": {"_id": {"status": "$status", "category": "$category"}, "count": {"$sum": 1}}},
+            ]).to_list(),
+            VerticalConnector.find({"floor_id": {"$in": floor_ids}, "status": "active"}).count(),
+            Path.find(path_filter).count(),
+        )
+
+        counters = MapCounters(scope=scope, scope_id=scope_id, vertical_connectors=connectors, paths=paths)
+        for group in groups:
+            status, category, count = group["_id"]["status"], group["_id"]["category"], group["count"]
+            counters.statuses[status] = counters.statuses.get(status, 0) + count
+            if status == "active":
+                counters.locations += count
+                counters.categories[category] = counters.categories.get(category, 0) + count
+        return counters
+
+    async def rebuild(self, scope: str, scope_id: str) -> MapCounters:
+        """
+        Recount from source documents. The result is only stored if no increment landed while
+        counting (the doc's seq is unchanged); otherwise the count is redone.
+        """
+        collection = MapCounters.get_motor_collection()
+        for _ in range(REBUILD_ATTEMPTS):
+            current = await collection.find_one({"scope": scope, "scope_id": scope_id}, {"seq": 1})
+            counters = await self._count(scope, scope_id)
+            counters.initialized = True
+            counters.rebuilt_at = counters.update_on = time.time()
+            fields = counters.model_dump(exclude={"id", "revision_id", "seq"}, mode="json")
+
+            if current is None:
+                result = await collection.update_one(
+                    {"scope": scope, "scope_id": scope_id},
+                    {"$setOnInsert": {**fields, "seq": 0}},
+                    upsert=True,
+                )
+                stored = result.upserted_id is not None
+            else:
+                counters.seq = current.get("seq", 0)
+                seq_filter = {"seq": counters.seq} if "seq" in current else {"seq": {"$exists": False}}
+                result = await collection.update_one(
+                    {"scope": scope, "scope_id": scope_id, **seq_filter},
+                    {"$set": fields},
+                )
+                stored = result.matched_count > 0
+            if stored:
+                return counters
+
+        # Increments kept landing; serve this count but leave the doc to be rebuilt on next read
+        logger.warning(f"Map counters for {scope} {scope_id} changed during {REBUILD_ATTEMPTS} rebuilds; not stored")
+        counters.initialized = False
+        return counters
+
+    async def get_counters(self, scope: str, scope_ids: List[str]) -> Dict[str, MapCounters]:
+        scope_ids = [i for i in dict.fromkeys(scope_ids) if i]
+        if not scope_ids:
+            return {}
+        docs = await MapCounters.find({"scope": scope, "scope_id": {"$in": scope_ids}}).to_list()
+        counters = {doc.scope_id: doc for doc in docs if doc.initialized}
+
+        missing = [i for i in scope_ids if i not in counters]
+        if missing:
+            rebuilt = await asyncio.gather(*(self.rebuild(scope, i) for i in missing))
+            counters.update({c.scope_id: c for c in rebuilt})
+        return counters
+
+    async def get_floor_counters(self, floor_ids: List[str]) -> Dict[str, MapCounters]:
+        return await self.get_counters(CounterScope.FLOOR.value, floor_ids)
+
+    async def get_building_counters(self, building_id: str) -> MapCounters:
+        return (await self.get_counters(CounterScope.BUILDING.value, [building_id]))[building_id]
+
+    async def on_map_change(self, change: MapChange) -> None:
+        # Floor/building writes cascade over many documents or move floors between buildings
+        if change.entity not in ("floor", "building"):
+            return
+        for floor_id in change.floor_ids:
+            self._floor_building.pop(floor_id, None)
+        await self.reset(
+            floor_ids=change.floor_ids,
+            building_ids=[change.building_id] if change.building_id else [],
+        )
+
+
+# Create global instance
+map_counters = MapCounterService()
+register_map_listener(map_counters.on_map_change)
@@ -0,0 +1,60 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from collections import defaultdict
+import logging
+
+from src.utility.mapStateModified import MapChange, register_map_listener
+
+logger = logging.getLogger(__name__)
+
+
+StatsKey = Tuple[str, Optional[str], bool]
+
+
+class StatsCache:
+    """
+    Computed dashboard statistics keyed by (entity, floor_id, include_deleted).
+    Writes to an entity drop its per-floor entries for the touched floors plus its all-floors entries.
+    """
+
+    def __init__(self):
+        self._entries: Dict[StatsKey, Any] = {}
+        self._generation: Dict[str, int] = defaultdict(int)
+
+    async def get_or_compute(
+        self,
+        entity: str,
+        floor_id: Optional[str],
+        include_deleted: bool,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = (entity, floor_id, bool(include_deleted))
+        if key in self._entries:
+            return self._entries[key]
+
+        generation = self._generation[entity]
+        value = await compute()
+        # Drop the result if a write landed while we were computing
+        if generation == self._generation[entity]:
+            self._entries[key] = value
+        return value
+
+    def invalidate(self, entity: str, floor_ids: Optional[list] = None) -> None:
+        self._generation[entity] += 1
+        for key in list(self._entries):
+            if key[0] != entity:
+                continue
+            if floor_ids is None or key[1] is None or key[1] in floor_ids:
+                del self._entries[key]
+
+    def on_map_change(self, change: MapChange) -> None:
+        if change.entity in ("floor", "building"):
+            # Cascading deletes change location status on every floor involved
+            self.invalidate("location")
+            self.invalidate(change.entity)
+            return
+        self.invalidate(change.entity, change.floor_ids or None)
+
+
+# Create global instance
+stats_cache = StatsCache()
+register_map_listener(stats_cache.on_map_change)
@@ -0,0 +1,237 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+from collections import defaultdict
+from pymongo import ReturnDocument
+import asyncio
+import time
+import logging
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Building, Floor, Location, VerticalConnector, Path, MapVersion, MapChangeEntry
+)
+from src.services.bundle.map_bundle import find_raw
+from src.services.realtime.pubsub import change_hub, building_topic
+from src.utility.mapStateModified import MapChange, register_map_journal
+
+logger = logging.getLogger(__name__)
+
+
+# Changes listing more IDs than this are journaled by floor; sync then returns those floors in full
+JOURNAL_MAX_IDS = 1000
+
+# Journal entries kept per building, trimmed every JOURNAL_TRIM_EVERY revisions
+JOURNAL_RETENTION = 10000
+JOURNAL_TRIM_EVERY = 100
+
+# Clients further behind than this get a reset and should download the bundle instead
+SYNC_MAX_CHANGES = 1000
+
+# A revision missing for longer than this was never journaled (its writer failed after the increment)
+JOURNAL_GAP_GRACE_SECONDS = 30
+
+# Change notifications pushed to screens list at most this many IDs; screens fetch the rest through sync
+PUSH_MAX_IDS = 50
+
+# entity -> (document, ID field, field matched against floor IDs, key in sync results)
+SYNC_ENTITIES = {
+    "location": (Location, "location_id", "floor_id", "locations"),
+    "vertical_connector": (VerticalConnector, "connector_id", "floor_id", "vertical_connectors"),
+    "path": (Path, "path_id", "floors", "paths"),
+    "floor": (Floor, "floor_id", "floor_id", "floors"),
+}
+
+
+class MapChangeLog:
+    """
+    Per-building map revisions and the journal of what changed at each one.
+    Every mapStateModify notification increments the building's MapVersion and appends a
+    MapChangeEntry with the new revision, so kiosks can fetch only what changed since theirs.
+    """
+
+    async def current_revision(self, building_id: str) -> int:
+        doc = await MapVersion.get_motor_collection().find_one({"building_id": building_id}, {"version": 1})
+        return doc["version"] if doc else 0
+
+    async def _buildings_of(self, floor_ids: List[str]) -> List[str]:
+        if not floor_ids:
+            return []
+        floors = await Floor.get_motor_collection().find(
+            {"floor_id": {"$in": floor_ids}}, {"building_id": 1}
+        ).to_list(length=None)
+        return [floor.get("building_id") for floor in floors]
+
+    async def record(self, building_id: str, change: MapChange) -> int:
+        now = time.time()
+        version = await MapVersion.get_motor_collection().find_one_and_update(
+            {"building_id": building_id},
+            {"$inc": {"version": 1}, "$set": {"update_on": now}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        revision = version["version"]
+
+        entity_ids = list(dict.fromkeys(([change.entity_id] if change.entity_id else []) + change.entity_ids))
+        entry = MapChangeEntry(
+            building_id=building_id,
+            revision=revision,
+            entity=change.entity,
+            entity_ids=entity_ids if len(entity_ids) <= JOURNAL_MAX_IDS else [],
+            floor_ids=change.floor_ids,
+            removed=change.removed,
+            datetime=now,
+        )
+        collection = MapChangeEntry.get_motor_collection()
+        await collection.insert_one(entry.model_dump(exclude={"id", "revision_id"}))
+        if revision % JOURNAL_TRIM_EVERY == 0:
+            await collection.delete_many({"building_id": building_id, "revision": {"$lte": revision - JOURNAL_RETENTION}})
+
+        await change_hub.publish(building_topic(building_id), {
+            "type": "map_change",
+            "building_id": building_id,
+            "revision": revision,
+            "entity": change.entity,
+            "entity_ids": entity_ids if len(entity_ids) <= PUSH_MAX_IDS else [],
+            "floor_ids": change.floor_ids,
+        })
+        return revision
+
+    async def on_map_change(self, change: MapChange) -> None:
+        building_ids = [change.building_id] if change.building_id else await self._buildings_of(change.floor_ids)
+        for building_id in dict.fromkeys(b for b in building_ids if b):
+            await self.record(building_id, change)
+
+    async def _entries_since(self, building_id: str, since: int, revision: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Journal entries after `since`, up to the first revision that is not journaled yet.
+        Returns None when a revision is missing for good and the client must reset.
+        """
+        entries = await find_raw(
+            MapChangeEntry,
+            {"building_id": building_id, "revision": {"$gt": since, "$lte": revision}},
+            sort=[("revision", 1)],
+        )
+        contiguous = []
+        for entry in entries:
+            if entry["revision"] != since + len(contiguous) + 1:
+                break
+            contiguous.append(entry)
+        if len(contiguous) == revision - since:
+            return contiguous
+
+        # A gap is normally an entry still being written; only a stale gap means it was lost
+        cutoff = time.time() - JOURNAL_GAP_GRACE_SECONDS
+        later = entries[len(contiguous):]
+        if later:
+            lost = any(entry["datetime"] < cutoff for entry in later)
+        else:
+            version = await MapVersion.get_motor_collection().find_one({"building_id": building_id}, {"update_on": 1})
+            lost = bool(version) and (version.get("update_on") or 0) < cutoff
+        return None if lost else contiguous
+
+    async def changes_since(self, building_id: str, since: int, published_only: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Entities upserted and deleted in a building after revision `since`, or None if the building
+        does not exist. `reset` is set when the client is too far behind (or its revision is unknown)
+        and should download the full bundle instead.
+        """
+        buildings, floors = await asyncio.gather(
+            find_raw(Building, {"building_id": building_id, "status": "active"}),
+            find_raw(Floor, {"building_id": building_id, "status": "active"}),
+        )
+        if not buildings:
+            return None
+
+        revision = await self.current_revision(building_id)
+        result: Dict[str, Any] = {
+            "building_id": building_id,
+            "since": since,
+            "revision": revision,
+            "reset": False,
+            "upserted": {"building": None, **{key: [] for *_, key in SYNC_ENTITIES.values()}},
+            "deleted": {key: [] for *_, key in SYNC_ENTITIES.values()},
+        }
+        if since == revision:
+            return result
+        if since <= 0 or since > revision or revision - since > SYNC_MAX_CHANGES:
+            result["reset"] = True
+            return result
+
+        entries = await self._entries_since(building_id, since, revision)
+        # Hard-deleted floors and buildings take their children with them without listing them, and
+        # hard deletes too large to journal by ID leave nothing behind to refetch
+        if entries is None or any(
+            e["removed"] and (e["entity"] in ("floor", "building") or not e["entity_ids"]) for e in entries
+        ):
+            result["reset"] = True
+            return result
+        result["revision"] = since + len(entries)
+
+        ids: Dict[str, Set[str]] = defaultdict(set)
+        full_floors: Dict[str, Set[str]] = defaultdict(set)
+        all_paths = False
+        for entry in entries:
+            entity = entry["entity"]
+            if entity in ("floor", "building"):
+                # Floor and building writes cascade or move floors; their floors are returned in full
+                if entity == "building":
+                    result["upserted"]["building"] = {k: v for k, v in buildings[0].items() if k != "floors"}
+                ids["floor"].update(entry["floor_ids"])
+                for kind in ("location", "vertical_connector", "path"):
+                    full_floors[kind].update(entry["floor_ids"])
+            elif entry["entity_ids"]:
+                ids[entity].update(entry["entity_ids"])
+            elif entity == "path" and not entry["floor_ids"]:
+                all_paths = True
+            else:
+                full_floors[entity].update(entry["floor_ids"])
+
+        async def fetch(entity: str) -> List[Dict[str, Any]]:
+            document, id_field, floor_field, _ = SYNC_ENTITIES[entity]
+            clauses = []
+            if ids[entity]:
+                clauses.append({id_field: {"$in": list(ids[entity])}})
+            if full_floors[entity]:
+                clauses.append({floor_field: {"$in": list(full_floors[entity])}})
+            if entity == "path" and all_paths:
+                clauses.append({"building_id": building_id})
+            if not clauses:
+                return []
+            return await find_raw(document, {"$or": clauses})
+
+        entities = list(SYNC_ENTITIES)
+        fetched = dict(zip(entities, await asyncio.gather(*(fetch(entity) for entity in entities))))
+
+        active_floors = {floor["floor_id"] for floor in floors}
+
+        def visible(entity: str, doc: Dict[str, Any]) -> bool:
+            if doc.get("status") != "active":
+                return False
+            if entity == "floor":
+                return doc.get("building_id") == building_id
+            if published_only and not doc.get("is_published", True):
+                return False
+            if entity == "path":
+                return doc.get("building_id") == building_id
+            return doc.get("floor_id") in active_floors
+
+        for entity, (_, id_field, _, key) in SYNC_ENTITIES.items():
+            seen: Set[str] = set()
+            for doc in fetched[entity]:
+                seen.add(doc[id_field])
+                if not visible(entity, doc):
+                    result["deleted"][key].append(doc[id_field])
+                elif entity == "floor":
+                    # Same shape as the bundle: floor fields without the child ID lists
+                    result["upserted"][key].append({
+                        k: v for k, v in doc.items() if k not in ("locations", "vertical_connectors", "paths")
+                    })
+                else:
+                    result["upserted"][key].append(doc)
+            # Requested but gone from the database: hard deleted
+            result["deleted"][key].extend(sorted(ids[entity] - seen))
+        return result
+
+
+# Create global instance
+map_change_log = MapChangeLog()
+# Journaled before the write returns: a revision queued on the bus could be lost with the process
+register_map_journal(map_change_log.on_map_change)
@@ -0,0 +1,113 @@
+from pydantic import BaseModel, Field, validator
+from typing import Any, Awaitable, Callable, List, Optional
+import inspect
+import logging
+from src.services.events.domain_events import domain_events
+
+logger = logging.getLogger(__name__)
+
+
+class MapChange(BaseModel):
+    entity: str = Field(..., description="Changed entity type: location, vertical_connector, path, floor or building")
+    entity_id: Optional[str] = Field(None, description="ID of the changed entity")
+    floor_ids: List[str] = Field(default_factory=list, description="Floors touched by the change")
+    building_id: Optional[str] = Field(None, description="Building touched by the change, when known")
+    entity_ids: List[str] = Field(default_factory=list, description="IDs of the changed entities, for changes covering many")
+    removed: bool = Field(False, description="Whether the changed documents were removed from the database")
+
+    @validator("floor_ids", "entity_ids", pre=True, always=True)
+    def drop_empty_and_duplicate_ids(cls, v):
+        return list(dict.fromkeys(i for i in (v or []) if i))
+
+
+# Typed map changes for writes that consumers may want to tell apart
+
+class PathPublished(MapChange):
+    entity: str = "path"
+    is_published: bool = Field(..., description="New publication state of the path")
+
+
+class LocationMoved(MapChange):
+    entity: str = "location"
+    from_floor_id: str = Field(..., description="Floor the location was on")
+    to_floor_id: str = Field(..., description="Floor the location is on now")
+
+
+class FloorDeleted(MapChange):
+    entity: str = "floor"
+
+
+# Listeners are in-process caches derived from map data (navigation graph, indexes, ...)
+_listeners: List[Callable[[MapChange], Any]] = []
+
+# Journals record changes durably and are awaited before the write returns (the sync change log)
+_journals: List[Callable[[MapChange], Awaitable[Any]]] = []
+
+
+def register_map_journal(journal: Callable[[MapChange], Awaitable[Any]]) -> None:
+    """
+    Register a journal awaited for every map change before its write returns, so a client that
+    reads right after the response sees the change recorded.
+    """
+    if journal not in _journals:
+        _journals.append(journal)
+
+
+def register_map_listener(listener: Callable[[MapChange], Any]) -> None:
+    """
+    Subscribe a listener to map changes. It runs on the domain event bus, off the request path;
+    identical changes queued together are delivered once.
+    """
+    if listener in _listeners:
+        return
+    _listeners.append(listener)
+
+    async def handle(changes: List[MapChange]) -> None:
+        seen = set()
+        for change in changes:
+            key = (type(change).__name__, change.model_dump_json())
+            if key in seen:
+                continue
+            seen.add(key)
+            try:
+                result = listener(change)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Map change listener failed for {change.entity} {change.entity_id}: {str(e)}")
+
+    domain_events.subscribe((MapChange,), handle, name=getattr(listener, "__qualname__", None))
+
+
+async def publishMapChange(change: MapChange) -> None:
+    """
+    Publish a map change (or one of its typed forms): journals are awaited, then every map
+    listener runs asynchronously. Failures are logged and never fail the write.
+    """
+    for journal in list(_journals):
+        try:
+            await journal(change)
+        except Exception as e:
+            logger.error(f"Map change journal failed for {change.entity} {change.entity_id}: {str(e)}")
+    await domain_events.publish(change)
+
+
+async def mapStateModify(
+    entity: str,
+    entity_id: Optional[str] = None,
+    floor_ids: Optional[List[str]] = None,
+    building_id: Optional[str] = None,
+    entity_ids: Optional[List[str]] = None,
+    removed: bool = False,
+) -> None:
+    """
+    Notify in-process map caches that a location, connector, path, floor or building was written.
+    """
+    await publishMapChange(MapChange(
+        entity=entity,
+        entity_id=entity_id,
+        floor_ids=floor_ids,
+        building_id=building_id,
+        entity_ids=entity_ids,
+        removed=removed,
+    ))
@@ -0,0 +1,56 @@
+import asyncio
+from types import SimpleNamespace
+
+from src.services.search import location_search as search_module
+from src.services.search.location_search import LocationSearchEngine
+from src.utility.mapStateModified import MapChange
+
+
+class _Query:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self):
+        return list(self.docs)
+
+
+class _Collection:
+    """Stands in for a Beanie document class, matching on equality of the filter's fields"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find_all(self):
+        return _Query(self.docs)
+
+    async def find_one(self, query):
+        for doc in self.docs:
+            if all(getattr(doc, field) == value for field, value in query.items()):
+                return doc
+        return None
+
+
+def _location(location_id, name, floor_id):
+    return SimpleNamespace(
+        location_id=location_id, name=name, category="shop", description=None,
+        floor_id=floor_id, status="active", shape="circle",
+    )
+
+
+def test_first_location_in_building_appears_in_unscoped_search(monkeypatch):
+    floors = [SimpleNamespace(floor_id="f1", building_id="b1"), SimpleNamespace(floor_id="f2", building_id="b2")]
+    locations = [_location("l1", "Bookstore", "f1")]
+    monkeypatch.setattr(search_module, "Floor", _Collection(floors))
+    monkeypatch.setattr(search_module, "Location", _Collection(locations))
+
+    async def scenario():
+        engine = LocationSearchEngine()
+        assert [l.location_id for l, _ in await engine.search("book")] == ["l1"]
+
+        # b2 had no locations when everything was loaded
+        locations.append(_location("l2", "Book Corner", "f2"))
+        await engine.on_map_change(MapChange(entity="location", entity_id="l2", floor_ids=["f2"]))
+
+        return sorted(l.location_id for l, _ in await engine.search("book"))
+
+    assert asyncio.run(scenario()) == ["l1", "l2"]
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from beanie import init_beanie
+
+from src.datamodel.database.domain.DigitalSignage import (
+    Building, Floor, Location, VerticalConnector, Path, MapVersion, MapChangeEntry
+)
+from src.services.sync.change_log import JOURNAL_MAX_IDS, MapChangeLog
+from src.utility.mapStateModified import MapChange
+
+
+async def _init():
+    client = mongomock_motor.AsyncMongoMockClient()
+    await init_beanie(
+        database=client["change_log"],
+        document_models=[Building, Floor, Location, VerticalConnector, Path, MapVersion, MapChangeEntry],
+    )
+
+
+def test_hard_delete_beyond_journal_limit_resets_sync():
+    async def scenario():
+        await _init()
+        change_log = MapChangeLog()
+        building = Building(name="B")
+        await building.insert()
+        floor = Floor(name="F1", floor_number=1, building_id=building.building_id)
+        await floor.insert()
+        locations = [
+            Location(name=f"L{i}", floor_id=floor.floor_id, category="store", shape="circle", x=i, y=0, radius=1)
+            for i in range(JOURNAL_MAX_IDS + 1)
+        ]
+        await Location.insert_many(locations)
+        location_ids = [location.location_id for location in locations]
+        await change_log.on_map_change(MapChange(entity="location", entity_ids=location_ids, floor_ids=[floor.floor_id]))
+        since = await change_log.current_revision(building.building_id)
+
+        await Location.find({"floor_id": floor.floor_id}).delete()
+        await change_log.on_map_change(MapChange(
+            entity="location", entity_ids=location_ids, floor_ids=[floor.floor_id], removed=True,
+        ))
+        return await change_log.changes_since(building.building_id, since)
+
+    result = asyncio.run(scenario())
+    assert result["reset"] is True